@@ -3,6 +3,9 @@
 第三版音频提取脚本
 从Sequential Agent V3的JSON输出文件中提取和保存音频段
 直接处理PCM音频数据，不依赖外部工具
+
+音频段只携带引用（saved_file 路径、cache_key、pcm_sha256、字节数、时长），
+按 saved_file → TTS缓存(cache_key) → 旧版base64 audio_data 的顺序读取PCM
 """
 
 import json
@@ -12,6 +15,8 @@ import struct
 import wave
 from datetime import datetime
 
+TTS_CACHE_DIR = os.path.join("data", "tts_cache")
+
 def analyze_audio_data(audio_data):
     """
     分析音频数据特征
@@ -108,6 +113,31 @@ def try_different_formats(audio_data, base_output_path):
     
     return None
 
+def load_segment_audio(segment):
+    """
+    按引用读取音频段的PCM数据，返回 (pcm, sample_rate, 来源) 或 None
+    """
+    saved_file = segment.get('saved_file')
+    if saved_file and os.path.exists(saved_file):
+        try:
+            with wave.open(saved_file, 'rb') as wav_file:
+                return wav_file.readframes(wav_file.getnframes()), wav_file.getframerate(), 'saved_file'
+        except (wave.Error, EOFError) as e:
+            print(f"  ⚠️  无法读取WAV文件 {saved_file}: {e}")
+    
+    cache_key = segment.get('cache_key')
+    cache_path = os.path.join(TTS_CACHE_DIR, f"{cache_key}.pcm") if cache_key else None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return f.read(), segment.get('sample_rate', 24000), 'tts_cache'
+    
+    # 旧版输出：音频以base64内嵌在JSON中
+    audio_data_b64 = segment.get('audio_data', '')
+    if audio_data_b64:
+        return base64.b64decode(audio_data_b64), segment.get('sample_rate', 22050), 'base64'
+    
+    return None
+
 def extract_audio_from_json_v3(json_file_path, output_dir=None):
     """
     第三版音频提取函数
@@ -152,17 +182,17 @@ def extract_audio_from_json_v3(json_file_path, output_dir=None):
         voice_style = segment.get('voice_style', 'unknown')
         voice_name = segment.get('voice_name', 'unknown')
         timestamp = segment.get('timestamp', '000000')
-        audio_data_b64 = segment.get('audio_data', '')
-        
-        if not audio_data_b64:
-            print(f"  ❌ 音频段 {i} 没有音频数据")
-            continue
         
         try:
-            # 解码base64数据
-            audio_data = base64.b64decode(audio_data_b64)
+            # 按引用读取音频数据
+            loaded = load_segment_audio(segment)
+            if loaded is None:
+                print(f"  ❌ 音频段 {i} 没有音频数据")
+                continue
+            audio_data, sample_rate, source = loaded
             
             print(f"  📊 数据信息:")
+            print(f"    - 来源: {source}")
             print(f"    - 原始大小: {len(audio_data):,} 字节")
             print(f"    - 前16字节: {audio_data[:16].hex()}")
             
@@ -175,7 +205,7 @@ def extract_audio_from_json_v3(json_file_path, output_dir=None):
             successful_path = None
             
             # 首先尝试默认格式
-            if create_wav_file(audio_data, base_output_path):
+            if create_wav_file(audio_data, base_output_path, sample_rate=sample_rate):
                 successful_path = base_output_path
             else:
                 # 如果失败，尝试不同的格式
@@ -193,7 +223,9 @@ def extract_audio_from_json_v3(json_file_path, output_dir=None):
                     "timestamp": timestamp,
                     "format": "wav_pcm",
                     "size": os.path.getsize(successful_path),
-                    "original_size": len(audio_data)
+                    "original_size": len(audio_data),
+                    "sample_rate": sample_rate,
+                    "source": source
                 }
                 file_info_list.append(file_info)
                 extracted_count += 1
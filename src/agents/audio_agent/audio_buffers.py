@@ -0,0 +1,86 @@
+"""
+Audio Buffers - synthesized audio travels by reference, raw PCM stays in process
+
+Result dicts carry only a reference (saved WAV path, TTS cache key, PCM sha256,
+byte length, duration). Consumers that need the samples (the WebSocket broadcast) take them
+from this registry as a memoryview over the buffer the TTS call returned, so
+the PCM is never base64-encoded into results or copied between stages.
+"""
+
+import hashlib
+import threading
+import wave
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Union
+
+PCM_SAMPLE_RATE = 24000  # Gemini TTS output: 24kHz, 16-bit, mono
+PCM_SAMPLE_WIDTH = 2
+PCM_CHANNELS = 1
+WAV_HEADER_BYTES = 44  # Canonical RIFF header written by _generate_simple_wav_audio
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def pcm_duration_seconds(num_bytes: int, sample_rate: int = PCM_SAMPLE_RATE) -> float:
+    return round(num_bytes / (sample_rate * PCM_SAMPLE_WIDTH * PCM_CHANNELS), 3)
+
+
+def audio_reference(pcm: BytesLike, saved_file: Optional[str], cache_key: Optional[str] = None,
+                    sample_rate: int = PCM_SAMPLE_RATE) -> Dict[str, Any]:
+    """
+    The fields a result carries in place of the audio bytes.
+    cache_key names data/tts_cache/<cache_key>.pcm (None when the audio was not cached);
+    pcm_sha256 identifies the samples themselves.
+    """
+    return {
+        "saved_file": saved_file,
+        "cache_key": cache_key,
+        "pcm_sha256": hashlib.sha256(pcm).hexdigest(),
+        "audio_size": len(pcm),
+        "duration_seconds": pcm_duration_seconds(len(pcm), sample_rate),
+        "sample_rate": sample_rate,
+        "audio_format": "pcm_s16le"
+    }
+
+
+def read_wav_pcm(path: str) -> Optional[memoryview]:
+    """PCM frames of a saved WAV file (used when the in-memory buffer is gone)"""
+    try:
+        with wave.open(path, 'rb') as wav_file:
+            return memoryview(wav_file.readframes(wav_file.getnframes()))
+    except (OSError, wave.Error, EOFError):
+        return None
+
+
+class AudioBufferRegistry:
+    """Recent PCM buffers keyed by audio_id; bounded so unclaimed buffers cannot pile up"""
+
+    def __init__(self, max_buffers: int = 64):
+        self.max_buffers = max_buffers
+        self._lock = threading.Lock()
+        self._buffers: "OrderedDict[str, memoryview]" = OrderedDict()
+
+    def put(self, audio_id: str, pcm: BytesLike):
+        view = pcm if isinstance(pcm, memoryview) else memoryview(pcm)
+        with self._lock:
+            self._buffers[audio_id] = view
+            self._buffers.move_to_end(audio_id)
+            while len(self._buffers) > self.max_buffers:
+                self._buffers.popitem(last=False)
+
+    def take(self, audio_id: str) -> Optional[memoryview]:
+        """Hand the buffer to its one consumer and forget it"""
+        with self._lock:
+            return self._buffers.pop(audio_id, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buffers)
+
+
+_registry = AudioBufferRegistry()
+
+
+def get_audio_buffers() -> AudioBufferRegistry:
+    """Process-wide PCM buffer registry"""
+    return _registry
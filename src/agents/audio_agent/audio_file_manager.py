@@ -119,6 +119,14 @@ class AudioFileManager:
             
             return filename, counter
     
+    def release_filename(self, game_id: str, filename: str):
+        """释放预留但最终未写入的文件名（并发合成失败时），使清单只包含实际文件"""
+        with self._lock:
+            game_seq = self._game_sequences.get(game_id)
+            if not game_seq:
+                return
+            game_seq['files_created'] = [f for f in game_seq['files_created'] if f['filename'] != filename]
+    
     def get_game_sequence_info(self, game_id: str) -> Dict:
         """获取游戏的序列信息"""
         with self._lock:
@@ -222,6 +230,11 @@ def generate_unique_audio_filename(
     )
 
 
+def release_audio_filename(game_id: str, filename: str):
+    """释放预留的文件名 - 便捷函数"""
+    audio_file_manager.release_filename(game_id, filename)
+
+
 def save_audio_files_manifest_for_game(game_id: str) -> str:
     """保存游戏的音频文件清单 - 便捷函数"""
     return audio_file_manager.save_manifest(game_id)
@@ -0,0 +1,75 @@
+"""
+PCM Stream - binary framing for audio sent to WebSocket clients
+
+Each segment goes out as one JSON "audio_stream_start" message (text, voice,
+sample rate, sizes) followed by binary frames of raw 16-bit PCM:
+
+    magic "NHLA" | version u8 | flags u8 | sequence u32 | audio_id 8 bytes | PCM
+
+All integers are big-endian. Frames hold 100ms of audio, so a client can start
+playback as soon as the first frame arrives. Frames are built once per segment
+and the same bytes objects are sent to every client.
+"""
+
+import struct
+from typing import Dict, Any, List
+
+from .audio_buffers import PCM_SAMPLE_RATE, PCM_SAMPLE_WIDTH, PCM_CHANNELS, BytesLike, pcm_duration_seconds
+
+FRAME_MAGIC = b"NHLA"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("!4sBBI8s")  # 18 bytes
+
+FLAG_FIRST = 0x01
+FLAG_LAST = 0x02
+
+DEFAULT_CHUNK_BYTES = PCM_SAMPLE_RATE * PCM_SAMPLE_WIDTH * PCM_CHANNELS // 10  # 100ms
+
+
+def encode_pcm_frames(audio_id: str, pcm: BytesLike, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[bytes]:
+    """Split PCM into header-prefixed binary frames (the only copy made of the samples)"""
+    view = pcm if isinstance(pcm, memoryview) else memoryview(pcm)
+    chunk_bytes -= chunk_bytes % PCM_SAMPLE_WIDTH  # Never split a sample across frames
+    audio_id_bytes = audio_id.encode("ascii", "replace")[:8].ljust(8, b"\0")
+    offsets = range(0, len(view), chunk_bytes) if len(view) else [0]
+
+    frames = []
+    for sequence, offset in enumerate(offsets):
+        flags = FLAG_FIRST if sequence == 0 else 0
+        if offset + chunk_bytes >= len(view):
+            flags |= FLAG_LAST
+        header = FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, flags, sequence, audio_id_bytes)
+        frames.append(header + view[offset:offset + chunk_bytes])
+    return frames
+
+
+def decode_pcm_frame(frame: bytes) -> Dict[str, Any]:
+    """Inverse of encode_pcm_frames for one frame (Python clients and debugging)"""
+    magic, version, flags, sequence, audio_id = FRAME_HEADER.unpack_from(frame)
+    if magic != FRAME_MAGIC:
+        raise ValueError("Not an NHL audio frame")
+    return {
+        "version": version,
+        "audio_id": audio_id.rstrip(b"\0").decode("ascii"),
+        "sequence": sequence,
+        "first": bool(flags & FLAG_FIRST),
+        "last": bool(flags & FLAG_LAST),
+        "pcm": memoryview(frame)[FRAME_HEADER.size:]
+    }
+
+
+def stream_start_message(metadata: Dict[str, Any], pcm: BytesLike, frame_count: int,
+                         chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Dict[str, Any]:
+    """JSON message announcing a segment's binary frames"""
+    return dict(
+        metadata,
+        type="audio_stream_start",
+        format="pcm_s16le",
+        sample_rate=PCM_SAMPLE_RATE,
+        channels=PCM_CHANNELS,
+        total_bytes=len(pcm),
+        duration_seconds=pcm_duration_seconds(len(pcm)),
+        frame_count=frame_count,
+        frame_bytes=chunk_bytes,
+        frame_header_bytes=FRAME_HEADER.size
+    )
@@ -19,6 +19,11 @@ import logging
 # Add project root directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
+from .tts_engine import get_tts_engine, get_tts_metrics
+from .tts_cache import get_tts_cache, tts_cache_key, normalize_tts_text
+from .audio_buffers import get_audio_buffers, audio_reference, read_wav_pcm, WAV_HEADER_BYTES
+from .pcm_stream import encode_pcm_frames, stream_start_message
+
 # Import configuration
 try:
     from config import get_gemini_api_key, get_audio_config, set_gemini_api_key
@@ -41,6 +46,7 @@ class AudioProcessor:
     def __init__(self):
         # No longer uses any Google Cloud TTS related code
         self.connected_clients: Set = set()
+        self.client_queues: Dict[Any, asyncio.Queue] = {}  # Per-client outgoing messages, shared payloads
         self.audio_queue = asyncio.Queue()
         
         # Get settings from configuration file
@@ -55,6 +61,9 @@ class AudioProcessor:
 # Global audio processor instance
 audio_processor = AudioProcessor()
 
+# Outgoing messages a client may have queued (~60s of 100ms frames) before it misses segments
+MAX_PENDING_CLIENT_MESSAGES = 600
+
 
 async def text_to_speech(
     tool_context: Optional[ToolContext] = None,
@@ -81,6 +90,35 @@ async def text_to_speech(
     Returns:
         Dictionary containing audio information and status
     """
+    return await synthesize_speech(
+        tool_context=tool_context, text=text, voice_style=voice_style, language=language,
+        speaker=speaker, emotion=emotion, game_id=game_id, game_timestamp=game_timestamp,
+        segment_index=segment_index
+    )
+
+
+async def synthesize_speech(
+    tool_context: Optional[ToolContext] = None,
+    text: str = "", 
+    voice_style: str = "enthusiastic",
+    language: str = "en-US",
+    speaker: str = "",
+    emotion: str = "",
+    game_id: str = "",
+    game_timestamp: str = "",
+    segment_index: int = -1,
+    audio_filename: str = "",
+    audio_id: str = "",
+    broadcast: bool = True
+) -> Dict[str, Any]:
+    """
+    text_to_speech for in-process callers that run several segments concurrently.
+    
+    Extra args (not exposed to the LLM tool):
+        audio_filename: File name reserved in advance with the AudioFileManager
+        audio_id: Audio id that goes with the reserved name
+        broadcast: False when the caller broadcasts results itself, in segment order
+    """
     try:
         print(f"🎙️ Gemini TTS: Starting conversion - {text[:50]}...")
         
@@ -106,51 +144,49 @@ async def text_to_speech(
         
         # Try using real Gemini TTS
         try:
-            from google import genai
-            from google.genai import types
+            from google import genai  # noqa: F401  (ImportError below if google-genai is missing)
             
-            # Create client
-            client = genai.Client(api_key=api_key)
+            # Long-lived client and TTS thread pool, shared by all calls
+            engine = get_tts_engine(api_key)
             
             # Select voice based on speaker and emotion/voice_style
             voice_name = _select_voice_for_speaker(speaker, emotion or voice_style)
             
             # Build prompt based on emotion or voice_style
             effective_style = emotion or voice_style
-            prompt = _build_prompt_for_emotion(text, effective_style, speaker)
+            prompt = _build_prompt_for_emotion(normalize_tts_text(text), effective_style, speaker)
             
             print(f"🔊 Using voice: {voice_name}, style: {voice_style}")
             
-            # Call Gemini TTS API
-            response = client.models.generate_content(
-                model="gemini-2.5-flash-preview-tts",
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["AUDIO"],
-                    speech_config=types.SpeechConfig(
-                        voice_config=types.VoiceConfig(
-                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                voice_name=voice_name
-                            )
-                        )
-                    )
-                )
-            )
+            # Identical line, voice, style and model: reuse the audio instead of calling the API.
+            # Cache and file I/O run on the engine's I/O executor (never queued behind TTS calls)
+            # so a cold disk does not stall the event loop
+            tts_cache = get_tts_cache()
+            cache_key = tts_cache_key(text, voice_name, prompt, engine.model)
+            audio_data = await engine.run_blocking(tts_cache.get, cache_key)
+            cache_hit = audio_data is not None
             
-            # Get audio data
-            audio_data = response.candidates[0].content.parts[0].inline_data.data
+            if cache_hit:
+                print(f"♻️ TTS cache hit ({cache_key[:12]})")
+            else:
+                # Call Gemini TTS API on the engine's executor (never blocks the event loop)
+                audio_data = await engine.synthesize(prompt, voice_name)
+                await engine.run_blocking(tts_cache.put, cache_key, audio_data)
             
             # Generate audio ID
-            audio_id = str(uuid.uuid4())[:8]
+            audio_id = audio_id or str(uuid.uuid4())[:8]
             timestamp = datetime.now().strftime("%H%M%S")
             
             print(f"✅ Real Gemini TTS successful! Size: {len(audio_data):,} bytes")
             
             # Save audio to file as proper WAV format
-            saved_file_path = _save_audio_to_file(audio_data, audio_id, timestamp, voice_style, speaker, game_id, game_timestamp, segment_index)
+            saved_file_path = await engine.run_blocking(
+                _save_audio_to_file, audio_data, audio_id, timestamp, voice_style, speaker,
+                game_id, game_timestamp, segment_index, audio_filename
+            )
             
-            # Encode audio data
-            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
+            # Results reference the audio (file, cache key, size, duration) instead of carrying it
+            audio_ref = audio_reference(audio_data, saved_file_path, cache_key)
             
             # Prepare WebSocket broadcast data
             broadcast_data = {
@@ -160,15 +196,16 @@ async def text_to_speech(
                 "voice_style": voice_style,
                 "voice_name": voice_name,
                 "timestamp": timestamp,
-                "audio_data": audio_base64,
-                "format": "wav",
                 "model": "gemini-2.5-flash-preview-tts",
                 "is_real_tts": True,
                 "api_key_status": "configured"
             }
             
-            # Broadcast audio
-            asyncio.create_task(_broadcast_audio(broadcast_data))
+            # Broadcast audio, or park the PCM until the caller broadcasts in segment order
+            if broadcast:
+                asyncio.create_task(_broadcast_audio(broadcast_data, audio_data))
+            else:
+                get_audio_buffers().put(audio_id, audio_data)
             
             # Update tool context
             if tool_context:
@@ -203,9 +240,8 @@ async def text_to_speech(
                 "timestamp": timestamp,
                 "model": "gemini-2.5-flash-preview-tts",
                 "is_real_tts": True,
-                "audio_size": len(audio_data),
-                "audio_data": audio_base64,  # Return audio data directly
-                "saved_file": saved_file_path,  # File path where audio was saved
+                **audio_ref,  # saved_file, cache_key, pcm_sha256, audio_size, duration_seconds
+                "cache_hit": cache_hit,
                 "message": f"Real Gemini TTS audio generation successful, ID: {audio_id}"
             }
             
@@ -232,7 +268,7 @@ async def text_to_speech(
             print(f"❌ {error_msg}")
             
             # Try fallback audio generation
-            fallback_result = await _generate_fallback_audio(text, voice_style, tool_context)
+            fallback_result = await _generate_fallback_audio(text, voice_style, tool_context, broadcast)
             return fallback_result
             
     except Exception as e:
@@ -254,7 +290,8 @@ async def text_to_speech(
         }
 
 
-async def _generate_fallback_audio(text: str, voice_style: str, tool_context: Optional[ToolContext]) -> Dict[str, Any]:
+async def _generate_fallback_audio(text: str, voice_style: str, tool_context: Optional[ToolContext],
+                                   broadcast: bool = True) -> Dict[str, Any]:
     """
     Generate fallback audio when Gemini TTS is unavailable
     
@@ -271,7 +308,7 @@ async def _generate_fallback_audio(text: str, voice_style: str, tool_context: Op
         
         # Generate mock realistic audio
         audio_bytes = _generate_realistic_mock_audio(text, voice_style)
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+        pcm = memoryview(audio_bytes)[WAV_HEADER_BYTES:]  # Samples without the WAV header, no copy
         
         # Generate audio ID
         audio_id = str(uuid.uuid4())[:8]
@@ -281,6 +318,7 @@ async def _generate_fallback_audio(text: str, voice_style: str, tool_context: Op
         
         # Save fallback audio to file (it's already in WAV format)
         saved_file_path = _save_fallback_audio_to_file(audio_bytes, audio_id, timestamp, voice_style)
+        audio_ref = audio_reference(pcm, saved_file_path)  # Mock audio is never cached
         
         # Prepare WebSocket broadcast data
         broadcast_data = {
@@ -290,15 +328,16 @@ async def _generate_fallback_audio(text: str, voice_style: str, tool_context: Op
             "voice_style": voice_style,
             "voice_name": "mock_voice",
             "timestamp": timestamp,
-            "audio_data": audio_base64,
-            "format": "wav",
             "model": "fallback-mock",
             "is_real_tts": False,
             "api_key_status": "fallback"
         }
         
         # Broadcast audio
-        asyncio.create_task(_broadcast_audio(broadcast_data))
+        if broadcast:
+            asyncio.create_task(_broadcast_audio(broadcast_data, pcm))
+        else:
+            get_audio_buffers().put(audio_id, pcm)
         
         # Update tool context
         if tool_context:
@@ -333,9 +372,7 @@ async def _generate_fallback_audio(text: str, voice_style: str, tool_context: Op
             "timestamp": timestamp,
             "model": "fallback-mock",
             "is_real_tts": False,
-            "audio_size": len(audio_bytes),
-            "audio_data": audio_base64,
-            "saved_file": saved_file_path,  # File path where audio was saved
+            **audio_ref,
             "message": f"Fallback audio generation successful, ID: {audio_id}"
         }
         
@@ -438,6 +475,8 @@ def get_audio_status(tool_context: Optional[ToolContext]) -> Dict[str, Any]:
             "audio_queue_size": queue_size,
             "audio_history_count": len(audio_history),
             "processor_model": audio_processor.gemini_model,
+            "tts_engine": get_tts_metrics(),
+            "tts_cache": get_tts_cache().stats(),
             "last_generated": audio_history[-1] if audio_history else None,
             "timestamp": datetime.now().isoformat()
         }
@@ -483,37 +522,71 @@ def _get_pitch(style: str) -> float:
     return {"enthusiastic": 1.1, "dramatic": 0.8, "calm": 1.0}.get(style, 1.0)
 
 
-async def _broadcast_audio(data: Dict[str, Any]):
+def broadcast_speech_result(result: Dict[str, Any], text: str):
+    """Broadcast a synthesize_speech(broadcast=False) result; callers use this to keep segment order"""
+    if result.get("status") != "success":
+        return
+    pcm = get_audio_buffers().take(result.get("audio_id"))
+    if not audio_processor.connected_clients:
+        return
+    if pcm is None and result.get("saved_file"):
+        pcm = read_wav_pcm(result["saved_file"])
+    if pcm is None:
+        return
+    asyncio.create_task(_broadcast_audio({
+        "type": "audio_stream",
+        "audio_id": result.get("audio_id"),
+        "text": text,
+        "voice_style": result.get("voice_style"),
+        "voice_name": result.get("voice_name"),
+        "timestamp": result.get("timestamp"),
+        "model": result.get("model"),
+        "is_real_tts": result.get("is_real_tts", False),
+        "api_key_status": "configured" if result.get("is_real_tts") else "fallback"
+    }, pcm))
+
+
+async def _broadcast_audio(data: Dict[str, Any], pcm=None):
     """
     Broadcast audio data to all connected WebSocket clients
     
+    A JSON "audio_stream_start" message is followed by binary 100ms PCM frames
+    (see pcm_stream). Frames are encoded once and the same objects are queued
+    for every client; each client's writer task sends them in order.
+    
     Args:
-        data: Audio data to broadcast
+        data: Audio metadata to broadcast
+        pcm: Raw 24kHz 16-bit mono PCM
     """
-    if not audio_processor.connected_clients:
+    if not audio_processor.client_queues:
         print("📢 No WebSocket clients connected, skipping broadcast")
         return
     
-    message = json.dumps(data)
-    disconnected_clients = []
-    
-    print(f"📢 Broadcasting audio to {len(audio_processor.connected_clients)} clients")
-    
-    for client in audio_processor.connected_clients:
-        try:
-            await client.send(message)
-        except websockets.exceptions.ConnectionClosed:
-            disconnected_clients.append(client)
-        except Exception as e:
-            print(f"❌ Error broadcasting to client: {e}")
-            disconnected_clients.append(client)
+    if pcm is None:
+        messages = [json.dumps(data)]
+    else:
+        frames = encode_pcm_frames(data.get("audio_id") or "", pcm)
+        messages = [json.dumps(stream_start_message(data, pcm, len(frames)))] + frames
     
-    # Clean up disconnected clients
-    for client in disconnected_clients:
-        audio_processor.connected_clients.discard(client)
+    print(f"📢 Broadcasting audio to {len(audio_processor.client_queues)} clients ({len(messages)} messages)")
     
-    if disconnected_clients:
-        print(f"🧹 Cleaned up {len(disconnected_clients)} disconnected clients")
+    for client, queue in list(audio_processor.client_queues.items()):
+        if queue.maxsize - queue.qsize() < len(messages):
+            # Never queue part of a segment; a client this far behind skips it
+            print(f"⚠️ Client {client.remote_address} is {queue.qsize()} messages behind, skipping segment")
+            continue
+        for message in messages:
+            queue.put_nowait(message)
+
+
+async def _client_writer(websocket, queue: asyncio.Queue):
+    """Send one client's queued messages in order; a slow client never delays the others"""
+    try:
+        while True:
+            message = await queue.get()
+            await websocket.send(message)
+    except websockets.exceptions.ConnectionClosed:
+        pass  # The connection handler cleans up
 
 
 async def _start_websocket_server(host: str, port: int):
@@ -524,6 +597,8 @@ async def _start_websocket_server(host: str, port: int):
         print(f"🔗 New WebSocket client connected: {client_addr}")
         
         audio_processor.connected_clients.add(websocket)
+        queue = asyncio.Queue(maxsize=MAX_PENDING_CLIENT_MESSAGES)
+        writer = None
         
         try:
             # Send welcome message
@@ -536,6 +611,10 @@ async def _start_websocket_server(host: str, port: int):
             }
             await websocket.send(json.dumps(welcome_msg))
             
+            # Audio broadcasts start reaching this client once its writer runs
+            writer = asyncio.create_task(_client_writer(websocket, queue))
+            audio_processor.client_queues[websocket] = queue
+            
             # Listen for client messages
             async for message in websocket:
                 try:
@@ -551,7 +630,10 @@ async def _start_websocket_server(host: str, port: int):
         except Exception as e:
             print(f"❌ Client connection error {client_addr}: {e}")
         finally:
+            audio_processor.client_queues.pop(websocket, None)
             audio_processor.connected_clients.discard(websocket)
+            if writer is not None:
+                writer.cancel()
             print(f"🧹 Cleaned up client: {client_addr}")
     
     try:
@@ -696,18 +778,12 @@ def _save_audio_to_file(audio_data: bytes, audio_id: str, timestamp: str, voice_
         
         # Create proper WAV file from raw audio data
         # Gemini TTS typically outputs 24kHz, 16-bit, mono audio
-        output = io.BytesIO()
-        
-        with wave.open(output, 'wb') as wav_file:
+        with wave.open(filepath, 'wb') as wav_file:
             wav_file.setnchannels(1)        # Mono
             wav_file.setsampwidth(2)        # 16-bit (2 bytes)
             wav_file.setframerate(24000)    # 24kHz sample rate
             wav_file.writeframes(audio_data)
         
-        # Save to file
-        with open(filepath, 'wb') as f:
-            f.write(output.getvalue())
-        
         print(f"💾 Audio saved to: {filepath}")
         
         return filepath
@@ -891,7 +967,7 @@ def _build_prompt_for_emotion(text: str, emotion_or_style: str, speaker: str) ->
     return emotion_prompts.get(emotion_or_style.lower(), f"{speaker_context}say clearly: {text}")
 
 
-def _save_audio_to_file(audio_data: bytes, audio_id: str, timestamp: str, voice_style: str, speaker: str, game_id: str, game_timestamp: str, segment_index: int) -> str:
+def _save_audio_to_file(audio_data: bytes, audio_id: str, timestamp: str, voice_style: str, speaker: str, game_id: str, game_timestamp: str, segment_index: int, audio_filename: str = "") -> str:
     """
     Save raw audio data as a proper WAV file with speaker info
     使用新的文件管理器确保文件名唯一性
@@ -905,6 +981,7 @@ def _save_audio_to_file(audio_data: bytes, audio_id: str, timestamp: str, voice_
         game_id: NHL game ID (optional)
         game_timestamp: Game timestamp like "1_00_05" (optional)
         segment_index: Segment index (optional)
+        audio_filename: Name reserved earlier with the audio file manager (optional)
         
     Returns:
         Path to the saved WAV file
@@ -918,7 +995,11 @@ def _save_audio_to_file(audio_data: bytes, audio_id: str, timestamp: str, voice_
         os.makedirs(output_dir, exist_ok=True)
         
         # Use the new audio file manager for unique naming
-        if game_id and game_timestamp and speaker:
+        if audio_filename:
+            # Reserved in segment order before concurrent synthesis started
+            filename = audio_filename
+            
+        elif game_id and game_timestamp and speaker:
             from .audio_file_manager import generate_unique_audio_filename
             
             filename, sequence_num = generate_unique_audio_filename(
@@ -944,18 +1025,12 @@ def _save_audio_to_file(audio_data: bytes, audio_id: str, timestamp: str, voice_
         
         # Create proper WAV file from raw audio data
         # Gemini TTS typically outputs 24kHz, 16-bit, mono audio
-        output = io.BytesIO()
-        
-        with wave.open(output, 'wb') as wav_file:
+        with wave.open(filepath, 'wb') as wav_file:
             wav_file.setnchannels(1)        # Mono
             wav_file.setsampwidth(2)        # 16-bit (2 bytes)
             wav_file.setframerate(24000)    # 24kHz sample rate
             wav_file.writeframes(audio_data)
         
-        # Save to file
-        with open(filepath, 'wb') as f:
-            f.write(output.getvalue())
-        
         print(f"💾 Audio saved to: {filepath}")
         
         return filepath
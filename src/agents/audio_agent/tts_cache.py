@@ -0,0 +1,142 @@
+"""
+TTS Audio Cache - content-addressed, size-bounded LRU of synthesized speech on disk
+
+Key: sha256 of (normalized text, voice, style prompt, model). Stock lines such as
+"What a save!" or intermission filler are synthesized once and then served from
+data/tts_cache/<key>.pcm with no API call. File mtimes carry the LRU order across
+restarts; the oldest entries are evicted once the directory exceeds max_bytes.
+The cache is best-effort: disk errors are logged and never fail a TTS call.
+"""
+
+import hashlib
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+DEFAULT_CACHE_DIR = os.path.join("data", "tts_cache")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # ~70 minutes of 24kHz 16-bit mono PCM
+
+
+def normalize_tts_text(text: str) -> str:
+    """Unicode NFC with whitespace collapsed; the form both synthesized and hashed"""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def tts_cache_key(text: str, voice_name: str, style_prompt: str, model: str) -> str:
+    payload = "\x1f".join([normalize_tts_text(text), voice_name, style_prompt, model])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSAudioCache:
+    """Disk LRU of raw PCM keyed by tts_cache_key"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size, least recent first
+        self._total_bytes = 0
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._load_index()
+        except OSError as e:
+            print(f"⚠️ TTS cache unavailable at {cache_dir}: {e}")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pcm")
+
+    def _load_index(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pcm"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue  # Removed while listing
+            entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                audio_data = f.read()
+            os.utime(path)  # Recency survives restarts
+            return audio_data
+        except OSError:
+            with self._lock:
+                self._total_bytes -= self._entries.pop(key, 0)
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+    def put(self, key: str, audio_data: bytes) -> bool:
+        """Store audio under key; False (logged) when the disk write fails"""
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(audio_data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ TTS cache write failed ({key[:12]}): {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(audio_data)
+            self._total_bytes += len(audio_data)
+            evicted = []
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, old_size = self._entries.popitem(last=False)
+                self._total_bytes -= old_size
+                evicted.append(old_key)
+            self.evictions += len(evicted)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes
+            }
+
+
+_cache: Optional[TTSAudioCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSAudioCache:
+    """Process-wide TTS audio cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTSAudioCache()
+        return _cache
@@ -0,0 +1,149 @@
+"""
+Gemini TTS Engine - one long-lived client and a dedicated thread pool for TTS calls
+
+The google-genai client call is synchronous, so it runs on the engine's own
+executor instead of the event loop (which also serves the audio WebSocket).
+The rate limit is waited out on the event loop before a call is submitted, so
+TTS threads only ever hold API calls. Disk work around a call (TTS cache
+lookups/writes, WAV files) goes through run_blocking on a separate small I/O
+executor and never queues behind synthesis.
+Every call is metered: rate-limit wait, queue depth, in-flight requests and latency.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, TypeVar
+
+from src.data.static.rate_limiter import HostRateLimiter
+
+DEFAULT_TTS_MODEL = "gemini-2.5-flash-preview-tts"
+
+T = TypeVar("T")
+
+# Requests per second allowed per TTS provider, shared by all concurrent callers
+TTS_PROVIDER_RATES = {
+    "gemini": 3.0
+}
+
+
+class GeminiTTSEngine:
+    """Runs Gemini TTS requests on a dedicated executor with a shared client"""
+
+    def __init__(self, api_key: str, model: str = DEFAULT_TTS_MODEL, max_workers: int = 4,
+                 rate_limiter: Optional[HostRateLimiter] = None, io_workers: int = 2):
+        self.api_key = api_key
+        self.model = model
+        self.rate_limiter = rate_limiter or HostRateLimiter(default_rate=3.0, host_rates=TTS_PROVIDER_RATES)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gemini-tts")
+        self._io_executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="tts-io")
+        self._client = None
+        self._lock = threading.Lock()
+        self._metrics = {
+            "queued": 0,
+            "in_flight": 0,
+            "completed": 0,
+            "failed": 0,
+            "total_latency_seconds": 0.0,
+            "max_latency_seconds": 0.0,
+            "total_queue_wait_seconds": 0.0,
+            "total_rate_limit_wait_seconds": 0.0
+        }
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is None:
+                from google import genai
+                self._client = genai.Client(api_key=self.api_key)
+            return self._client
+
+    def _generate(self, prompt: str, voice_name: str, submitted_at: float) -> bytes:
+        """Worker thread: call the API (rate limit already taken), return raw PCM bytes"""
+        from google.genai import types
+
+        with self._lock:
+            self._metrics["queued"] -= 1
+            self._metrics["in_flight"] += 1
+            self._metrics["total_queue_wait_seconds"] += time.monotonic() - submitted_at
+        try:
+            response = self._get_client().models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_modalities=["AUDIO"],
+                    speech_config=types.SpeechConfig(
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                                voice_name=voice_name
+                            )
+                        )
+                    )
+                )
+            )
+            return response.candidates[0].content.parts[0].inline_data.data
+        finally:
+            with self._lock:
+                self._metrics["in_flight"] -= 1
+
+    async def synthesize(self, prompt: str, voice_name: str) -> bytes:
+        """Raw 24kHz 16-bit mono PCM for a styled prompt, without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        rate_limit_wait = self.rate_limiter.reserve("gemini")
+        if rate_limit_wait > 0:
+            await asyncio.sleep(rate_limit_wait)
+        submitted_at = time.monotonic()
+        with self._lock:
+            self._metrics["queued"] += 1
+            self._metrics["total_rate_limit_wait_seconds"] += rate_limit_wait
+        try:
+            audio_data = await loop.run_in_executor(self._executor, self._generate, prompt, voice_name, submitted_at)
+        except Exception:
+            with self._lock:
+                self._metrics["failed"] += 1
+            raise
+        latency = time.monotonic() - submitted_at
+        with self._lock:
+            self._metrics["completed"] += 1
+            self._metrics["total_latency_seconds"] += latency
+            self._metrics["max_latency_seconds"] = max(self._metrics["max_latency_seconds"], latency)
+        return audio_data
+
+    async def run_blocking(self, fn: Callable[..., T], *args) -> T:
+        """Run blocking I/O (cache reads/writes, file saves) on the engine's I/O executor"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, fn, *args)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            metrics = dict(self._metrics)
+        finished = metrics["completed"] + metrics["failed"]
+        metrics["avg_latency_seconds"] = round(metrics["total_latency_seconds"] / metrics["completed"], 3) if metrics["completed"] else 0.0
+        metrics["avg_queue_wait_seconds"] = round(metrics["total_queue_wait_seconds"] / finished, 3) if finished else 0.0
+        metrics["avg_rate_limit_wait_seconds"] = round(metrics["total_rate_limit_wait_seconds"] / finished, 3) if finished else 0.0
+        metrics["queue_depth"] = metrics["queued"]
+        metrics["model"] = self.model
+        return metrics
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self._io_executor.shutdown(wait=False)
+
+
+_engine: Optional[GeminiTTSEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_tts_engine(api_key: str) -> GeminiTTSEngine:
+    """Process-wide TTS engine (rebuilt only if the API key changes)"""
+    global _engine
+    with _engine_lock:
+        if _engine is None or _engine.api_key != api_key:
+            if _engine is not None:
+                _engine.close()
+            _engine = GeminiTTSEngine(api_key)
+        return _engine
+
+
+def get_tts_metrics() -> Dict[str, Any]:
+    """Metrics of the current engine, empty before the first TTS call"""
+    return _engine.get_metrics() if _engine is not None else {}
@@ -12,6 +12,24 @@ from .config import (
     HIGH_INTENSITY_THRESHOLD
 )
 
+from src.data.static.roster_index import get_roster_index
+
+# Parsed static context per file, reused until the file changes. Every caller for the
+# same game then shares one dict, and therefore one roster index. Treat it as read-only.
+_STATIC_CONTEXT_CACHE: Dict[str, Any] = {}
+
+
+def _load_static_context_file(path: str) -> Dict[str, Any]:
+    mtime = os.path.getmtime(path)
+    cached = _STATIC_CONTEXT_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r') as f:
+        static_context = json.load(f)
+    _STATIC_CONTEXT_CACHE[path] = (mtime, static_context)
+    return static_context
+
+
 def load_static_context(game_id: str) -> Dict[str, Any]:
     """
     Loads static game context including team info, player stats, and historical data.
@@ -23,17 +41,12 @@ def load_static_context(game_id: str) -> Dict[str, Any]:
         Dictionary containing static context and knowledge base information
     """
     try:
-        # Try to load static context file with correct naming pattern
-        static_context_path = f"data/static/game_{game_id}_static_context.json"
-        if os.path.exists(static_context_path):
-            with open(static_context_path, 'r') as f:
-                return json.load(f)
-        
-        # Fallback - try old naming pattern
-        static_context_path = f"data/static/static_context_{game_id}.json"
-        if os.path.exists(static_context_path):
-            with open(static_context_path, 'r') as f:
-                return json.load(f)
+        # Try to load static context file with correct naming pattern,
+        # then fallback - try old naming pattern
+        for static_context_path in (f"data/static/game_{game_id}_static_context.json",
+                                    f"data/static/static_context_{game_id}.json"):
+            if os.path.exists(static_context_path):
+                return _load_static_context_file(static_context_path)
         
         # Fallback to basic structure if no file exists
         return {
@@ -62,27 +75,9 @@ def load_static_context(game_id: str) -> Dict[str, Any]:
 # ============= ENHANCED HELPER FUNCTIONS =================
 
 def get_player_name_from_static(player_id: int, static_context: Dict[str, Any]) -> str:
-    """Get human-readable player name from static context data"""
+    """Get human-readable player name from static context data (shared per-game roster index)"""
     try:
-        # Check both home and away players in rosters
-        rosters = static_context.get("rosters", {})
-        all_players = rosters.get("home_players", []) + rosters.get("away_players", [])
-        
-        for player in all_players:
-            if player.get("player_id") == str(player_id) or player.get("nhl_data", {}).get("playerId") == player_id:
-                # Try to get full name first, then fallback to default name
-                full_name = player.get("nhl_data", {}).get("name", {}).get("default")
-                if full_name:
-                    return full_name
-                return player.get("name", f"Player #{player_id}")
-        
-        # Fallback - try legacy players structure
-        players = static_context.get("players", [])
-        for player in players:
-            if player.get("player_id") == str(player_id) or player.get("nhl_data", {}).get("playerId") == player_id:
-                return player.get("name", f"Player #{player_id}")
-                
-        return f"Player #{player_id}"
+        return get_roster_index(static_context).display_name(player_id)
     except Exception as e:
         return f"Player #{player_id}"
 
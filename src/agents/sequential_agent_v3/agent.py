@@ -5,16 +5,39 @@ Integrates Data + Commentary + Audio processing in a single agent
 
 import os
 import json
-from typing import Dict, Any, Optional
+import uuid
+import asyncio
+from typing import Dict, Any, Optional, Callable, Tuple
 from google.adk.agents import SequentialAgent
 
+from .response_collector import AgentResponseCollector, JsonArrayItemStream
+
+# Sub-agent sessions are replaced after this many calls so their history stays short
+DEFAULT_SESSION_REFRESH_CALLS = 8
+# TTS segments synthesized at the same time (provider request rates are limited in audio_agent.tool)
+DEFAULT_MAX_CONCURRENT_TTS = 3
+
+# Segment index -> (the commentary line TTS was started for, its task)
+AudioTasks = Dict[int, Tuple[Dict[str, Any], asyncio.Task]]
+
+
+def _same_line(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """True when two commentary segments would be spoken identically"""
+    return (a.get("speaker"), str(a.get("text", "")).strip()) == (b.get("speaker"), str(b.get("text", "")).strip())
+
 
 class NHLSequentialAgentV3:
     """Complete Sequential Agent for NHL Commentary with Audio Integration"""
     
-    def __init__(self, game_id: str):
+    def __init__(self, game_id: str, session_refresh_calls: int = DEFAULT_SESSION_REFRESH_CALLS,
+                 max_concurrent_tts: int = DEFAULT_MAX_CONCURRENT_TTS):
         self.game_id = game_id
         self.agent = None
+        self.session_refresh_calls = session_refresh_calls
+        self._runner_pool: Dict[str, Dict[str, Any]] = {}  # sub-agent name -> runner, session, call count
+        self.max_concurrent_tts = max_concurrent_tts
+        self._tts_slots: Optional[asyncio.Semaphore] = None  # Created on the running loop
+        self.session_refreshes = 0
         
     async def initialize(self):
         """Initialize agent with all three sub-agents"""
@@ -56,6 +79,8 @@ class NHLSequentialAgentV3:
             description=f"Complete NHL Data + Commentary + Audio Pipeline for {self.game_id}"
         )
         
+        await self._create_runner_pool()
+        
         print(f"✅ Sequential Agent V3 initialized for game {self.game_id} (Data + Commentary + Audio)")
         print(f"📊 Sub-agents: {[agent.name for agent in self.agent.sub_agents]}")
 
@@ -69,51 +94,16 @@ class NHLSequentialAgentV3:
         Returns:
             Complete results with data, commentary, and audio components
         """
-        result = {
-            "data_agent": {},
-            "commentary_agent": {},
-            "audio_agent": {},
-            "raw_debug": ""
-        }
-        
         try:
             # Step 1: Process through individual agents manually
-            print(f"🔄 Processing through Data Agent...")
-            
-            # Process with Data Agent first
-            data_response = await self._call_agent_with_message(self.data_agent, message)
-            result["data_agent"] = data_response
-            
-            print(f"🔄 Processing through Commentary Agent...")
-            
-            # Process with Commentary Agent using data agent output
-            commentary_input = self._prepare_commentary_input(message, data_response)
-            commentary_response = await self._call_agent_with_message(self.commentary_agent, commentary_input)
-            result["commentary_agent"] = commentary_response
+            game_timestamp = self._get_proper_game_timestamp()
+            data_response = await self.run_data_stage(message)
+            commentary_response, audio_tasks = await self.run_commentary_stage_streaming(
+                message, data_response, game_timestamp
+            )
             
             # Step 2: Generate audio if commentary was successful
-            commentary_data = result.get("commentary_agent", {})
-            
-            if commentary_data.get("status") == "success":
-                print(f"🎵 Starting audio generation...")
-                audio_result = await self.process_commentary_to_audio(commentary_data)
-                result["audio_agent"] = audio_result
-                
-                if audio_result.get("status") == "success":
-                    print(f"✅ Audio generation completed: {audio_result.get('successful_segments', 0)} segments")
-                else:
-                    print(f"⚠️ Audio generation failed: {audio_result.get('error', 'Unknown error')}")
-            else:
-                result["audio_agent"] = {
-                    "status": "skipped",
-                    "message": "Commentary failed, skipping audio generation"
-                }
-                print(f"⚠️ Commentary failed, skipping audio generation")
-            
-            # Store raw debug info
-            result["raw_debug"] = f"Data: {str(data_response)[:200]}... Commentary: {str(commentary_response)[:200]}..."
-            
-            return result
+            return await self.run_audio_stage(data_response, commentary_response, game_timestamp, audio_tasks)
             
         except Exception as e:
             print(f"❌ Sequential Agent V3 processing failed: {e}")
@@ -124,51 +114,187 @@ class NHLSequentialAgentV3:
                 "raw_debug": str(e)
             }
     
-    async def _call_agent_with_message(self, agent, message: str) -> Dict[str, Any]:
+    async def run_data_stage(self, message: str) -> Dict[str, Any]:
+        """Data Agent step on its own, so a pipeline can overlap it with other snapshots' later stages"""
+        print(f"🔄 Processing through Data Agent...")
+        return await self._call_agent_with_message(self.data_agent, message)
+    
+    async def run_commentary_stage(self, message: str, data_response: Dict[str, Any]) -> Dict[str, Any]:
+        """Commentary Agent step using the Data Agent output"""
+        print(f"🔄 Processing through Commentary Agent...")
+        commentary_input = self._prepare_commentary_input(message, data_response)
+        return await self._call_agent_with_message(self.commentary_agent, commentary_input)
+    
+    async def run_commentary_stage_streaming(self, message: str, data_response: Dict[str, Any],
+                                             game_timestamp: Optional[str] = None):
+        """
+        Commentary step that streams the model output and starts TTS for each
+        commentary_sequence line as soon as that line has been parsed (within the
+        max_concurrent_tts limit).
+        
+        Returns:
+            (commentary response, {segment index: (segment, audio task)}) for run_audio_stage.
+            Streamed lines may differ from the final answer; process_commentary_to_audio reconciles them.
+        """
+        print(f"🔄 Processing through Commentary Agent (streaming to TTS)...")
+        timestamp = game_timestamp or self._get_proper_game_timestamp()
+        audio_tasks: AudioTasks = {}
+        sequence_stream = JsonArrayItemStream("commentary_sequence")
+        
+        def on_partial_text(text: str):
+            for index, segment in sequence_stream.feed(text):
+                if str(segment.get("text", "")).strip():
+                    audio_tasks[index] = (segment, self._schedule_segment_audio(index, segment, timestamp))
+        
+        handed_off = False
+        try:
+            commentary_input = self._prepare_commentary_input(message, data_response)
+            response = await self._call_agent_with_message(self.commentary_agent, commentary_input, on_partial_text)
+            
+            # Lines the stream did not yield (non-streaming model, odd formatting) start now, still in order
+            if response.get("status") == "success":
+                for index, segment in enumerate(response.get("commentary_sequence", []) or []):
+                    if index not in audio_tasks and str(segment.get("text", "")).strip():
+                        audio_tasks[index] = (segment, self._schedule_segment_audio(index, segment, timestamp))
+            if audio_tasks:
+                print(f"🎙️ {len(audio_tasks)} commentary lines handed to TTS while streaming")
+            handed_off = response.get("status") == "success"
+            return response, audio_tasks if handed_off else {}
+        finally:
+            if not handed_off:
+                # The stage failed after some lines were already streamed to TTS
+                await self.cancel_audio_tasks(audio_tasks)
+    
+    async def cancel_audio_tasks(self, audio_tasks: Optional[AudioTasks]):
+        """Cancel streamed TTS tasks nobody will collect, and wait until they have released their file names"""
+        pending = [task for _, task in (audio_tasks or {}).values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def run_audio_stage(self, data_response: Dict[str, Any], commentary_response: Dict[str, Any],
+                              game_timestamp: Optional[str] = None,
+                              audio_tasks: Optional[AudioTasks] = None) -> Dict[str, Any]:
+        """Audio step: synthesize the commentary and assemble the complete result"""
+        result = {
+            "data_agent": data_response,
+            "commentary_agent": commentary_response,
+            "audio_agent": {},
+            "raw_debug": ""
+        }
+        
+        if commentary_response.get("status") == "success":
+            print(f"🎵 Starting audio generation...")
+            audio_result = await self.process_commentary_to_audio(commentary_response, game_timestamp, audio_tasks)
+            result["audio_agent"] = audio_result
+            
+            if audio_result.get("status") == "success":
+                print(f"✅ Audio generation completed: {audio_result.get('successful_segments', 0)} segments")
+            else:
+                print(f"⚠️ Audio generation failed: {audio_result.get('error', 'Unknown error')}")
+        else:
+            await self.cancel_audio_tasks(audio_tasks)
+            result["audio_agent"] = {
+                "status": "skipped",
+                "message": "Commentary failed, skipping audio generation"
+            }
+            print(f"⚠️ Commentary failed, skipping audio generation")
+        
+        # Store raw debug info
+        result["raw_debug"] = f"Data: {str(data_response)[:200]}... Commentary: {str(commentary_response)[:200]}..."
+        
+        return result
+    
+    async def _create_runner_pool(self):
+        """One long-lived runner and session per sub-agent, created once at initialize()"""
+        from google.adk.runners import InMemoryRunner
+        
+        for sub_agent in (self.data_agent, self.commentary_agent):
+            runner = InMemoryRunner(agent=sub_agent)
+            self._runner_pool[sub_agent.name] = {
+                "runner": runner,
+                "session": await self._create_session(runner, sub_agent.name),
+                "calls": 0,
+                "lock": asyncio.Lock()  # One run at a time per session
+            }
+    
+    async def _create_session(self, runner, agent_name: str):
+        return await runner.session_service.create_session(
+            app_name=runner.app_name,
+            user_id=f"live_v3_{self.game_id}_{agent_name}"
+        )
+    
+    async def _rotate_session(self, entry: Dict[str, Any], agent_name: str):
+        """Replace a pooled session (refresh policy), dropping the old one from the session service"""
+        runner, old_session = entry["runner"], entry["session"]
+        entry["session"] = await self._create_session(runner, agent_name)
+        entry["calls"] = 0
+        self.session_refreshes += 1
+        try:
+            await runner.session_service.delete_session(
+                app_name=runner.app_name, user_id=old_session.user_id, session_id=old_session.id
+            )
+        except Exception:
+            pass  # Ignore deletion errors
+        print(f"🔄 Session refreshed for {agent_name}")
+    
+    async def refresh_sessions(self):
+        """Rotate every pooled session now"""
+        for agent_name, entry in self._runner_pool.items():
+            async with entry["lock"]:
+                await self._rotate_session(entry, agent_name)
+    
+    async def _call_agent_with_message(self, agent, message: str,
+                                       on_partial_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
-        Call an individual agent with a message using a temporary session
+        Call an individual agent with a message using its pooled runner and session
         
         Args:
             agent: The agent to call
             message: The input message
+            on_partial_text: When given, the run streams (SSE) and each text delta is passed here
             
         Returns:
             Parsed response from the agent
         """
         try:
-            from google.adk.runners import InMemoryRunner
             from google.genai.types import Part, UserContent
+            from google.adk.agents.run_config import RunConfig, StreamingMode
             
-            # Create temporary runner and session for this agent
-            runner = InMemoryRunner(agent=agent)
-            session = await runner.session_service.create_session(
-                app_name=runner.app_name,
-                user_id=f"temp_{self.game_id}_{agent.name}"
-            )
+            entry = self._runner_pool.get(agent.name)
+            if entry is None:
+                from google.adk.runners import InMemoryRunner
+                runner = InMemoryRunner(agent=agent)
+                entry = {"runner": runner, "session": await self._create_session(runner, agent.name),
+                         "calls": 0, "lock": asyncio.Lock()}
+                self._runner_pool[agent.name] = entry
             
             # Prepare input
             input_content = UserContent(parts=[Part(text=message)])
+            run_config = RunConfig(streaming_mode=StreamingMode.SSE) if on_partial_text else RunConfig()
             
-            # Collect response
-            output = ""
-            async for event in runner.run_async(
-                user_id=session.user_id,
-                session_id=session.id,
-                new_message=input_content
-            ):
-                if hasattr(event, 'content'):
-                    output += str(event.content)
-                if len(output) > 8000:
-                    break
-            
-            # Clean up session
-            try:
-                await runner.session_service.delete_session(session.id)
-            except Exception:
-                pass
-            
-            # Parse output
-            return self._parse_agent_output(output, agent.name)
+            async with entry["lock"]:
+                if entry["calls"] >= self.session_refresh_calls:
+                    await self._rotate_session(entry, agent.name)
+                entry["calls"] += 1
+                runner, session = entry["runner"], entry["session"]
+                
+                # Collect response from the event objects themselves (no repr, no length cap)
+                collector = AgentResponseCollector(agent.name)
+                async for event in runner.run_async(
+                    user_id=session.user_id,
+                    session_id=session.id,
+                    new_message=input_content,
+                    run_config=run_config
+                ):
+                    if on_partial_text and getattr(event, 'partial', False) and event.content and event.content.parts:
+                        for part in event.content.parts:
+                            if part.text and not getattr(part, 'thought', None):
+                                on_partial_text(part.text)
+                    collector.add_event(event)
+            
+            return collector.result()
             
         except Exception as e:
             return {
@@ -206,88 +332,6 @@ Data Agent Analysis:
         except Exception:
             return original_message
     
-    def _parse_agent_output(self, output: str, agent_name: str) -> Dict[str, Any]:
-        """
-        Parse individual agent output
-        
-        Args:
-            output: Raw agent output
-            agent_name: Name of the agent
-            
-        Returns:
-            Parsed response
-        """
-        try:
-            # Handle ADK agent response format (parts=[Part(...)])
-            if "parts=[Part(" in output:
-                # Extract text content from parts structure
-                import re
-                # Use a more sophisticated regex to handle escaped quotes
-                text_match = re.search(r"text='([^']*?(?:\\'[^']*?)*)'", output)
-                if not text_match:
-                    text_match = re.search(r'text="([^"]*?(?:\\"[^"]*?)*)"', output)
-                if not text_match:
-                    text_match = re.search(r'text=([^)]+)', output)
-                
-                if text_match:
-                    text_content = text_match.group(1)
-                    
-                    # Handle escaped JSON
-                    text_content = text_content.replace('\\n', '\n').replace('\\"', '"').replace('\\\\', '\\').replace("\\'", "'")
-                    
-                    # Try to extract JSON from the text content
-                    if text_content.strip().startswith('```json'):
-                        # Remove markdown code block
-                        json_content = text_content.replace('```json', '').replace('```', '').strip()
-                        try:
-                            parsed = json.loads(json_content)
-                            parsed["status"] = "success"
-                            return parsed
-                        except json.JSONDecodeError:
-                            pass
-                    
-                    # Try direct JSON parsing
-                    json_match = re.search(r'\{.*\}', text_content, re.DOTALL)
-                    if json_match:
-                        try:
-                            parsed = json.loads(json_match.group())
-                            parsed["status"] = "success"
-                            return parsed
-                        except json.JSONDecodeError:
-                            pass
-            
-            # Try to parse as direct JSON
-            if output.strip().startswith('{') and output.strip().endswith('}'):
-                parsed = json.loads(output.strip())
-                parsed["status"] = "success"
-                return parsed
-            
-            # Look for JSON within the output
-            import re
-            json_match = re.search(r'\{.*\}', output, re.DOTALL)
-            if json_match:
-                try:
-                    parsed = json.loads(json_match.group())
-                    parsed["status"] = "success"
-                    return parsed
-                except json.JSONDecodeError:
-                    pass
-            
-            # If no JSON found, return as text
-            return {
-                "status": "success",
-                "text_output": output,
-                "agent_name": agent_name
-            }
-            
-        except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Parse error: {str(e)}",
-                "raw_output": output[:500],
-                "agent_name": agent_name
-            }
-
     def _parse_sequential_response(self, response) -> Dict[str, Any]:
         """
         Parse Sequential Agent response to extract data and commentary components
@@ -359,17 +403,25 @@ Data Agent Analysis:
         
         return result
 
-    async def process_commentary_to_audio(self, commentary_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_commentary_to_audio(self, commentary_data: Dict[str, Any],
+                                          game_timestamp: Optional[str] = None,
+                                          audio_tasks: Optional[AudioTasks] = None) -> Dict[str, Any]:
         """
         Process commentary data to generate audio files
         
         Args:
             commentary_data: Commentary agent output with dialogue sequence
+            game_timestamp: Timestamp used in audio file names ("1_01_15"). Pipelined callers
+                pass it explicitly, since the agent may already be working on a later snapshot.
+            audio_tasks: Segments already started while the commentary was streaming; a task is
+                reused only if its line matches the final commentary_sequence entry at that index
             
         Returns:
             Audio processing results
         """
         try:
+            proper_timestamp = game_timestamp or self._get_proper_game_timestamp()
+
             audio_results = []
             
             # Extract commentary sequence
@@ -384,61 +436,35 @@ Data Agent Analysis:
             
             print(f"🎵 Processing {len(commentary_sequence)} commentary segments for audio...")
             
+            # Start every segment not already started while streaming, then collect in order.
+            # The stream may have locked onto an earlier turn's array, so a streamed task is
+            # only kept when it was started for exactly the final line at its index
+            streamed = dict(audio_tasks or {})
+            tasks = {}
+            for i, segment in enumerate(commentary_sequence):
+                started = streamed.get(i)
+                if started is not None and _same_line(started[0], segment):
+                    tasks[i] = streamed.pop(i)[1]
+            if streamed:
+                print(f"🔁 {len(streamed)} streamed TTS lines do not match the final commentary; re-synthesizing")
+                await self.cancel_audio_tasks(streamed)
+            for i, segment in enumerate(commentary_sequence):
+                if i not in tasks and str(segment.get("text", "")).strip():
+                    tasks[i] = self._schedule_segment_audio(i, segment, proper_timestamp)
+            
             for i, segment in enumerate(commentary_sequence):
-                speaker = segment.get("speaker", "Unknown")
-                text = segment.get("text", "")
+                task = tasks.get(i)
+                if task is None:
+                    continue
+                try:
+                    audio_result = await task
+                except asyncio.CancelledError:
+                    audio_result = {"segment_index": i, "status": "error", "error": "cancelled"}
+                audio_results.append(audio_result)
                 
-                if text.strip():
-                    # Determine voice style based on speaker and content
-                    voice_style = self._get_voice_style_for_speaker(speaker, text)
-                    
-                    # Process to audio with enhanced error handling
-                    try:
-                        # Use direct audio tool instead of complex agent processing
-                        from ..audio_agent.tool import text_to_speech
-                        
-                        # Generate audio using direct tool call  
-                        # Get proper game timestamp from the filename or context
-                        proper_timestamp = self._get_proper_game_timestamp()
-                        
-                        print(f"🎙️ Generating audio for {speaker}: {text[:50]}...")
-                        
-                        audio_result = await text_to_speech(
-                            tool_context=None,
-                            text=text,
-                            voice_style=voice_style,
-                            language="en-US",
-                            speaker=speaker,
-                            game_id=self.game_id,
-                            game_timestamp=proper_timestamp,
-                            segment_index=i
-                        )
-                        
-                        # Add metadata
-                        audio_result["segment_index"] = i
-                        audio_result["speaker"] = speaker
-                        audio_result["original_text"] = text
-                        audio_result["game_id"] = self.game_id
-                        audio_result["voice_style"] = voice_style
-                        
-                        audio_results.append(audio_result)
-                        
-                        if audio_result.get("status") == "success":
-                            saved_file = audio_result.get("saved_file")
-                            print(f"✅ Audio generated: {saved_file}")
-                        else:
-                            print(f"⚠️ Audio generation failed: {audio_result.get('error', 'Unknown error')}")
-                        
-                    except Exception as e:
-                        print(f"⚠️ Audio processing failed for segment {i}: {e}")
-                        # Continue with other segments
-                        audio_results.append({
-                            "segment_index": i,
-                            "speaker": speaker,
-                            "status": "error",
-                            "error": str(e),
-                            "original_text": text[:50] + "..." if len(text) > 50 else text
-                        })
+                # Segments may finish out of order; clients hear them in dialogue order
+                from ..audio_agent.tool import broadcast_speech_result
+                broadcast_speech_result(audio_result, segment.get("text", ""))
             
             # 保存音频文件清单
             successful_files = 0
@@ -475,6 +501,100 @@ Data Agent Analysis:
                 "game_id": self.game_id
             }
     
+    def _schedule_segment_audio(self, index: int, segment: Dict[str, Any], game_timestamp: str) -> asyncio.Task:
+        """
+        Start TTS for one commentary line; at most max_concurrent_tts run at once.
+        The audio file name is reserved here, in dialogue order, so file names and
+        manifest order match sequential synthesis even when segments finish out of order.
+        """
+        from ..audio_agent.audio_file_manager import generate_unique_audio_filename, release_audio_filename
+        
+        speaker = segment.get("speaker", "Unknown")
+        text = segment.get("text", "")
+        voice_style = self._get_voice_style_for_speaker(speaker, text)
+        audio_id = str(uuid.uuid4())[:8]
+        audio_filename, _ = generate_unique_audio_filename(
+            game_id=self.game_id,
+            game_timestamp=game_timestamp,
+            speaker=speaker,
+            voice_style=voice_style,
+            audio_id=audio_id
+        )
+        
+        if self._tts_slots is None:
+            self._tts_slots = asyncio.Semaphore(self.max_concurrent_tts)
+        
+        async def run_in_slot():
+            async with self._tts_slots:
+                return await self._synthesize_segment(index, segment, game_timestamp, voice_style,
+                                                      audio_filename, audio_id)
+        
+        task = asyncio.create_task(run_in_slot())
+        task.add_done_callback(
+            lambda t: release_audio_filename(self.game_id, audio_filename) if t.cancelled() else None
+        )
+        return task
+    
+    async def _synthesize_segment(self, i: int, segment: Dict[str, Any], proper_timestamp: str,
+                                  voice_style: str, audio_filename: str, audio_id: str) -> Dict[str, Any]:
+        """TTS for one commentary line into its reserved file, with segment metadata"""
+        from ..audio_agent.audio_file_manager import release_audio_filename
+        
+        speaker = segment.get("speaker", "Unknown")
+        text = segment.get("text", "")
+        
+        # Process to audio with enhanced error handling
+        try:
+            # Use direct audio tool instead of complex agent processing
+            from ..audio_agent.tool import synthesize_speech
+            
+            # Generate audio using direct tool call  
+            print(f"🎙️ Generating audio for {speaker}: {text[:50]}...")
+            
+            audio_result = await synthesize_speech(
+                tool_context=None,
+                text=text,
+                voice_style=voice_style,
+                language="en-US",
+                speaker=speaker,
+                game_id=self.game_id,
+                game_timestamp=proper_timestamp,
+                segment_index=i,
+                audio_filename=audio_filename,
+                audio_id=audio_id,
+                broadcast=False
+            )
+            
+            # Add metadata
+            audio_result["segment_index"] = i
+            audio_result["speaker"] = speaker
+            audio_result["original_text"] = text
+            audio_result["game_id"] = self.game_id
+            audio_result["voice_style"] = voice_style
+            
+            if audio_result.get("status") == "success":
+                saved_file = audio_result.get("saved_file")
+                print(f"✅ Audio generated: {saved_file}")
+            else:
+                print(f"⚠️ Audio generation failed: {audio_result.get('error', 'Unknown error')}")
+            
+            if not str(audio_result.get("saved_file") or "").endswith(audio_filename):
+                release_audio_filename(self.game_id, audio_filename)  # Fallback audio or failure
+            
+            return audio_result
+            
+        except Exception as e:
+            print(f"⚠️ Audio processing failed for segment {i}: {e}")
+            release_audio_filename(self.game_id, audio_filename)
+            # Continue with other segments
+            return {
+                "segment_index": i,
+                "speaker": speaker,
+                "status": "error",
+                "error": str(e),
+                "original_text": text[:50] + "..." if len(text) > 50 else text
+            }
+    
     def _get_voice_style_for_speaker(self, speaker: str, text: str) -> str:
         """
         Determine appropriate voice style based on speaker and content
@@ -561,7 +681,8 @@ Data Agent Analysis:
         self._current_game_context = context
 
 
-def create_nhl_sequential_agent_v3(game_id: str) -> NHLSequentialAgentV3:
+def create_nhl_sequential_agent_v3(game_id: str, session_refresh_calls: int = DEFAULT_SESSION_REFRESH_CALLS,
+                                   max_concurrent_tts: int = DEFAULT_MAX_CONCURRENT_TTS) -> NHLSequentialAgentV3:
     """Create NHL Sequential Agent V3 with complete integration"""
     import dotenv
     dotenv.load_dotenv()
@@ -586,4 +707,4 @@ def create_nhl_sequential_agent_v3(game_id: str) -> NHLSequentialAgentV3:
         print(f"⚠️ Google GenAI configuration warning: {e}")
         pass
         
-    return NHLSequentialAgentV3(game_id) 
\ No newline at end of file
+    return NHLSequentialAgentV3(game_id, session_refresh_calls, max_concurrent_tts) 
\ No newline at end of file
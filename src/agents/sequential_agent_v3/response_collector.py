@@ -0,0 +1,149 @@
+"""
+Sequential Agent V3 - Response Collector
+Reads ADK run events as objects (Part.text, function responses) and decodes the
+agent's JSON answer directly, instead of parsing str(event.content) with regexes.
+"""
+
+import json
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+_DECODER = json.JSONDecoder()
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    The JSON object a response is built around: the body of the first markdown fence
+    if there is one, decoded from its outermost '{'. A truncated or malformed answer
+    returns None rather than an object nested inside it.
+    """
+    fenced = _FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    start = text.find('{')
+    if start == -1:
+        return None
+    try:
+        parsed, _ = _DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+class AgentResponseCollector:
+    """Accumulates one agent run and turns it into the agent's result dict"""
+
+    def __init__(self, agent_name: str):
+        self.agent_name = agent_name
+        self.text_parts: List[str] = []
+        self.function_responses: List[Dict[str, Any]] = []
+        self.last_json: Optional[Dict[str, Any]] = None
+        self.event_count = 0
+
+    def add_event(self, event):
+        """Take the text and function responses out of one ADK event"""
+        if getattr(event, 'partial', False):
+            return  # Streaming deltas; the aggregated event that follows carries the full text
+        content = getattr(event, 'content', None)
+        parts = getattr(content, 'parts', None) if content is not None else None
+        if not parts:
+            return
+        self.event_count += 1
+
+        for part in parts:
+            if getattr(part, 'thought', None):
+                continue  # Model reasoning, not the answer
+            if part.text:
+                self.text_parts.append(part.text)
+                # Each complete model turn is decoded as it arrives; the last JSON answer wins
+                parsed = extract_json_object(part.text)
+                if parsed is not None:
+                    self.last_json = parsed
+            elif part.function_response is not None:
+                response = part.function_response.response
+                if isinstance(response, dict):
+                    self.function_responses.append(response)
+
+    @property
+    def text(self) -> str:
+        return "".join(self.text_parts)
+
+    def result(self) -> Dict[str, Any]:
+        """Parsed JSON answer with status, or the plain text / tool output when there is none"""
+        parsed = self.last_json
+        if parsed is None and len(self.text_parts) > 1:
+            # JSON split across streamed chunks
+            parsed = extract_json_object(self.text)
+        if parsed is not None:
+            parsed["status"] = "success"
+            return parsed
+
+        if self.text.strip():
+            return {
+                "status": "success",
+                "text_output": self.text,
+                "agent_name": self.agent_name
+            }
+
+        if self.function_responses:
+            return {
+                "status": "success",
+                "function_responses": self.function_responses,
+                "agent_name": self.agent_name
+            }
+
+        return {
+            "status": "error",
+            "error": "Agent returned no content",
+            "agent_name": self.agent_name
+        }
+
+
+class JsonArrayItemStream:
+    """
+    Incremental parser for streamed model text: yields the objects of one named JSON
+    array (e.g. "commentary_sequence") as soon as each object is complete.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.items_emitted = 0
+        self.done = False
+        self._buffer = ""
+        self._pos: Optional[int] = None  # Scan position inside the array once it is found
+
+    def feed(self, chunk: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """Add streamed text; returns (index, item) for every array item completed by it"""
+        items = []
+        if self.done:
+            return items
+        self._buffer += chunk
+
+        if self._pos is None:
+            key_at = self._buffer.find(f'"{self.key}"')
+            bracket = self._buffer.find('[', key_at) if key_at != -1 else -1
+            if bracket == -1:
+                return items
+            self._pos = bracket + 1
+
+        buffer, size = self._buffer, len(self._buffer)
+        while True:
+            pos = self._pos
+            while pos < size and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            self._pos = pos
+            if pos >= size:
+                break
+            if buffer[pos] == ']':
+                self.done = True
+                break
+            try:
+                item, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Item still streaming in
+            self._pos = end
+            if isinstance(item, dict):
+                items.append((self.items_emitted, item))
+            self.items_emitted += 1
+        return items
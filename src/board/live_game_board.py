@@ -5,7 +5,7 @@ Tracks only live game state, references static context when needed for validatio
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 
@@ -39,21 +39,46 @@ class LiveGameBoard:
         # Technical Tracking
         self.processed_events = set()  # Prevent duplicate processing
         self.last_update_time = None
+        self.last_indexed_key = (0, 0)  # (period, seconds) reached via update_from_event_log
     
     def update_from_timestamp(self, timestamp_data: Dict) -> Dict[str, Any]:
         """
         Update board state from timestamp data.
         Pure state tracking - no interpretation.
         """
+        return self._apply_activities(
+            timestamp_data.get("activities", []),
+            timestamp_data.get("game_time", "Unknown")
+        )
+    
+    def update_from_event_log(self, read_range: Callable[[Tuple[int, int], Tuple[int, int]], List[Dict]],
+                              game_time: str) -> Dict[str, Any]:
+        """
+        Update board state from a time-indexed event log up to game_time ("P:MM:SS").
+        read_range(start_key, end_key) must return *enhanced* activities (scorer/assist/penalty
+        names, gameSituation), e.g. LiveDataCollector.enhanced_range. Only the slice since the
+        previous update is read.
+        """
+        try:
+            period_str, clock = game_time.split(':', 1)
+            minutes, seconds = map(int, clock.split(':'))
+            current_key = (int(period_str), minutes * 60 + seconds)
+        except ValueError:
+            return self._apply_activities([], game_time)
+        
+        activities = read_range(self.last_indexed_key, current_key)
+        self.last_indexed_key = max(self.last_indexed_key, current_key)
+        return self._apply_activities(activities, game_time)
+    
+    def _apply_activities(self, activities: List[Dict], game_time: str) -> Dict[str, Any]:
+        """Apply activities in order, skipping events already on the board"""
         update_report = {
-            "timestamp": timestamp_data.get("game_time", "Unknown"),
+            "timestamp": game_time,
             "events_processed": 0,
             "new_goals": [],
             "new_penalties": []
         }
         
-        activities = timestamp_data.get("activities", [])
-        
         for activity in activities:
             event_id = activity.get("eventId")
             
@@ -3,10 +3,15 @@
 NHL Game Pipeline - Complete 3-stage pipeline for a specific game
 Implements the full NHL Live Streaming Data Architecture
 """
+import os
 import sys
 import subprocess
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from src.data.static.static_info_generator import get_static_info_generator
+from src.data.static.light_static_info_generator import LightStaticInfoGenerator
+
 
 def run_pipeline(game_id: str, duration_minutes: int = 2):
     """
@@ -20,16 +25,15 @@ def run_pipeline(game_id: str, duration_minutes: int = 2):
     print(f"⏱️  Live collection duration: {duration_minutes} minutes")
     print("=" * 50)
     
-    # Phase 1: Generate static context
+    # Phase 1: Generate static context (in-process, full + minimal from one build)
     print("\n📋 Phase 1: Generating static context...")
     try:
-        result = subprocess.run([
-            "python3", "src/data/static/static_info_generator.py", game_id
-        ], check=True, capture_output=True, text=True)
-        print(result.stdout)
-    except subprocess.CalledProcessError as e:
+        generator = get_static_info_generator()
+        full_context = generator.build_static_context(game_id)
+        minimal_context = LightStaticInfoGenerator.filter_to_two_teams(full_context)
+        generator.save_contexts(game_id, full_context, minimal_context)
+    except Exception as e:
         print(f"❌ Static context generation failed: {e}")
-        print(e.stderr)
         return False
     
     # Phase 2A: Collect live data  
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Live Collector Service - One asyncio process polling many NHL games
+Replaces one live_data_collector.py process per game: every game gets a
+LiveDataCollector, but they share one HTTP connection pool, one Gemini model
+and a small worker pool for the blocking fetch/enhance/save step. Each game
+has its own AdaptivePollingScheduler.
+
+CLI Usage:
+----------
+python3 src/data/live/collector_service.py <GAME_ID> [<GAME_ID> ...] \
+    --base_interval_seconds <SECONDS> \
+    --min_interval_seconds <SECONDS> \
+    --max_interval_seconds <SECONDS> \
+    --max_workers <N>
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from src.data.live.http_client import NHLApiClient
+from src.data.live.live_data_collector import LiveDataCollector
+from src.data.live.polling_scheduler import AdaptivePollingScheduler
+
+
+class LiveCollectorService:
+    """Schedules live polling for N games on one event loop"""
+
+    def __init__(self, game_ids: List[str], output_root: Optional[str] = None,
+                 activity_window_seconds: int = 30,
+                 base_interval_seconds: float = 15,
+                 min_interval_seconds: float = 3, max_interval_seconds: float = 300,
+                 max_workers: int = 4, incremental: bool = True):
+        self.game_ids = list(game_ids)
+        self.incremental = incremental
+
+        # Shared resources: one connection pool, one model, a fixed number of worker threads
+        self.http = NHLApiClient(pool_size=max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collector")
+        self.llm_model = self._setup_shared_llm()
+
+        self.collectors: Dict[str, LiveDataCollector] = {}
+        self.schedulers: Dict[str, AdaptivePollingScheduler] = {}
+        for game_id in self.game_ids:
+            output_dir = os.path.join(output_root, game_id) if output_root else None
+            self.collectors[game_id] = LiveDataCollector(
+                game_id=game_id,
+                output_dir=output_dir,
+                activity_window_seconds=activity_window_seconds,
+                http_client=self.http,
+                llm_model=self.llm_model
+            )
+            self.schedulers[game_id] = AdaptivePollingScheduler(
+                base_interval=base_interval_seconds,
+                min_interval=min_interval_seconds,
+                max_interval=max_interval_seconds
+            )
+
+        print(f"🛰️ Live Collector Service ready: {len(self.game_ids)} games, {max_workers} workers")
+
+    def _setup_shared_llm(self):
+        """Configure Gemini once for all games"""
+        api_key = os.getenv('GOOGLE_API_KEY')
+        if not api_key:
+            print("⚠️ GOOGLE_API_KEY environment variable not set. LLM features will be disabled.")
+            return None
+        try:
+            import google.generativeai as genai
+            genai.configure(api_key=api_key)
+            return genai.GenerativeModel("gemini-1.5-flash")
+        except Exception as e:
+            print(f"❌ LLM setup failed: {e}")
+            return None
+
+    async def _run_game(self, game_id: str):
+        """
+        Poll one game until it is final. The end marker is written however the loop ends,
+        so file watchers never wait on a game the service stopped polling (Ctrl-C, shutdown).
+        """
+        collector = self.collectors[game_id]
+        scheduler = self.schedulers[game_id]
+        loop = asyncio.get_running_loop()
+        reason = "aborted"
+        try:
+            while True:
+                try:
+                    result = await loop.run_in_executor(self.executor, collector.poll_once, self.incremental)
+                except Exception as e:
+                    print(f"❌ [{game_id}] Poll failed: {e}")
+                    result = {'status': 'error', 'changed': False, 'new_plays': 0, 'game_state': None}
+                if result['status'] == 'final':
+                    reason = "final"
+                    print(f"🏁 [{game_id}] Game finished after {scheduler.metrics['polls'] + 1} polls")
+                    return
+                interval = scheduler.next_interval(result, collector.event_log)
+                await asyncio.sleep(interval)
+        finally:
+            if reason == "aborted":
+                print(f"🛑 [{game_id}] Collection stopped before the game was final")
+            collector.mark_end_of_game(reason)
+
+    async def run(self):
+        """Poll every game until all of them are final"""
+        started = time.time()
+        try:
+            await asyncio.gather(*(self._run_game(game_id) for game_id in self.game_ids))
+        finally:
+            self.executor.shutdown(wait=False)
+            self.http.close()
+            print(f"\n🏁 Collector service finished in {time.time() - started:.0f}s")
+            print(f"   HTTP: {self.http.get_stats()}")
+            for game_id, scheduler in self.schedulers.items():
+                print(f"   [{game_id}] polling: {scheduler.get_metrics()}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'http': self.http.get_stats(),
+            'games': {game_id: scheduler.get_metrics() for game_id, scheduler in self.schedulers.items()}
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Poll several live NHL games from one process.")
+    parser.add_argument("game_ids", nargs='+')
+    parser.add_argument("--activity_window_seconds", type=int, default=30)
+    parser.add_argument("--base_interval_seconds", type=float, default=15)
+    parser.add_argument("--min_interval_seconds", type=float, default=3)
+    parser.add_argument("--max_interval_seconds", type=float, default=300)
+    parser.add_argument("--max_workers", type=int, default=4)
+    parser.add_argument("--full_rescan", action="store_true", help="Rebuild each event log from the whole play-by-play document every poll")
+    args = parser.parse_args()
+
+    service = LiveCollectorService(
+        args.game_ids,
+        activity_window_seconds=args.activity_window_seconds,
+        base_interval_seconds=args.base_interval_seconds,
+        min_interval_seconds=args.min_interval_seconds,
+        max_interval_seconds=args.max_interval_seconds,
+        max_workers=args.max_workers,
+        incremental=not args.full_rescan
+    )
+    try:
+        asyncio.run(service.run())
+    except KeyboardInterrupt:
+        print("\n🛑 Collection stopped.")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Game Event Log - Incremental, time-indexed in-memory store of play-by-play events
+Remembers the last seen eventId/sortOrder so each poll only appends new plays,
+and keeps a (period, elapsed-seconds) index so window queries are O(log n).
+Every play is also appended to a columnar EventTable (row == position in events);
+score and shot totals are reduced over its columns.
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Any, Optional, Tuple
+
+from src.data.live.event_table import EventTable
+
+SHOT_EVENT_TYPES = ('goal', 'shot-on-goal', 'save')
+
+
+class GameEventLog:
+    """Append-only event log for a single game, fed from successive play-by-play polls"""
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.home_team_id = None
+        self.away_team_id = None
+        self.reset()
+
+    def reset(self):
+        """Drop all events and the cursor (used to rebuild after upstream corrections)"""
+        self.events: List[Dict[str, Any]] = []
+        self.table = EventTable()
+        self.last_event_id = None
+        self.last_sort_order = -1
+        self._seen_event_ids = set()
+        # Time index: sorted (period, seconds, position)
+        self._index: List[Tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @staticmethod
+    def parse_key(play: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """Parse (period, elapsed seconds) from a play, None if it has no usable time"""
+        period = play.get('periodDescriptor', {}).get('number', 0)
+        time_str = play.get('timeInPeriod', '')
+        if not time_str:
+            return None
+        try:
+            m, s = map(int, time_str.split(':'))
+            return (period, (m * 60) + s)
+        except (ValueError, AttributeError):
+            return None
+
+    def ingest(self, pbp_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Append plays newer than the cursor and return them.
+        Plays arrive ordered by sortOrder, so we walk back from the end of the
+        document only until we reach the cursor instead of rescanning the game.
+        """
+        if self.home_team_id is None:
+            self.home_team_id = pbp_data.get('homeTeam', {}).get('id')
+            self.away_team_id = pbp_data.get('awayTeam', {}).get('id')
+
+        plays = pbp_data.get('plays', [])
+        start = len(plays)
+        while start > 0 and plays[start - 1].get('sortOrder', 0) > self.last_sort_order:
+            start -= 1
+
+        new_plays = []
+        for play in plays[start:]:
+            event_id = play.get('eventId')
+            if event_id in self._seen_event_ids:
+                continue
+            self._seen_event_ids.add(event_id)
+            self._append(play)
+            self.last_event_id = event_id
+            self.last_sort_order = max(self.last_sort_order, play.get('sortOrder', 0))
+            new_plays.append(play)
+        return new_plays
+
+    def _append(self, play: Dict[str, Any]):
+        position = len(self.events)
+        self.events.append(play)
+        self.table.append(play)
+        key = self.parse_key(play)
+        if key is None:
+            return
+        entry = (key[0], key[1], position)
+        if not self._index or entry >= self._index[-1]:
+            self._index.append(entry)
+        else:
+            insort(self._index, entry)  # Out-of-order play (late upstream insert)
+
+    def latest_event(self) -> Optional[Dict[str, Any]]:
+        return self.events[-1] if self.events else None
+
+    def range_rows(self, start_key: Tuple[int, int], end_key: Tuple[int, int]) -> List[int]:
+        """Positions (== table rows) of events with start_key <= (period, seconds) <= end_key, in time order"""
+        lo = bisect_left(self._index, (start_key[0], start_key[1], -1))
+        hi = bisect_right(self._index, (end_key[0], end_key[1], len(self.events)))
+        return [position for _, _, position in self._index[lo:hi]]
+
+    def range(self, start_key: Tuple[int, int], end_key: Tuple[int, int]) -> List[Dict[str, Any]]:
+        """Events with start_key <= (period, seconds) <= end_key, in time order"""
+        return [self.events[position] for position in self.range_rows(start_key, end_key)]
+
+    def window(self, period: int, end_seconds: int, window_seconds: int) -> List[Dict[str, Any]]:
+        """Events of `period` with elapsed time in [end - window, end]"""
+        return self.range((period, end_seconds - window_seconds), (period, end_seconds))
+
+    def team_stats_at(self, period: int, end_seconds: int) -> Optional[Dict[str, int]]:
+        """
+        Score and shots for each side up to (period, end_seconds), reduced over the event table columns.
+        Returns None when the team ids were not present in the play-by-play document.
+        """
+        if self.home_team_id is None or self.away_team_id is None:
+            return None
+        teams = (self.home_team_id, self.away_team_id)
+        rows = self.table.rows_until(period, end_seconds)
+        home_goals, away_goals = self.table.count_by_team(rows, ('goal',), teams)
+        home_shots, away_shots = self.table.count_by_team(rows, SHOT_EVENT_TYPES, teams)
+        return {
+            'home_score': home_goals,
+            'away_score': away_goals,
+            'home_shots': home_shots,
+            'away_shots': away_shots
+        }
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Event Table - Columnar (NumPy) representation of play-by-play events
+Keeps the fields the collector works on (eventId, period, seconds, type,
+team, coordinates, zone, player ids) as parallel arrays plus an interned
+string table, so enhancement runs over columns and the per-event dicts are
+only built once, when a snapshot is handed to the LLM / written to disk.
+"""
+from typing import Dict, List, Any, Optional, Callable
+
+import numpy as np
+
+PLAYER_FIELDS = ('attackingPlayerId', 'blockingPlayerId', 'committedByPlayerId', 'drawnByPlayerId',
+                 'goalieInNetId', 'hittingPlayerId', 'hitteePlayerId', 'losingPlayerId', 'playerId',
+                 'assist1PlayerId', 'assist2PlayerId', 'scoringPlayerId', 'shootingPlayerId', 'winningPlayerId')
+
+NO_ID = 0  # NHL event, team and player ids are positive
+NO_STRING = -1
+
+
+class StringTable:
+    """Interns strings to small integer codes"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self._codes[value] = code
+            self.strings.append(value)
+        return code
+
+    def code_of(self, value: str) -> int:
+        return self._codes.get(value, NO_STRING)
+
+    def lookup(self, code: int) -> Optional[str]:
+        return self.strings[code] if code != NO_STRING else None
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class EventTable:
+    """Append-only columnar store; row i is the i-th appended play"""
+
+    INT_COLUMNS = ('event_id', 'period', 'seconds', 'has_time', 'type_code', 'team_id', 'zone_code',
+                   'side_code', 'situation_code', 'time_remaining_code')
+    FLOAT_COLUMNS = ('x', 'y')
+
+    def __init__(self, capacity: int = 512):
+        self.strings = StringTable()
+        self.plays: List[Dict[str, Any]] = []  # Source dicts, only read when materializing
+        self._row_by_event_id: Dict[Any, int] = {}
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        for name in self.INT_COLUMNS:
+            self._columns[name] = np.zeros(capacity, dtype=np.int64)
+        for name in self.FLOAT_COLUMNS:
+            self._columns[name] = np.full(capacity, np.nan, dtype=np.float32)
+        self._players = np.zeros((capacity, len(PLAYER_FIELDS)), dtype=np.int64)
+        # Derived text per row (spatial, situation, time remaining), filled once per row in batches
+        self._descriptions: List[tuple] = []
+        self._describers = None
+
+    @classmethod
+    def from_plays(cls, plays: List[Dict[str, Any]]) -> "EventTable":
+        table = cls(capacity=max(len(plays), 1))
+        for play in plays:
+            table.append(play)
+        return table
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a column trimmed to the filled rows"""
+        return self._columns[name][:self._size]
+
+    @property
+    def player_ids(self) -> np.ndarray:
+        return self._players[:self._size]
+
+    def _grow(self):
+        capacity = len(self._columns['event_id']) * 2
+        for name, array in self._columns.items():
+            fill = np.nan if name in self.FLOAT_COLUMNS else 0
+            grown = np.full(capacity, fill, dtype=array.dtype)
+            grown[:self._size] = array[:self._size]
+            self._columns[name] = grown
+        players = np.zeros((capacity, len(PLAYER_FIELDS)), dtype=np.int64)
+        players[:self._size] = self._players[:self._size]
+        self._players = players
+
+    def append(self, play: Dict[str, Any]) -> int:
+        """Add one play and return its row"""
+        if self._size == len(self._columns['event_id']):
+            self._grow()
+        row = self._size
+        details = play.get('details') or {}
+        cols = self._columns
+        intern = self.strings.intern
+
+        cols['event_id'][row] = play.get('eventId') or NO_ID
+        cols['period'][row] = play.get('periodDescriptor', {}).get('number', 0)
+        seconds = _mmss_to_seconds(play.get('timeInPeriod'))
+        cols['seconds'][row] = seconds if seconds is not None else 0
+        cols['has_time'][row] = seconds is not None
+        cols['type_code'][row] = intern(play.get('typeDescKey'))
+        cols['team_id'][row] = details.get('eventOwnerTeamId') or NO_ID
+        cols['zone_code'][row] = intern(details.get('zoneCode') or None)
+        cols['side_code'][row] = intern(play.get('homeTeamDefendingSide', 'left'))
+        cols['situation_code'][row] = intern(play['situationCode']) if 'situationCode' in play else NO_STRING
+        cols['time_remaining_code'][row] = intern(play['timeRemaining']) if 'timeRemaining' in play else NO_STRING
+        x, y = details.get('xCoord'), details.get('yCoord')
+        cols['x'][row] = np.nan if x is None else x
+        cols['y'][row] = np.nan if y is None else y
+        for i, field in enumerate(PLAYER_FIELDS):
+            value = details.get(field)
+            self._players[row, i] = int(value) if value is not None else NO_ID
+
+        self.plays.append(play)
+        self._row_by_event_id[play.get('eventId')] = row
+        self._size += 1
+        return row
+
+    def rows_for(self, plays: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows of these exact play dicts, or None if any of them is not in the table"""
+        rows = []
+        for play in plays:
+            row = self._row_by_event_id.get(play.get('eventId'))
+            if row is None or self.plays[row] is not play:
+                return None
+            rows.append(row)
+        return np.asarray(rows, dtype=np.int64)
+
+    def rows_until(self, period: int, seconds: int) -> np.ndarray:
+        """Rows with a game time at or before (period, elapsed seconds)"""
+        periods, elapsed = self.column('period'), self.column('seconds')
+        before = (periods < period) | ((periods == period) & (elapsed <= seconds))
+        return np.flatnonzero(before & (self.column('has_time') != 0))
+
+    def count_by_team(self, rows: np.ndarray, type_names, team_ids) -> List[int]:
+        """Number of rows of the given event types owned by each team id"""
+        type_codes = [self.strings.code_of(name) for name in type_names]
+        cols = self._columns
+        teams = cols['team_id'][rows][np.isin(cols['type_code'][rows], type_codes)]
+        return [int(np.count_nonzero(teams == team_id)) for team_id in team_ids]
+
+    def event_ids(self, rows: np.ndarray) -> np.ndarray:
+        return self._columns['event_id'][rows]
+
+    def _describe_unique(self, codes: np.ndarray, fn: Callable[[str], Any]) -> Dict[int, Any]:
+        """Apply a string function once per distinct interned code"""
+        return {int(code): fn(self.strings.lookup(int(code))) for code in np.unique(codes) if code != NO_STRING}
+
+    def spatial_descriptions(self, rows: np.ndarray, spatial_batch_fn: Callable) -> List[Optional[str]]:
+        """
+        Spatial description per row (None when coordinates/zone are missing), from one
+        call to a batch converter taking (x, y, zone codes, defending sides) arrays.
+        """
+        strings = np.array(self.strings.strings + [None], dtype=object)  # interned code -1 picks the trailing None
+        cols = self._columns
+        return spatial_batch_fn(cols['x'][rows], cols['y'][rows],
+                                strings[cols['zone_code'][rows]], strings[cols['side_code'][rows]])
+
+    def materialize(self, rows: np.ndarray, player_name_fn: Callable[[int], Optional[str]],
+                    spatial_batch_fn: Callable, situation_fn: Callable, time_remaining_fn: Callable) -> List[Dict[str, Any]]:
+        """
+        Build enhanced activity dicts for `rows`, ordered by game time (period, then elapsed seconds).
+        Source plays are shallow-copied (their nested dicts are not mutated), so no deepcopy.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return []
+        rows = rows[np.lexsort((self._columns['seconds'][rows], self._columns['period'][rows]))]
+
+        # Player names: resolve each distinct id once for the whole batch
+        players = self._players[rows]
+        names = {}
+        for player_id in np.unique(players[players != NO_ID]):
+            name = player_name_fn(int(player_id))
+            if name:
+                names[int(player_id)] = name
+
+        self._describe_pending_rows(spatial_batch_fn, situation_fn, time_remaining_fn)
+
+        enhanced = []
+        for out_index, row in enumerate(rows):
+            play = self.plays[row]
+            activity = dict(play)
+            details = dict(play.get('details') or {})
+            activity['details'] = details
+            for field_index in np.flatnonzero(players[out_index]):
+                name = names.get(int(players[out_index, field_index]))
+                if name:
+                    details[PLAYER_FIELDS[field_index].replace('Id', 'Name')] = name
+            spatial, situation, remaining = self._descriptions[row]
+            if spatial is not None:
+                details['spatialDescription'] = spatial
+            if situation is not None:
+                activity['gameSituation'] = situation
+            if remaining is not None:
+                activity['timeRemainingFormatted'] = remaining
+            enhanced.append(activity)
+        return enhanced
+
+    def _describe_pending_rows(self, spatial_batch_fn: Callable, situation_fn: Callable, time_remaining_fn: Callable):
+        """
+        Describe every row appended since the last call in one batch.
+        A row's text never changes, so overlapping windows reuse it instead of recomputing.
+        """
+        describers = (spatial_batch_fn, situation_fn, time_remaining_fn)
+        if describers != self._describers:
+            self._describers = describers
+            self._descriptions = []
+        start = len(self._descriptions)
+        if start == self._size:
+            return
+        rows = np.arange(start, self._size)
+        spatial = self.spatial_descriptions(rows, spatial_batch_fn)
+        situation_codes = self._columns['situation_code'][rows]
+        remaining_codes = self._columns['time_remaining_code'][rows]
+        situations = self._describe_unique(situation_codes, situation_fn)
+        remaining = self._describe_unique(remaining_codes, time_remaining_fn)
+        for i in range(len(rows)):
+            self._descriptions.append((
+                spatial[i],
+                situations.get(int(situation_codes[i])),
+                remaining.get(int(remaining_codes[i]))
+            ))
+
+
+def _mmss_to_seconds(time_str: Optional[str]) -> Optional[int]:
+    try:
+        m, s = map(int, time_str.split(':'))
+        return (m * 60) + s
+    except (ValueError, AttributeError):
+        return None
+
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+NHL API HTTP Client - Pooled, cache-aware access to api-web.nhle.com
+One requests.Session per client (keep-alive connection pool), conditional GETs
+with ETag/Last-Modified, and a per-endpoint TTL cache so unchanged polls
+return a 304 and skip JSON parsing entirely.
+"""
+import json
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
+
+NHL_API_BASE_URL = "https://api-web.nhle.com/v1"
+
+# Seconds a cached response is served without contacting the API at all.
+# Play-by-play is always revalidated (cheap 304); slower-moving endpoints are held longer.
+DEFAULT_ENDPOINT_TTLS = {
+    'play-by-play': 0,
+    'boxscore': 30,
+    'landing': 30,
+    'standings': 3600,
+    'roster': 3600,
+}
+
+
+class NHLApiClient:
+    """Shared HTTP client for NHL api-web endpoints"""
+
+    def __init__(self, base_url: str = NHL_API_BASE_URL, timeout: float = 10,
+                 endpoint_ttls: Optional[Dict[str, float]] = None, pool_size: int = 10):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.endpoint_ttls = dict(DEFAULT_ENDPOINT_TTLS)
+        if endpoint_ttls:
+            self.endpoint_ttls.update(endpoint_ttls)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()  # Guards the cache and the counters; the client is shared across threads
+        self.stats = {'requests': 0, 'not_modified': 0, 'ttl_hits': 0, 'errors': 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Consistent copy of the request counters"""
+        with self._lock:
+            return dict(self.stats)
+
+    def _ttl_for(self, path: str) -> float:
+        endpoint = path.rstrip('/').rsplit('/', 1)[-1]
+        return self.endpoint_ttls.get(endpoint, 0)
+
+    def fetch_json(self, path: str, ttl: Optional[float] = None) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        GET base_url + path and return (data, changed).
+        `changed` is False when the data came from the TTL cache or a 304 revalidation,
+        so callers can skip any work that depends on new content.
+        Returns (None, False) on errors with nothing cached.
+        """
+        ttl = self._ttl_for(path) if ttl is None else ttl
+        with self._lock:
+            entry = self._cache.get(path)
+            if entry and ttl > 0 and (time.time() - entry['fetched_at']) < ttl:
+                self.stats['ttl_hits'] += 1
+                return entry['data'], False
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        url = f"{self.base_url}{path}"
+        try:
+            self._count('requests')
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and entry:
+                with self._lock:
+                    self.stats['not_modified'] += 1
+                    entry['fetched_at'] = time.time()
+                return entry['data'], False
+            response.raise_for_status()
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            self._count('errors')
+            print(f"❌ Error getting {url}: {e}")
+            return (entry['data'], False) if entry else (None, False)
+        except json.JSONDecodeError as e:
+            self._count('errors')
+            print(f"❌ Error decoding JSON from {url}: {e}")
+            return (entry['data'], False) if entry else (None, False)
+
+        with self._lock:
+            self._cache[path] = {
+                'data': data,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': time.time(),
+            }
+        return data, True
+
+    def get_json(self, path: str, ttl: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Like fetch_json, without the changed flag"""
+        return self.fetch_json(path, ttl)[0]
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop one cached path, or everything"""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(path, None)
+
+    def close(self):
+        self.session.close()
+
+
+_shared_client: Optional[NHLApiClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> NHLApiClient:
+    """Process-wide client so every collector reuses one connection pool"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = NHLApiClient()
+        return _shared_client
@@ -7,9 +7,11 @@ This script acts as a PRODUCER. It generates a data snapshot (JSON file)
 for a specific point in game time. It is stateless and intended to be run
 at each interval of a game, creating a data stream for a separate consumer agent.
 
-Can run in two modes:
+Can run in three modes:
 1. Simulation Mode: Replays a past game as if it were live.
 2. Live Mode: Fetches data for an ongoing game in real-time.
+3. Replay Mode: Generates every window snapshot of a past game in one pass,
+   without sleeping or per-snapshot LLM calls (for regression runs).
 
 CLI Usage:
 ----------
@@ -20,30 +22,71 @@ python3 src/data/live/live_data_collector.py simulate <GAME_ID> \
     --activity_window_seconds <SECONDS> \
     --real_time_delay_seconds <SECONDS>
 
+Replay Mode:
+python3 src/data/live/live_data_collector.py replay <GAME_ID> \
+    --game_duration_minutes <MINUTES> \
+    --fetch_interval_seconds <SECONDS> \
+    --describe {skip,batch} \
+    [--jsonl_output <PATH>]
+
 Live Mode:
 python3 src/data/live/live_data_collector.py live <GAME_ID> \
     --polling_interval_seconds <SECONDS> \
-    --activity_window_seconds <SECONDS>
+    --activity_window_seconds <SECONDS> \
+    [--full_rescan] [--fixed_interval]
+
+Live mode is incremental by default: only plays newer than the last seen
+sortOrder are appended to an in-memory event log, and windows are answered
+from that log. Pass --full_rescan to rebuild the log from the whole document
+every poll (picks up plays the feed corrects retroactively). Polling is adaptive
+(polling_scheduler.py): --polling_interval_seconds is the base interval during play,
+tightened for busy or late-game action and relaxed in intermissions and pre-game.
+
+Simulate and live modes skip windows whose eventId set matches the previous
+snapshot: instead of a new {GAME_ID}_*.json file (and a downstream agent run)
+they append a heartbeat record to heartbeat.jsonl. Pass --no_dedup to disable.
+
+Snapshots are written atomically (temp file + rename). When collection ends the
+collector writes end_of_game.json so file watchers know the stream is complete;
+in-process consumers can pass on_snapshot / on_end_of_game callbacks instead.
+
+All HTTP goes through a pooled NHLApiClient (http_client.py): play-by-play is
+revalidated with ETag/Last-Modified each poll, and a 304 skips both JSON
+parsing and event-log ingestion. Boxscore data is only fetched on demand.
 """
 import os
 import json
 import sys
+import hashlib
+import threading
 import time
-import requests
 import google.generativeai as genai
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-import copy
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import argparse
 
-# Assuming prompts.py and spatial_converter.py are in the same directory or accessible via PYTHONPATH
+# Project root, so running this file as a script imports the same package modules as the pipeline
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from src.data.live.event_log import GameEventLog
+from src.data.live.event_table import EventTable
+from src.data.static.roster_index import RosterIndex, get_roster_index
+from src.data.live.http_client import NHLApiClient, get_shared_client
+from src.data.live.polling_scheduler import AdaptivePollingScheduler
+
+END_OF_GAME_FILENAME = "end_of_game.json"  # Written when collection ends; does not match {game_id}_*.json
+HEARTBEAT_FILENAME = "heartbeat.jsonl"  # Unchanged polls; watchers treat appends as liveness
+
+# Description prompts and spatial helpers live next to this module
 try:
-    from prompts import DESCRIPTION_PROMPT
-    from spatial_converter import coords_to_hockey_language, get_game_situation, format_time_remaining
+    from src.data.live.prompts import DESCRIPTION_PROMPT, BATCH_DESCRIPTION_PROMPT
+    from src.data.live.spatial_converter import coords_to_hockey_language, describe_coords_batch, get_game_situation, format_time_remaining
 except ImportError:
     print("❌ Error: Ensure 'prompts.py' and 'spatial_converter.py' are in the correct path.")
     DESCRIPTION_PROMPT = "Describe the following hockey activities that happened at {game_time}: {activity_data}"
+    BATCH_DESCRIPTION_PROMPT = "Describe each of these hockey activity windows, returning a JSON array of strings: {windows_data}"
     def coords_to_hockey_language(x, y, zone, home_side): return f"Location: {zone} ({x},{y})"
+    def describe_coords_batch(xs, ys, zones, sides):
+        return [coords_to_hockey_language(x, y, z, s) if z and x == x and y == y else None for x, y, z, s in zip(xs, ys, zones, sides)]
     def get_game_situation(code): return f"Situation: {code}"
     def format_time_remaining(time_str): return time_str
 
@@ -53,7 +96,12 @@ class LiveDataCollector:
     
     def __init__(self, game_id: str, output_dir: str = None, 
                  activity_window_seconds: int = 30,
-                 fetch_interval_seconds: int = 5):
+                 fetch_interval_seconds: int = 5,
+                 http_client: Optional[NHLApiClient] = None,
+                 llm_model: Optional[Any] = None,
+                 dedup_snapshots: bool = True,
+                 on_snapshot: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 on_end_of_game: Optional[Callable[[], None]] = None):
         self.game_id = game_id
         
         if output_dir is None:
@@ -67,15 +115,31 @@ class LiveDataCollector:
         else:
             self.output_dir = output_dir
         
-        self.base_url = "https://api-web.nhle.com/v1"
+        self.http = http_client or get_shared_client()
+        self.base_url = self.http.base_url
         self.static_context = None
-        self.player_lookup = {}
+        self.roster_index = RosterIndex()
+        self.event_log = GameEventLog(game_id)
+        # Guards event_log/table: in-process consumers read enhanced ranges from another thread
+        self._event_log_lock = threading.RLock()
+        self.dedup_snapshots = dedup_snapshots
+        self._last_window_hash = None
+        self.snapshot_stats = {'snapshots': 0, 'heartbeats': 0}
+        # In-process consumers (e.g. the pipeline's queue) are notified as soon as a snapshot is on disk
+        self.on_snapshot = on_snapshot
+        self.on_end_of_game = on_end_of_game
         os.makedirs(self.output_dir, exist_ok=True)
+        stale_marker = os.path.join(self.output_dir, END_OF_GAME_FILENAME)
+        if os.path.exists(stale_marker):
+            os.remove(stale_marker)
 
         self.activity_window_seconds = activity_window_seconds
         self.fetch_interval_seconds = fetch_interval_seconds
         
-        self._setup_llm()
+        if llm_model is not None:
+            self.model = llm_model  # Shared model from the multi-game service
+        else:
+            self._setup_llm()
         self._load_static_context()
         
         print(f"🏒 Live Data Collector Initialized for Game {game_id}")
@@ -109,30 +173,21 @@ class LiveDataCollector:
             if os.path.exists(static_file):
                 with open(static_file, 'r') as f:
                     self.static_context = json.load(f)
-                self._build_player_lookup()
+                self._build_roster_index()
                 print(f"✅ Static context loaded from: {static_file}")
             else:
                 print(f"⚠️ No static context found at {static_file} - running without detailed player names from static file.")
         except Exception as e:
             print(f"⚠️ Could not load static context: {e}")
 
-    def _build_player_lookup(self):
-        """Build fast lookup for player names"""
+    def _build_roster_index(self):
+        """Build the shared int-keyed roster index for player names"""
         if not self.static_context or 'rosters' not in self.static_context:
             print("ℹ️ Static context does not contain roster information. Player name enhancement will rely on boxscore if available.")
             return
-        rosters = self.static_context['rosters']
-        for team_key, players_list_key in [('home', 'home_players'), ('away', 'away_players')]:
-            for player in rosters.get(players_list_key, []):
-                player_id = str(player.get('player_id', ''))
-                if player_id:
-                    self.player_lookup[player_id] = {
-                        'name': player.get('name', 'Unknown Player'),
-                        'position': player.get('position', 'N/A'),
-                        'team': team_key
-                    }
-        if self.player_lookup:
-            print(f"ℹ️ Built player lookup table with {len(self.player_lookup)} players from static context.")
+        self.roster_index = get_roster_index(self.static_context)
+        if len(self.roster_index):
+            print(f"ℹ️ Built roster index with {len(self.roster_index)} player ids from static context.")
 
     def _time_str_to_seconds(self, time_str: str) -> int:
         """Converts MM:SS string to total seconds."""
@@ -167,99 +222,52 @@ class LiveDataCollector:
                     context['game_state'] = "LIVE"
         return context
 
+    def _fetch_play_by_play(self) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Fetch play-by-play with a conditional GET; returns (data, changed since last fetch)"""
+        return self.http.fetch_json(f"/gamecenter/{self.game_id}/play-by-play")
+
     def _get_play_by_play(self) -> Optional[Dict[str, Any]]:
         """Fetch all play-by-play data from NHL API"""
-        try:
-            url = f"{self.base_url}/gamecenter/{self.game_id}/play-by-play"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error getting play-by-play from {url}: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            print(f"❌ Error decoding JSON from play-by-play response: {e}")
-            return None
+        return self._fetch_play_by_play()[0]
 
-    def _filter_activities(self, pbp_data: Dict[str, Any], current_game_time_str: str) -> List[Dict]:
-        """Filter activities by time window."""
+    @staticmethod
+    def _parse_game_time(current_game_time_str: str) -> Optional[Tuple[int, int]]:
+        """Parse "P:MM:SS" into (period, elapsed seconds in period)."""
         try:
             period_str, time_in_period_str = current_game_time_str.split(':', 1)
-            current_period_num = int(period_str)
-            current_minutes, current_seconds_val = map(int, time_in_period_str.split(':'))
-            current_total_seconds_in_period_elapsed = (current_minutes * 60) + current_seconds_val
+            minutes, seconds = map(int, time_in_period_str.split(':'))
+            return int(period_str), (minutes * 60) + seconds
         except ValueError:
-            return []
-        
-        activities = []
-        for play in pbp_data.get('plays', []):
-            play_period = play.get('periodDescriptor', {}).get('number', 0)
-            if play_period != current_period_num:
-                continue
-            
-            play_time_in_period_str = play.get('timeInPeriod', '')
-            if not play_time_in_period_str: continue
-            
-            try:
-                play_min, play_sec = map(int, play_time_in_period_str.split(':'))
-                play_total_seconds_elapsed = (play_min * 60) + play_sec
-                
-                if play_total_seconds_elapsed > current_total_seconds_in_period_elapsed:
-                    continue
-                
-                time_difference_seconds = current_total_seconds_in_period_elapsed - play_total_seconds_elapsed
-                if 0 <= time_difference_seconds <= self.activity_window_seconds:
-                    activities.append(play)
-            except (ValueError, AttributeError):
-                continue
-        return activities
+            return None
+
+    def _filter_activities(self, pbp_data: Dict[str, Any], current_game_time_str: str) -> List[Dict]:
+        """Filter activities by time window, via the time-indexed event log."""
+        with self._event_log_lock:
+            self.event_log.ingest(pbp_data)
+            return self._filter_activities_from_log(current_game_time_str)
 
     def _get_boxscore(self) -> Optional[Dict[str, Any]]:
-        """Fetch boxscore data for enhancement."""
-        try:
-            url = f"{self.base_url}/gamecenter/{self.game_id}/boxscore"
-            response = requests.get(url, timeout=10) 
-            response.raise_for_status()
-            return response.json()
-        except (requests.exceptions.RequestException, json.JSONDecodeError):
-            return None
+        """Fetch boxscore data on demand (TTL-cached and revalidated by the HTTP client)."""
+        return self.http.get_json(f"/gamecenter/{self.game_id}/boxscore")
 
-    def _enhance_activities(self, activities: List[Dict]) -> List[Dict]:
-        """Add player names, spatial context, and basic stats to activities."""
-        enhanced_activities = []
-        boxscore_data = self._get_boxscore() 
-        
-        for activity in activities:
-            enhanced_activity = copy.deepcopy(activity) 
-            details = enhanced_activity.get('details', {})
-            if not details: enhanced_activity['details'] = details = {}
-
-            player_fields = ['attackingPlayerId', 'blockingPlayerId', 'committedByPlayerId', 'drawnByPlayerId', 'goalieInNetId', 'hittingPlayerId', 'hitteePlayerId', 'losingPlayerId', 'playerId', 'assist1PlayerId', 'assist2PlayerId', 'shootingPlayerId', 'winningPlayerId']
-            for field in player_fields:
-                if field in details and details[field] is not None:
-                    player_id_val = str(details[field])
-                    if player_id_val in self.player_lookup:
-                        player_info = self.player_lookup[player_id_val]
-                        details[field.replace('Id', 'Name')] = f"{player_info['name']} ({player_info['team']})"
-
-            x, y, zone = details.get('xCoord'), details.get('yCoord'), details.get('zoneCode')
-            home_side = enhanced_activity.get('homeTeamDefendingSide', 'left')
-            if x is not None and y is not None and zone:
-                details['spatialDescription'] = coords_to_hockey_language(x, y, zone, home_side)
-            
-            if 'situationCode' in enhanced_activity:
-                enhanced_activity['gameSituation'] = get_game_situation(enhanced_activity['situationCode'])
-            if 'timeRemaining' in enhanced_activity:
-                enhanced_activity['timeRemainingFormatted'] = format_time_remaining(enhanced_activity['timeRemaining'])
+    def _enhance_activities(self, activities: List[Dict], current_game_time_str: Optional[str] = None) -> List[Dict]:
+        """
+        Add player names, spatial context, and basic stats to activities.
+        Runs over the event log's columnar table (ad hoc table for plays not in the log);
+        the returned dicts are the only per-event dicts built for the snapshot.
+        """
+        with self._event_log_lock:
+            table = self.event_log.table
+            rows = table.rows_for(activities)
+            if rows is None:
+                table = EventTable.from_plays(activities)
+                rows = range(len(activities))
 
             # Removed: boxscore injection that caused data leakage
-            
-            enhanced_activities.append(enhanced_activity)
-        
-        enhanced_activities.sort(key=self._get_time_seconds_from_play_time_in_period)
-        
-        # Calculate progressive game stats from filtered activities (fixes data leakage)
-        progressive_stats = self._calculate_progressive_stats(enhanced_activities)
+            enhanced_activities = self._materialize(table, rows)
+
+            # Calculate progressive game stats from filtered activities (fixes data leakage)
+            progressive_stats = self._calculate_progressive_stats(enhanced_activities, current_game_time_str)
         
         # Apply progressive stats to all activities
         for activity in enhanced_activities:
@@ -267,8 +275,28 @@ class LiveDataCollector:
         
         return enhanced_activities
     
-    def _calculate_progressive_stats(self, activities: List[Dict]) -> Dict:
-        """Calculate progressive game stats from time-filtered activities only (prevents data leakage)."""
+    def _materialize(self, table: EventTable, rows) -> List[Dict]:
+        return table.materialize(
+            rows, self.roster_index.labelled_name,
+            spatial_batch_fn=describe_coords_batch,
+            situation_fn=get_game_situation,
+            time_remaining_fn=format_time_remaining
+        )
+
+    def enhanced_range(self, start_key: Tuple[int, int], end_key: Tuple[int, int]) -> List[Dict]:
+        """
+        Enhanced activities (player names, game situation) with start_key <= (period, seconds) <= end_key,
+        read from the event log index. Safe to call from another thread while the collector runs.
+        """
+        with self._event_log_lock:
+            return self._materialize(self.event_log.table, self.event_log.range_rows(start_key, end_key))
+
+    def _calculate_progressive_stats(self, activities: List[Dict], current_game_time_str: Optional[str] = None) -> Dict:
+        """
+        Calculate progressive game stats up to the current game time only (prevents data leakage).
+        Reads the event log's running counters when team ids are known, otherwise
+        falls back to counting the time-filtered activities.
+        """
         # Initialize counters
         away_score = home_score = away_shots = home_shots = 0
         away_team_name = "AWAY"  # Default fallback
@@ -280,6 +308,25 @@ class LiveDataCollector:
             away_team_name = game_info.get('away_team', 'AWAY')
             home_team_name = game_info.get('home_team', 'HOME')
         
+        game_time = self._parse_game_time(current_game_time_str) if current_game_time_str else None
+        indexed_stats = self.event_log.team_stats_at(*game_time) if game_time else None
+        if indexed_stats is not None:
+            return {
+                'teamStats': {
+                    'away': {
+                        'teamName': away_team_name,
+                        'score': indexed_stats['away_score'],
+                        'sog': indexed_stats['away_shots']
+                    },
+                    'home': {
+                        'teamName': home_team_name,
+                        'score': indexed_stats['home_score'],
+                        'sog': indexed_stats['home_shots']
+                    }
+                },
+                'playerStats': {}
+            }
+        
         # Dynamically determine team IDs from actual event data
         away_team_id = None
         home_team_id = None
@@ -397,13 +444,64 @@ class LiveDataCollector:
         except Exception as e:
             return self._get_fallback_description(len(activities))
 
+    def _generate_batch_descriptions(self, snapshots: List[Dict], batch_size: int = 20) -> List[str]:
+        """Describe many windows with one LLM call per batch instead of one call per snapshot."""
+        descriptions = []
+        for start in range(0, len(snapshots), batch_size):
+            batch = snapshots[start:start + batch_size]
+            fallbacks = [self._get_fallback_description(snap['activity_count']) for snap in batch]
+            if not self.model:
+                descriptions.extend(fallbacks)
+                continue
+            try:
+                windows = [{
+                    "game_time": snap['game_time'],
+                    "activities": [
+                        {"type": act.get("typeDescKey", "unknown_event"), "timeInPeriod": act.get("timeInPeriod")}
+                        for act in snap['activities']
+                    ]
+                } for snap in batch]
+                prompt_str = BATCH_DESCRIPTION_PROMPT.replace('{windows_data}', json.dumps(windows, ensure_ascii=False))
+                response = self.model.generate_content(prompt_str)
+                text = response.text.strip().replace('```json', '').replace('```', '').strip()
+                parsed = json.loads(text)
+                if not isinstance(parsed, list) or len(parsed) != len(batch):
+                    raise ValueError(f"expected {len(batch)} descriptions, got {len(parsed) if isinstance(parsed, list) else type(parsed).__name__}")
+                descriptions.extend(str(d).strip() for d in parsed)
+            except Exception as e:
+                print(f"⚠️ Batch description failed for windows {start}-{start + len(batch) - 1}: {e}")
+                descriptions.extend(fallbacks)
+        return descriptions
+
     def _get_fallback_description(self, activity_count: int) -> str:
         if activity_count == 0: return "No significant events in the window."
         else: return f"A sequence of {activity_count} plays occurred."
 
-    def _save_data(self, activities: List[Dict], description: str, current_game_time_str: str, activity_count: int) -> str:
-        """Save flow data to JSON file"""
-        data = {
+    @staticmethod
+    def _window_content_hash(activities: List[Dict]) -> str:
+        """Hash of the set of eventIds in a window; equal hashes mean an identical snapshot"""
+        event_ids = sorted(str(activity.get('eventId')) for activity in activities)
+        return hashlib.sha1(",".join(event_ids).encode('utf-8')).hexdigest()
+
+    def _save_heartbeat(self, current_game_time_str: str, content_hash: str, game_state: Optional[str]) -> str:
+        """Append a lightweight record to heartbeat.jsonl instead of writing an unchanged snapshot"""
+        record = {
+            'game_id': self.game_id,
+            'game_time': current_game_time_str,
+            'collected_at_utc': datetime.utcnow().isoformat() + "Z",
+            'game_state': game_state,
+            'content_hash': content_hash,
+            'type': 'heartbeat'
+        }
+        filepath = os.path.join(self.output_dir, HEARTBEAT_FILENAME)
+        with open(filepath, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+        return filepath
+
+    def _build_snapshot(self, activities: List[Dict], description: Optional[str], current_game_time_str: str, activity_count: int,
+                        content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Build the snapshot record written for each window"""
+        return {
             'game_id': self.game_id,
             'game_time': current_game_time_str,
             'collected_at_utc': datetime.utcnow().isoformat() + "Z",
@@ -411,16 +509,45 @@ class LiveDataCollector:
             'fetch_interval_seconds': self.fetch_interval_seconds,
             'activities': activities,
             'llm_description': description,
-            'activity_count': activity_count
+            'activity_count': activity_count,
+            'content_hash': content_hash if content_hash is not None else self._window_content_hash(activities)
         }
+
+    def _save_data(self, activities: List[Dict], description: str, current_game_time_str: str, activity_count: int,
+                   content_hash: Optional[str] = None) -> str:
+        """Save flow data to JSON file"""
+        return self._save_snapshot(self._build_snapshot(activities, description, current_game_time_str, activity_count, content_hash))
+
+    def _save_snapshot(self, data: Dict[str, Any]) -> str:
+        """Write a snapshot record to its per-window JSON file"""
+        current_game_time_str = data['game_time']
         filename = f"{self.game_id}_{current_game_time_str.replace(':', '_')}.json"
         filepath = os.path.join(self.output_dir, filename)
+        # Write to a hidden temp file and rename, so watchers never see a half-written snapshot
+        tmp_path = os.path.join(self.output_dir, f".{filename}.tmp")
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            return filepath
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, filepath)
         except IOError as e:
             return ""
+        if self.on_snapshot:
+            self.on_snapshot(filepath, data)
+        return filepath
+
+    def mark_end_of_game(self, reason: str = "final"):
+        """
+        Tell consumers no more snapshots are coming: callback in-process, marker file otherwise.
+        reason is "final" for a finished game, "aborted" when collection stopped before it.
+        """
+        marker = {'game_id': self.game_id, 'reason': reason,
+                  'finished_at_utc': datetime.utcnow().isoformat() + "Z", **self.snapshot_stats}
+        tmp_path = os.path.join(self.output_dir, f".{END_OF_GAME_FILENAME}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(marker, f)
+        os.replace(tmp_path, os.path.join(self.output_dir, END_OF_GAME_FILENAME))
+        if self.on_end_of_game:
+            self.on_end_of_game()
 
     @staticmethod
     def _get_time_seconds_from_play_time_in_period(activity: Dict) -> int:
@@ -431,79 +558,197 @@ class LiveDataCollector:
         except (ValueError, AttributeError):
             return 0
 
-    def _process_current_snapshot(self, pbp_data: Dict, current_game_context: Dict):
+    def _filter_activities_from_log(self, current_game_time_str: str) -> List[Dict]:
+        """Answer the activity window from the event log's (period, seconds) index."""
+        game_time = self._parse_game_time(current_game_time_str)
+        if game_time is None:
+            return []
+        period, elapsed_seconds = game_time
+        with self._event_log_lock:
+            return self.event_log.window(period, elapsed_seconds, self.activity_window_seconds)
+
+    def _process_current_snapshot(self, pbp_data: Dict, current_game_context: Dict, activities: Optional[List[Dict]] = None):
         """
-        Stateless processing for a single PBP snapshot.
-        This function ALWAYS generates and saves a file.
+        Processing for a single PBP snapshot.
+        Writes a full snapshot file when the window's eventId set changed since the last one,
+        otherwise (with dedup_snapshots) only a heartbeat record, so downstream agents are not
+        re-run on an identical window.
+        Pass pre-filtered `activities` (e.g. from the event log) to skip the full-document filter.
+        Returns True when a full snapshot was written.
         """
         current_game_time_str = current_game_context['current_game_time_str']
         print(f"\nProcessing for game time approx. {current_game_time_str} (State: {current_game_context['game_state']})")
 
-        activities = self._filter_activities(pbp_data, current_game_time_str)
-        enhanced_activities = self._enhance_activities(activities)
+        if activities is None:
+            activities = self._filter_activities(pbp_data, current_game_time_str)
+
+        content_hash = self._window_content_hash(activities)
+        if self.dedup_snapshots and content_hash == self._last_window_hash:
+            self._save_heartbeat(current_game_time_str, content_hash, current_game_context.get('game_state'))
+            self.snapshot_stats['heartbeats'] += 1
+            print(f"💓 Window unchanged at {current_game_time_str} - heartbeat only")
+            return False
+        self._last_window_hash = content_hash
+
+        enhanced_activities = self._enhance_activities(activities, current_game_time_str)
         description = self._generate_flow_commentary(enhanced_activities, current_game_time_str)
         
-        filepath = self._save_data(enhanced_activities, description, current_game_time_str, len(enhanced_activities))
+        filepath = self._save_data(enhanced_activities, description, current_game_time_str, len(enhanced_activities), content_hash)
+        self.snapshot_stats['snapshots'] += 1
         print(f"✅ Data saved for {current_game_time_str} to {os.path.basename(filepath)}")
+        return True
 
-    def start_simulation_collection(self, game_duration_minutes: float = 3.0, real_time_delay_seconds: float = 0.5):
-        """Start game-time simulation."""
-        print(f"\n🚀 Starting SIMULATION for {game_duration_minutes} game minutes...")
-        full_pbp_data = self._get_play_by_play()
-        if not full_pbp_data: return
-
+    def _simulation_times(self, game_duration_minutes: float):
+        """Yield "P:MM:SS" game times every fetch interval up to the requested duration."""
         total_simulated_game_seconds = 0
         end_seconds = game_duration_minutes * 60
         while total_simulated_game_seconds < end_seconds:
             period = (total_simulated_game_seconds // 1200) + 1
             seconds_in_period = total_simulated_game_seconds % 1200
             m, s = divmod(seconds_in_period, 60)
-            current_sim_time = f"{period}:{m:02d}:{s:02d}"
-            
-            self._process_current_snapshot(full_pbp_data, {'current_game_time_str': current_sim_time, 'game_state': 'LIVE'})
-            
+            yield f"{period}:{m:02d}:{s:02d}"
             total_simulated_game_seconds += self.fetch_interval_seconds
-            time.sleep(real_time_delay_seconds)
-        print("\n🏁 Simulation finished.")
 
-    def start_true_live_collection(self, polling_interval_seconds: int = 15):
-        """Start true live collection."""
+    def start_simulation_collection(self, game_duration_minutes: float = 3.0, real_time_delay_seconds: float = 0.5):
+        """Start game-time simulation."""
+        print(f"\n🚀 Starting SIMULATION for {game_duration_minutes} game minutes...")
+        try:
+            full_pbp_data = self._get_play_by_play()
+            if not full_pbp_data: return
+
+            for current_sim_time in self._simulation_times(game_duration_minutes):
+                self._process_current_snapshot(full_pbp_data, {'current_game_time_str': current_sim_time, 'game_state': 'LIVE'})
+                time.sleep(real_time_delay_seconds)
+            print(f"\n🏁 Simulation finished. {self.snapshot_stats['snapshots']} snapshots, {self.snapshot_stats['heartbeats']} heartbeats.")
+        finally:
+            self.mark_end_of_game()
+
+    def start_fast_replay(self, game_duration_minutes: float = 60.0, describe: str = "skip",
+                          jsonl_path: Optional[str] = None, pbp_data: Optional[Dict] = None) -> List[Dict]:
+        """
+        Generate every window snapshot for a past game in one pass.
+        No sleeping and no per-snapshot LLM call: descriptions are either skipped
+        (deterministic fallback text) or generated in batches after all windows are built.
+        Writes a single JSONL stream when jsonl_path is given, per-window files otherwise.
+        """
+        if describe not in ("skip", "batch"):
+            raise ValueError(f"describe must be 'skip' or 'batch', got {describe!r}")
+        print(f"\n⏩ Starting FAST REPLAY for {game_duration_minutes} game minutes (descriptions: {describe})...")
+        started = time.time()
+        full_pbp_data = pbp_data or self._get_play_by_play()
+        if not full_pbp_data: return []
+
+        snapshots = []
+        for current_sim_time in self._simulation_times(game_duration_minutes):
+            activities = self._filter_activities(full_pbp_data, current_sim_time)
+            enhanced_activities = self._enhance_activities(activities, current_sim_time)
+            snapshots.append(self._build_snapshot(enhanced_activities, None, current_sim_time, len(enhanced_activities)))
+
+        if describe == "batch":
+            descriptions = self._generate_batch_descriptions(snapshots)
+        else:
+            descriptions = [self._get_fallback_description(snap['activity_count']) for snap in snapshots]
+        for snap, description in zip(snapshots, descriptions):
+            snap['llm_description'] = description
+
+        if jsonl_path:
+            os.makedirs(os.path.dirname(os.path.abspath(jsonl_path)), exist_ok=True)
+            with open(jsonl_path, 'w', encoding='utf-8') as f:
+                for snap in snapshots:
+                    f.write(json.dumps(snap, ensure_ascii=False) + "\n")
+            print(f"✅ {len(snapshots)} snapshots written to {jsonl_path}")
+        else:
+            for snap in snapshots:
+                self._save_snapshot(snap)
+            self.mark_end_of_game()
+            print(f"✅ {len(snapshots)} snapshots written to {self.output_dir}")
+
+        print(f"🏁 Fast replay finished in {time.time() - started:.2f}s.")
+        return snapshots
+
+    def poll_once(self, incremental: bool = True) -> Dict[str, Any]:
+        """
+        One live poll: fetch, ingest new plays and write the current snapshot.
+        Returns a small status dict so a caller (this loop or the multi-game
+        service) can decide when to poll next.
+        """
+        pbp_data, changed = self._fetch_play_by_play()
+        if not pbp_data:
+            return {'status': 'error', 'changed': False, 'new_plays': 0, 'game_state': None, 'pbp_data': None}
+
+        current_game_context = self._get_current_game_context_from_pbp(pbp_data)
+        game_state = current_game_context.get('game_state')
+        if game_state in ["FINAL", "OFF"]:
+            return {'status': 'final', 'changed': changed, 'new_plays': 0, 'game_state': game_state, 'pbp_data': pbp_data}
+
+        with self._event_log_lock:
+            if not incremental:
+                self.event_log.reset()  # Rebuild the log from the full document (picks up upstream corrections)
+            if changed or not incremental:
+                new_plays = self.event_log.ingest(pbp_data)
+            else:
+                new_plays = []  # 304 Not Modified: nothing new to parse or ingest
+        print(f"📥 [{self.game_id}] {len(new_plays)} new plays ({len(self.event_log)} in log, last sortOrder {self.event_log.last_sort_order})")
+        activities = self._filter_activities_from_log(current_game_context['current_game_time_str'])
+        wrote_snapshot = self._process_current_snapshot(pbp_data, current_game_context, activities)
+        return {'status': 'processed' if wrote_snapshot else 'heartbeat', 'changed': changed, 'new_plays': len(new_plays), 'game_state': game_state, 'pbp_data': pbp_data}
+
+    def start_true_live_collection(self, polling_interval_seconds: int = 15, incremental: bool = True, adaptive: bool = True):
+        """
+        Start true live collection.
+        With adaptive=True, polling_interval_seconds is the base interval during normal play
+        and the scheduler tightens or backs off from it; otherwise every poll waits exactly that long.
+        """
         print(f"\n🚀 Starting TRUE LIVE collection for Game ID: {self.game_id}")
+        if incremental:
+            print("   Incremental mode: appending new plays to the event log each poll")
+        scheduler = AdaptivePollingScheduler(base_interval=polling_interval_seconds) if adaptive else None
+        final = False
         try:
             while True:
-                pbp_data = self._get_play_by_play()
-                if not pbp_data:
-                    time.sleep(polling_interval_seconds)
-                    continue
-                
-                current_game_context = self._get_current_game_context_from_pbp(pbp_data)
-                if current_game_context.get('game_state') in ["FINAL", "OFF"]: break
-                
-                self._process_current_snapshot(pbp_data, current_game_context)
-                
-                time.sleep(polling_interval_seconds)
+                result = self.poll_once(incremental)
+                if result['status'] == 'final':
+                    final = True
+                    break
+                if scheduler:
+                    interval = scheduler.next_interval(result, self.event_log)
+                    print(f"⏱️ Next poll in {interval:.0f}s ({scheduler.last_decision['reason']})")
+                else:
+                    interval = polling_interval_seconds
+                time.sleep(interval)
         except KeyboardInterrupt:
             print("\n🛑 Collection stopped.")
         finally:
+            if scheduler:
+                print(f"📊 Polling metrics: {scheduler.get_metrics()}")
+            self.mark_end_of_game("final" if final else "aborted")
             print("\n🏁 Collection process finished.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="NHL Live Data Collector for flow-descriptive commentary.")
-    parser.add_argument("mode", choices=['simulate', 'live'])
+    parser.add_argument("mode", choices=['simulate', 'live', 'replay'])
     parser.add_argument("game_id")
     parser.add_argument("--activity_window_seconds", type=int, default=30)
     parser.add_argument("--game_duration_minutes", type=float, default=3.0)
     parser.add_argument("--fetch_interval_seconds", type=int, default=5)
     parser.add_argument("--real_time_delay_seconds", type=float, default=0.5)
     parser.add_argument("--polling_interval_seconds", type=int, default=15)
+    parser.add_argument("--fixed_interval", action="store_true", help="Live mode: poll at exactly --polling_interval_seconds instead of adapting to game state")
+    parser.add_argument("--full_rescan", action="store_true", help="Live mode: rebuild the event log from the whole play-by-play document every poll")
+    parser.add_argument("--no_dedup", action="store_true", help="Write a full snapshot even when the window's events did not change")
+    parser.add_argument("--describe", choices=['skip', 'batch'], default='skip', help="Replay mode: skip descriptions or batch them after all windows are built")
+    parser.add_argument("--jsonl_output", default=None, help="Replay mode: write all snapshots to this single JSONL file")
     args = parser.parse_args()
 
     collector = LiveDataCollector(
         game_id=args.game_id,
         activity_window_seconds=args.activity_window_seconds,
-        fetch_interval_seconds=args.fetch_interval_seconds
+        fetch_interval_seconds=args.fetch_interval_seconds,
+        dedup_snapshots=not args.no_dedup
     )
     if args.mode == 'simulate':
         collector.start_simulation_collection(args.game_duration_minutes, args.real_time_delay_seconds)
+    elif args.mode == 'replay':
+        collector.start_fast_replay(args.game_duration_minutes, args.describe, args.jsonl_output)
     elif args.mode == 'live':
-        collector.start_true_live_collection(args.polling_interval_seconds)
\ No newline at end of file
+        collector.start_true_live_collection(args.polling_interval_seconds, incremental=not args.full_rescan, adaptive=not args.fixed_interval)
\ No newline at end of file
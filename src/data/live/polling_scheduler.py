@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Adaptive Polling Scheduler - Picks the next live poll interval for one game
+Uses gameState, the clock/intermission flags and period boundaries from the
+play-by-play document plus recent event density from the event log: tight
+polling during busy play, backing off in intermissions, stoppages and pre-game.
+"""
+import time
+from collections import Counter
+from typing import Dict, Any, Optional
+
+PREGAME_STATES = ("FUT", "PRE")
+FINAL_STATES = ("FINAL", "OFF")
+BUSY_EVENT_TYPES = ('goal', 'shot-on-goal', 'missed-shot', 'blocked-shot', 'penalty')
+
+
+class AdaptivePollingScheduler:
+    """Chooses poll intervals for one game and keeps metrics on its decisions"""
+
+    def __init__(self, base_interval: float = 15, min_interval: float = 3, max_interval: float = 300,
+                 pregame_interval: float = 120, intermission_interval: float = 60,
+                 stoppage_interval: Optional[float] = None,
+                 density_window_seconds: int = 60, busy_event_threshold: int = 4):
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.pregame_interval = pregame_interval
+        self.intermission_interval = intermission_interval
+        self.stoppage_interval = stoppage_interval if stoppage_interval is not None else base_interval * 2
+        self.density_window_seconds = density_window_seconds
+        self.busy_event_threshold = busy_event_threshold
+
+        self.idle_polls = 0
+        self.last_decision: Dict[str, Any] = {}
+        self._last_poll_at: Optional[float] = None
+        self.metrics = {
+            'polls': 0,
+            'wasted_polls': 0,
+            'errors': 0,
+            'reasons': Counter(),
+            'total_interval_seconds': 0.0,
+            'max_detection_gap_seconds': 0.0,  # Worst wall-clock gap between a poll and the one that found new plays
+        }
+
+    def _event_density(self, event_log) -> int:
+        """Busy events (shots, goals, penalties) in the last density window of game time"""
+        if event_log is None:
+            return 0
+        latest = event_log.latest_event()
+        key = event_log.parse_key(latest) if latest else None
+        if key is None:
+            return 0
+        period, seconds = key
+        recent = event_log.window(period, seconds, self.density_window_seconds)
+        return sum(1 for play in recent if play.get('typeDescKey') in BUSY_EVENT_TYPES)
+
+    def _decide(self, result: Dict[str, Any], event_log) -> Dict[str, Any]:
+        if result['status'] == 'error':
+            self.metrics['errors'] += 1
+            previous = self.last_decision.get('interval', self.base_interval)
+            return {'reason': 'error_backoff', 'interval': previous * 2}
+
+        pbp_data = result.get('pbp_data') or {}
+        game_state = result.get('game_state') or pbp_data.get('gameState')
+        clock = pbp_data.get('clock', {}) or {}
+        plays = pbp_data.get('plays', [])
+        last_type = plays[-1].get('typeDescKey') if plays else None
+
+        if game_state in PREGAME_STATES:
+            return {'reason': 'pregame', 'interval': self.pregame_interval}
+        if clock.get('inIntermission') or last_type in ('period-end', 'shootout-complete'):
+            return {'reason': 'intermission', 'interval': self.intermission_interval}
+
+        density = self._event_density(event_log)
+        seconds_remaining = clock.get('secondsRemaining')
+        period = pbp_data.get('periodDescriptor', {}).get('number', 0)
+        if game_state == 'CRIT' or (period >= 3 and seconds_remaining is not None and seconds_remaining <= 120):
+            return {'reason': 'critical', 'interval': self.min_interval, 'density': density}
+        if density >= self.busy_event_threshold:
+            return {'reason': 'busy', 'interval': self.min_interval, 'density': density}
+        if clock and clock.get('running') is False:
+            return {'reason': 'stoppage', 'interval': self.stoppage_interval, 'density': density}
+        if result.get('new_plays', 0) == 0 and self.idle_polls >= 2:
+            # Several empty polls in a row: stretch gradually, never past a stoppage interval
+            stretched = self.base_interval * (1 + 0.25 * (self.idle_polls - 1))
+            return {'reason': 'idle', 'interval': min(stretched, self.stoppage_interval), 'density': density}
+        return {'reason': 'live', 'interval': self.base_interval, 'density': density}
+
+    def next_interval(self, result: Dict[str, Any], event_log=None) -> float:
+        """Record a poll result (from LiveDataCollector.poll_once) and return seconds to wait"""
+        now = time.time()
+        new_plays = result.get('new_plays', 0)
+        self.metrics['polls'] += 1
+        if new_plays:
+            self.idle_polls = 0
+            if self._last_poll_at is not None:
+                gap = now - self._last_poll_at
+                self.metrics['max_detection_gap_seconds'] = max(self.metrics['max_detection_gap_seconds'], gap)
+        else:
+            self.idle_polls += 1
+            if result['status'] != 'error':
+                self.metrics['wasted_polls'] += 1
+        self._last_poll_at = now
+
+        decision = self._decide(result, event_log)
+        decision['interval'] = max(self.min_interval, min(self.max_interval, decision['interval']))
+        self.last_decision = decision
+        self.metrics['reasons'][decision['reason']] += 1
+        self.metrics['total_interval_seconds'] += decision['interval']
+        return decision['interval']
+
+    def get_metrics(self) -> Dict[str, Any]:
+        polls = self.metrics['polls']
+        return {
+            'polls': polls,
+            'wasted_polls': self.metrics['wasted_polls'],
+            'errors': self.metrics['errors'],
+            'reasons': dict(self.metrics['reasons']),
+            'avg_interval_seconds': round(self.metrics['total_interval_seconds'] / polls, 2) if polls else 0.0,
+            'max_detection_gap_seconds': round(self.metrics['max_detection_gap_seconds'], 2),
+            'last_decision': dict(self.last_decision),
+        }
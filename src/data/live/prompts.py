@@ -89,4 +89,18 @@ Output: Stefan Noesen fires a wrist shot from the right circle that Markstrom tu
 
 Input: []
 Output: No significant events in the recent action.
-""" 
\ No newline at end of file
+""" 
+
+BATCH_DESCRIPTION_PROMPT = """
+Generate a professional, factual description for each of the NHL activity windows below.
+
+Guidelines:
+- Write 1-2 sentences per window describing the flow of its events
+- Describe each window on its own; do not refer to other windows
+- If a window has no events, use: "No significant events in the recent action"
+- Be factual and observational, not analytical or conversational
+
+Windows (JSON array, each with "game_time" and "activities"): {windows_data}
+
+Return ONLY a JSON array of strings, one description per window, in the same order.
+"""
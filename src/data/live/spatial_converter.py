@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 """
 Spatial Converter - Converts coordinates to real hockey spatial language
+Scalar API (coords_to_hockey_language) for single events, plus a batch API
+(coords_to_description_codes / describe_coords_batch) that answers whole arrays
+of events from a precomputed rink-grid lookup table.
 """
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 def coords_to_hockey_language(x_coord: float, y_coord: float, zone_code: str, home_defending_side: str = "right") -> str:
     """
@@ -76,6 +82,86 @@ def coords_to_hockey_language(x_coord: float, y_coord: float, zone_code: str, ho
         return f"in the {zone_code.lower()} zone"
 
 
+# Rink grid covered by the lookup table (feed coordinates are integers in these ranges)
+GRID_X_MIN, GRID_X_MAX = -100, 100
+GRID_Y_MIN, GRID_Y_MAX = -45, 45
+GRID_ZONES = ("N", "D", "O")
+
+SPATIAL_DESCRIPTIONS: List[str] = []  # Description code -> text
+_SPATIAL_LUT: Optional[np.ndarray] = None  # [zone, x, y] -> description code
+
+
+def _description_code(text: str, codes: dict) -> int:
+    code = codes.get(text)
+    if code is None:
+        code = codes[text] = len(SPATIAL_DESCRIPTIONS)
+        SPATIAL_DESCRIPTIONS.append(text)
+    return code
+
+
+def _build_spatial_lut() -> np.ndarray:
+    """Evaluate the scalar converter once per grid cell, so the batch path matches it exactly"""
+    codes = {text: i for i, text in enumerate(SPATIAL_DESCRIPTIONS)}
+    lut = np.empty((len(GRID_ZONES), GRID_X_MAX - GRID_X_MIN + 1, GRID_Y_MAX - GRID_Y_MIN + 1), dtype=np.int16)
+    for zi, zone in enumerate(GRID_ZONES):
+        for xi, x in enumerate(range(GRID_X_MIN, GRID_X_MAX + 1)):
+            for yi, y in enumerate(range(GRID_Y_MIN, GRID_Y_MAX + 1)):
+                lut[zi, xi, yi] = _description_code(coords_to_hockey_language(x, y, zone), codes)
+    return lut
+
+
+def get_spatial_lut() -> np.ndarray:
+    global _SPATIAL_LUT
+    if _SPATIAL_LUT is None:
+        _SPATIAL_LUT = _build_spatial_lut()
+    return _SPATIAL_LUT
+
+
+def coords_to_description_codes(x_coords: Sequence[float], y_coords: Sequence[float],
+                                zone_codes: Sequence[str], home_defending_sides: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    Batch version of coords_to_hockey_language: description codes (indexes into
+    SPATIAL_DESCRIPTIONS) for every event in one vectorized lookup.
+    Events off the integer grid or with an unknown zone fall back to the scalar
+    converter; rows with missing coordinates or zone get -1.
+    home_defending_sides is accepted for parity with the scalar API (which does not use it).
+    """
+    lut = get_spatial_lut()
+    x = np.asarray(x_coords, dtype=np.float64)
+    y = np.asarray(y_coords, dtype=np.float64)
+    zones = np.asarray(zone_codes, dtype=object)
+    codes = np.full(len(x), -1, dtype=np.int32)
+    if len(x) == 0:
+        return codes
+
+    zone_index = np.full(len(x), -1, dtype=np.int64)
+    for zi, zone in enumerate(GRID_ZONES):
+        zone_index[zones == zone] = zi
+    present = ~np.isnan(x) & ~np.isnan(y) & (zones != None) & (zones != '')  # noqa: E711 (elementwise)
+    on_grid = (present & (zone_index >= 0) & (x == np.round(x)) & (y == np.round(y))
+               & (x >= GRID_X_MIN) & (x <= GRID_X_MAX) & (y >= GRID_Y_MIN) & (y <= GRID_Y_MAX))
+
+    xi = (x[on_grid] - GRID_X_MIN).astype(np.int64)
+    yi = (y[on_grid] - GRID_Y_MIN).astype(np.int64)
+    codes[on_grid] = lut[zone_index[on_grid], xi, yi]
+
+    off_grid = np.flatnonzero(present & ~on_grid)
+    if len(off_grid):
+        known = {text: i for i, text in enumerate(SPATIAL_DESCRIPTIONS)}
+        for i in off_grid:
+            text = coords_to_hockey_language(float(x[i]), float(y[i]), zones[i])
+            codes[i] = _description_code(text, known)
+    return codes
+
+
+def describe_coords_batch(x_coords: Sequence[float], y_coords: Sequence[float],
+                          zone_codes: Sequence[str], home_defending_sides: Optional[Sequence[str]] = None) -> List[Optional[str]]:
+    """Spatial description text per event (None where coordinates or zone are missing)"""
+    codes = coords_to_description_codes(x_coords, y_coords, zone_codes, home_defending_sides)
+    texts = np.array(SPATIAL_DESCRIPTIONS + [None], dtype=object)  # code -1 picks the trailing None
+    return texts[codes].tolist()
+
+
 def get_game_situation(situation_code: str) -> str:
     """Convert situation code to readable game state"""
     situation_map = {
@@ -121,6 +207,12 @@ if __name__ == "__main__":
         result = coords_to_hockey_language(x, y, zone)
         print(f"({x:3}, {y:3}) {zone} → {result}")
     
+    print("\n📦 Testing Batch Conversion:")
+    xs, ys, zones, _ = zip(*test_cases)
+    for (x, y, zone, _), text in zip(test_cases, describe_coords_batch(xs, ys, zones)):
+        assert text == coords_to_hockey_language(x, y, zone)
+        print(f"({x:3}, {y:3}) {zone} → {text}")
+
     print("\n🎮 Testing Game Situations:")
     situations = ["1551", "1560", "1451", "unknown"]
     for sit in situations:
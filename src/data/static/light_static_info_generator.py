@@ -24,20 +24,21 @@ class LightStaticInfoGenerator:
         os.makedirs(self.output_dir, exist_ok=True)
         print("🏒 Light Static Info Generator Ready")
     
-    def create_minimal_static_context(self, game_id: str) -> str:
-        """Filter full static context to 2 teams only"""
+    def create_minimal_static_context(self, game_id: str, full_context: Optional[Dict[str, Any]] = None) -> str:
+        """Filter full static context to 2 teams only (pass full_context to skip reading it from disk)"""
         print(f"\n🔧 Filtering static context for game {game_id} (2 teams only)")
         
-        # Read full static context
-        full_path = os.path.join(self.output_dir, f"game_{game_id}_static_context.json")
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(f"Full static context not found: {full_path}")
-        
-        with open(full_path, 'r') as f:
-            full_context = json.load(f)
+        if full_context is None:
+            # Read full static context
+            full_path = os.path.join(self.output_dir, f"game_{game_id}_static_context.json")
+            if not os.path.exists(full_path):
+                raise FileNotFoundError(f"Full static context not found: {full_path}")
+            
+            with open(full_path, 'r') as f:
+                full_context = json.load(f)
         
         # Filter to minimal context
-        minimal_context = self._filter_to_two_teams(full_context)
+        minimal_context = self.filter_to_two_teams(full_context)
         
         # Save minimal context
         minimal_path = os.path.join(self.output_dir, f"game_{game_id}_minimal_context.json")
@@ -56,8 +57,9 @@ class LightStaticInfoGenerator:
         
         return minimal_path
     
-    def _filter_to_two_teams(self, full_context: Dict[str, Any]) -> Dict[str, Any]:
-        """Filter to essential data only for the 2 teams playing"""
+    @classmethod
+    def filter_to_two_teams(cls, full_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Filter to essential data only for the 2 teams playing (no instance or files needed)"""
         game_info = full_context.get('game_info', {})
         home_team = game_info.get('home_team')
         away_team = game_info.get('away_team')
@@ -70,12 +72,12 @@ class LightStaticInfoGenerator:
             "game_id": full_context.get('game_id'),
             "generated_at": full_context.get('generated_at'),
             "game_info": full_context.get('game_info'),
-            "rosters": self._filter_rosters_essential_only(full_context.get('rosters', {})),
+            "rosters": cls._filter_rosters_essential_only(full_context.get('rosters', {})),
             "player_count": full_context.get('player_count')
         }
         
         # Filter standings to only the 2 teams playing
-        filtered_standings = self._filter_standings_for_teams(
+        filtered_standings = cls._filter_standings_for_teams(
             full_context.get('standings', {}), 
             home_team, 
             away_team
@@ -84,7 +86,8 @@ class LightStaticInfoGenerator:
         
         return minimal_context
     
-    def _filter_standings_for_teams(self, standings: Dict[str, Any], home_team: str, away_team: str) -> Dict[str, Any]:
+    @staticmethod
+    def _filter_standings_for_teams(standings: Dict[str, Any], home_team: str, away_team: str) -> Dict[str, Any]:
         """Filter standings to only include the 2 teams playing"""
         if 'standings' not in standings:
             return standings  # Return as-is if no standings data
@@ -104,7 +107,8 @@ class LightStaticInfoGenerator:
         
         return filtered_standings
     
-    def _filter_rosters_essential_only(self, rosters: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def _filter_rosters_essential_only(cls, rosters: Dict[str, Any]) -> Dict[str, Any]:
         """Filter rosters to essential data only - name, position, jersey, basic stats, goalie flag"""
         filtered_rosters = {
             "home_players": [],
@@ -113,19 +117,20 @@ class LightStaticInfoGenerator:
         
         # Filter home players
         for player in rosters.get('home_players', []):
-            essential_player = self._extract_essential_player_data(player)
+            essential_player = cls._extract_essential_player_data(player)
             if essential_player:
                 filtered_rosters["home_players"].append(essential_player)
         
         # Filter away players  
         for player in rosters.get('away_players', []):
-            essential_player = self._extract_essential_player_data(player)
+            essential_player = cls._extract_essential_player_data(player)
             if essential_player:
                 filtered_rosters["away_players"].append(essential_player)
         
         return filtered_rosters
     
-    def _extract_essential_player_data(self, player: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _extract_essential_player_data(player: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Extract only essential player data - pure data only"""
         nhl_data = player.get('nhl_data', {})
         name = player.get('name') or nhl_data.get('name', {}).get('default', 'Unknown')
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Player Cache - Persistent player enrichment cache shared across games
+SQLite file under data/static keyed by player id. Each row stores the
+enrichment JSON with the time it was fetched and a format version; rows past
+their TTL or written by another version are treated as misses.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Optional
+
+PLAYER_CACHE_VERSION = 1
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # Season stats move slowly; refresh weekly
+
+
+class PersistentPlayerCache:
+    """Thread-safe SQLite key-value cache for per-player enrichment data"""
+
+    def __init__(self, path: str, ttl_seconds: float = DEFAULT_TTL_SECONDS, version: int = PLAYER_CACHE_VERSION):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS player_cache ("
+                " player_id TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " version INTEGER NOT NULL)"
+            )
+
+    def get(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """Cached data for a player, or None when missing, expired or from another version"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, fetched_at, version FROM player_cache WHERE player_id = ?", (str(player_id),)
+            ).fetchone()
+            if row is None or row[2] != self.version or (time.time() - row[1]) > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, player_id: str, data: Dict[str, Any]):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO player_cache (player_id, data, fetched_at, version) VALUES (?, ?, ?, ?)",
+                (str(player_id), json.dumps(data), time.time(), self.version)
+            )
+
+    def purge_expired(self) -> int:
+        """Delete stale or old-version rows; returns how many were removed"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM player_cache WHERE version != ? OR fetched_at < ?",
+                (self.version, time.time() - self.ttl_seconds)
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
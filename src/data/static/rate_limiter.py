@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - Thread-safe token buckets, one per upstream host
+Lets a worker pool call external sites concurrently while each host still
+sees at most `rate` requests per second (plus a small burst).
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, up to `capacity` banked"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` now without blocking, borrowing against future refills when the
+        bucket is short; returns the seconds the caller must wait before using them.
+        Lets asyncio callers wait with asyncio.sleep instead of holding a thread.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+
+class HostRateLimiter:
+    """Lazily creates one TokenBucket per host (scheme-less netloc of the URL)"""
+
+    def __init__(self, default_rate: float = 2.0, default_capacity: Optional[float] = None,
+                 host_rates: Optional[Dict[str, float]] = None):
+        self.default_rate = default_rate
+        self.default_capacity = default_capacity
+        self.host_rates = host_rates or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc or url
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.host_rates.get(host, self.default_rate), self.default_capacity)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        return self.bucket_for(url).acquire()
+
+    def reserve(self, url: str) -> float:
+        return self.bucket_for(url).reserve()
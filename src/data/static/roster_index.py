@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Roster Index - One player lookup per game, keyed by int player id
+Built once from a static context (rosters.home_players / away_players, plus the
+legacy top-level players list) and shared by the live collector, the data
+agent tools and the commentary tools, so name resolution is a dict lookup.
+"""
+from typing import Dict, Any, Optional, List, Tuple
+
+
+class RosterIndex:
+    """O(1) player lookups for one game's static context"""
+
+    def __init__(self, players: Optional[Dict[int, Dict[str, Any]]] = None):
+        self.players: Dict[int, Dict[str, Any]] = players or {}
+
+    @classmethod
+    def from_static_context(cls, static_context: Dict[str, Any]) -> "RosterIndex":
+        index = cls()
+        rosters = (static_context or {}).get('rosters', {}) or {}
+        for team_key, players_list_key in [('home', 'home_players'), ('away', 'away_players')]:
+            for player in rosters.get(players_list_key, []):
+                index._add(player, team_key)
+        # Legacy structure: a flat players list without home/away split
+        legacy_players = (static_context or {}).get('players', [])
+        if isinstance(legacy_players, list):
+            for player in legacy_players:
+                index._add(player, None, overwrite=False)
+        return index
+
+    @staticmethod
+    def _ids_of(player: Dict[str, Any]) -> List[int]:
+        """Both id spellings found in static files: 'player_id' (str) and nhl_data.playerId (int)"""
+        ids = []
+        for raw in (player.get('player_id'), (player.get('nhl_data') or {}).get('playerId')):
+            try:
+                if raw not in (None, ''):
+                    ids.append(int(raw))
+            except (TypeError, ValueError):
+                continue
+        return ids
+
+    def _add(self, player: Dict[str, Any], team: Optional[str], overwrite: bool = True):
+        nhl_data = player.get('nhl_data') or {}
+        entry = {
+            'name': player.get('name', 'Unknown Player'),
+            'full_name': (nhl_data.get('name') or {}).get('default') if isinstance(nhl_data.get('name'), dict) else None,
+            'position': player.get('position', 'N/A'),
+            'team': team,
+            'record': player
+        }
+        for player_id in self._ids_of(player):
+            if overwrite or player_id not in self.players:
+                self.players[player_id] = entry
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def __contains__(self, player_id) -> bool:
+        return self.get(player_id) is not None
+
+    def get(self, player_id) -> Optional[Dict[str, Any]]:
+        """Entry for an int or numeric-string id, None if unknown"""
+        try:
+            return self.players.get(int(player_id))
+        except (TypeError, ValueError):
+            return None
+
+    def display_name(self, player_id, default: Optional[str] = None) -> str:
+        """Full name when the static file has one, else the roster name"""
+        entry = self.get(player_id)
+        if entry is None:
+            return default if default is not None else f"Player #{player_id}"
+        if entry['team'] is not None and entry['full_name']:
+            return entry['full_name']
+        return entry['name']
+
+    def labelled_name(self, player_id) -> Optional[str]:
+        """Roster name with side, e.g. "C. McDavid (home)"; None for unknown or legacy-only players"""
+        entry = self.get(player_id)
+        if entry is None or entry['team'] is None:
+            return None
+        return f"{entry['name']} ({entry['team']})"
+
+
+# Indexes are built once per static context object. Callers that reload the same
+# file get the same object from load_static_context's cache, so this stays small.
+_INDEX_CACHE: Dict[int, Tuple[Dict[str, Any], RosterIndex]] = {}
+_INDEX_CACHE_SIZE = 16
+
+
+def get_roster_index(static_context: Dict[str, Any]) -> RosterIndex:
+    """Shared RosterIndex for a static context dict (built on first use)"""
+    key = id(static_context)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] is static_context:
+        return cached[1]
+    index = RosterIndex.from_static_context(static_context)
+    if len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.pop(next(iter(_INDEX_CACHE)))
+    # Keep a reference to the context so its id cannot be reused while cached
+    _INDEX_CACHE[key] = (static_context, index)
+    return index
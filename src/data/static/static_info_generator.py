@@ -3,21 +3,42 @@
 Static Info Generator - Generates static context once per game
 Implements Phase 1 from NHL Live Streaming Data Architecture
 Enhanced with Hockey Reference player data integration
+Player enrichment runs on a bounded worker pool, rate limited per upstream host,
+and is cached across games in data/static/player_cache.sqlite.
+Each upstream resource is fetched once per run: the boxscore feeds both game
+info and rosters, and standings are shared by every game built the same day.
 """
 import os
 import json
 import sys
+import asyncio
 import requests
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from urllib.parse import quote
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from src.data.static.rate_limiter import HostRateLimiter
+from src.data.static.player_cache import PersistentPlayerCache, DEFAULT_TTL_SECONDS
+from src.data.static.light_static_info_generator import LightStaticInfoGenerator
+
+# Requests per second per upstream host. api-web.nhle.com is an unauthenticated CDN-backed API
+# that comfortably serves ~10 rps per client; Sports Reference sites block bots above 20 requests/minute.
+DEFAULT_HOST_RATES = {
+    'api-web.nhle.com': 10.0,
+    'hockey-reference.com': 20 / 60
+}
+
 
 class StaticInfoGenerator:
     """Generates static context for a game - team info, rosters, enhanced player stats"""
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, max_workers: int = 8, requests_per_second: float = 2.0,
+                 burst: float = 4.0, cache_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 persistent_cache: bool = True, host_rates: Optional[Dict[str, float]] = None):
         if output_dir is None:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             project_root = os.path.join(script_dir, "..", "..", "..")
@@ -28,18 +49,37 @@ class StaticInfoGenerator:
         self.base_url = "https://api-web.nhle.com/v1"
         self.hr_base_url = "https://hockey-reference.com"
         self.player_cache = {}  # Cache for Hockey Reference mappings
+        self.session = requests.Session()
+        self._boxscores: Dict[str, Dict[str, Any]] = {}  # game_id -> boxscore, fetched once per run
+        self._standings_by_day: Dict[str, Dict[str, Any]] = {}  # local date -> /standings/now
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self.max_workers = max_workers
+        # Replaces the fixed 0.5s sleep per player. Only real HTTP requests take a token: known hosts
+        # get their DEFAULT_HOST_RATES (overridable via host_rates), others requests_per_second
+        self.rate_limiter = HostRateLimiter(default_rate=requests_per_second, default_capacity=burst,
+                                            host_rates={**DEFAULT_HOST_RATES, **(host_rates or {})})
         os.makedirs(self.output_dir, exist_ok=True)
+        self.persistent_cache = None
+        if persistent_cache:
+            try:
+                self.persistent_cache = PersistentPlayerCache(
+                    os.path.join(self.output_dir, "player_cache.sqlite"), ttl_seconds=cache_ttl_seconds
+                )
+            except Exception as e:
+                print(f"⚠️ Persistent player cache unavailable, using in-memory cache only: {e}")
         print("🏒 Static Info Generator Ready")
     
-    def generate_static_context(self, game_id: str) -> str:
-        """Generate enhanced static context for a game (run once)"""
+    def build_static_context(self, game_id: str) -> Dict[str, Any]:
+        """Build the full static context in memory (boxscore and standings fetched at most once)"""
         print(f"\n🏒 Generating enhanced static context for game {game_id}")
         game_info = self._get_game_info(game_id)
         if not game_info:
             raise ValueError(f"Could not get game info for {game_id}")
         standings = self._get_standings()
         rosters = self._get_enhanced_rosters(game_id, game_info)
-        static_context = {
+        return {
             'game_id': game_id,
             'generated_at': datetime.now().isoformat(),
             'game_info': game_info,
@@ -47,19 +87,57 @@ class StaticInfoGenerator:
             'rosters': rosters,
             'player_count': len(rosters.get('home_players', [])) + len(rosters.get('away_players', []))
         }
+
+    def generate_static_context(self, game_id: str) -> str:
+        """Generate enhanced static context for a game (run once)"""
+        static_context = self.build_static_context(game_id)
         filepath = os.path.join(self.output_dir, f"game_{game_id}_static_context.json")
         with open(filepath, 'w') as f:
             json.dump(static_context, f, indent=2)
         print(f"\n💾 Enhanced static context saved: {filepath}")
         return filepath
-    
+
+    def build_minimal_context(self, game_id: str) -> Dict[str, Any]:
+        """Minimal (two teams only) context built straight from the in-memory full context"""
+        return LightStaticInfoGenerator.filter_to_two_teams(self.build_static_context(game_id))
+
+    def generate_minimal_context(self, game_id: str) -> str:
+        """Write game_<id>_minimal_context.json without writing and re-reading the full context"""
+        minimal_context = self.build_minimal_context(game_id)
+        filepath = os.path.join(self.output_dir, f"game_{game_id}_minimal_context.json")
+        with open(filepath, 'w') as f:
+            json.dump(minimal_context, f, indent=2)
+        print(f"\n💾 Minimal static context saved: {filepath}")
+        return filepath
+
+    def save_contexts(self, game_id: str, full_context: Optional[Dict[str, Any]] = None,
+                      minimal_context: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Write whichever contexts are given to their usual data/static file names"""
+        paths = {}
+        for kind, context in (('static', full_context), ('minimal', minimal_context)):
+            if context is None:
+                continue
+            paths[kind] = os.path.join(self.output_dir, f"game_{game_id}_{kind}_context.json")
+            with open(paths[kind], 'w') as f:
+                json.dump(context, f, indent=2)
+        return paths
+
+    def _fetch_json(self, url: str) -> Dict[str, Any]:
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_boxscore(self, game_id: str) -> Dict[str, Any]:
+        """Boxscore for a game, fetched once per run and shared by game info and rosters"""
+        if game_id not in self._boxscores:
+            self._boxscores[game_id] = self._fetch_json(f"{self.base_url}/gamecenter/{game_id}/boxscore")
+        return self._boxscores[game_id]
+
     def _get_game_info(self, game_id: str) -> Dict[str, Any]:
         """Get basic game information"""
         try:
-            url = f"{self.base_url}/gamecenter/{game_id}/boxscore"
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_boxscore(game_id)
             return {
                 'date': data.get('gameDate'),
                 'season': data.get('season'),
@@ -74,12 +152,24 @@ class StaticInfoGenerator:
             return None
     
     def _get_standings(self) -> Dict[str, Any]:
-        """Get current standings"""
+        """
+        Get current standings, shared by every game built today.
+        Kept in memory for this run and in data/static/standings_<date>.json for other runs.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        if today in self._standings_by_day:
+            return self._standings_by_day[today]
+        cache_path = os.path.join(self.output_dir, f"standings_{today}.json")
         try:
-            url = f"{self.base_url}/standings/now"
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json()
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r') as f:
+                    standings = json.load(f)
+            else:
+                standings = self._fetch_json(f"{self.base_url}/standings/now")
+                with open(cache_path, 'w') as f:
+                    json.dump(standings, f)
+            self._standings_by_day[today] = standings
+            return standings
         except Exception as e:
             print(f"⚠️ Warning: Could not get standings: {e}")
             return {'error': str(e)}
@@ -90,34 +180,41 @@ class StaticInfoGenerator:
             'home_players': [],
             'away_players': [],
             'enhanced_count': 0,
-            'cache_hits': 0
+            'cache_hits': 0,
+            'cache_misses': 0
         }
         try:
-            url = f"{self.base_url}/gamecenter/{game_id}/boxscore"
-            response = requests.get(url)
-            response.raise_for_status()
-            boxscore = response.json()
+            boxscore = self._get_boxscore(game_id)
             home_players = boxscore.get('playerByGameStats', {}).get('homeTeam', {}).get('forwards', [])
             home_players += boxscore.get('playerByGameStats', {}).get('homeTeam', {}).get('defense', [])
             home_players += boxscore.get('playerByGameStats', {}).get('homeTeam', {}).get('goalies', [])
-            for player in home_players:
-                enhanced_player = self._enhance_player_data(player)
-                rosters['home_players'].append(enhanced_player)
-                if enhanced_player.get('hockey_reference'):
-                    rosters['enhanced_count'] += 1
             away_players = boxscore.get('playerByGameStats', {}).get('awayTeam', {}).get('forwards', [])
             away_players += boxscore.get('playerByGameStats', {}).get('awayTeam', {}).get('defense', [])
             away_players += boxscore.get('playerByGameStats', {}).get('awayTeam', {}).get('goalies', [])
-            for player in away_players:
-                enhanced_player = self._enhance_player_data(player)
-                rosters['away_players'].append(enhanced_player)
-                if enhanced_player.get('hockey_reference'):
-                    rosters['enhanced_count'] += 1
+
+            # Both rosters go through one pool; map() keeps roster order
+            started = time.time()
+            cache_hits_before, cache_misses_before = self._cache_hits, self._cache_misses
+            enhanced = self._enhance_players_parallel(home_players + away_players)
+            rosters['home_players'] = enhanced[:len(home_players)]
+            rosters['away_players'] = enhanced[len(home_players):]
+            rosters['enhanced_count'] = sum(1 for player in enhanced if player.get('hockey_reference'))
+            rosters['cache_hits'] = self._cache_hits - cache_hits_before
+            rosters['cache_misses'] = self._cache_misses - cache_misses_before
+            print(f"👥 Enriched {len(enhanced)} players in {time.time() - started:.1f}s "
+                  f"({self.max_workers} workers, {rosters['cache_hits']} cache hits, {rosters['cache_misses']} misses)")
         except Exception as e:
             print(f"⚠️ Warning: Could not get enhanced rosters: {e}")
             rosters['error'] = str(e)
         return rosters
     
+    def _enhance_players_parallel(self, players: List[Dict]) -> List[Dict[str, Any]]:
+        """Enhance players concurrently on a bounded worker pool, preserving input order"""
+        if not players:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(players)), thread_name_prefix="roster") as pool:
+            return list(pool.map(self._enhance_player_data, players))
+
     def _enhance_player_data(self, player: Dict) -> Dict[str, Any]:
         """Enhance player data with Hockey Reference stats"""
         player_id = str(player.get('playerId', ''))
@@ -137,19 +234,31 @@ class StaticInfoGenerator:
     
     def _get_hockey_reference_data(self, player_name: str, player_id: str) -> Optional[Dict]:
         """Get Hockey Reference data for a player (mock for demo)"""
-        if player_id in self.player_cache:
-            return self.player_cache[player_id]
+        with self._cache_lock:
+            if player_id in self.player_cache:
+                self._cache_hits += 1
+                return self.player_cache[player_id]
+        cached = self.persistent_cache.get(player_id) if self.persistent_cache else None
+        if cached is not None:
+            with self._cache_lock:
+                self.player_cache[player_id] = cached
+                self._cache_hits += 1
+            return cached
+        with self._cache_lock:
+            self._cache_misses += 1
         try:
             hr_data = self._search_hockey_reference(player_name)
-            self.player_cache[player_id] = hr_data
-            time.sleep(0.5)
+            with self._cache_lock:
+                self.player_cache[player_id] = hr_data
+            if hr_data and self.persistent_cache:
+                self.persistent_cache.put(player_id, hr_data)
             return hr_data
         except Exception as e:
             print(f"⚠️ Could not get Hockey Reference data for {player_name}: {e}")
             return None
     
     def _search_hockey_reference(self, player_name: str) -> Optional[Dict]:
-        """Search Hockey Reference for player stats (mock for demo)"""
+        """Search Hockey Reference for player stats (mock for demo; a real lookup must acquire self.rate_limiter per request)"""
         try:
             mock_data = {
                 'season_stats': f'Mock stats for {player_name}',
@@ -169,11 +278,45 @@ class StaticInfoGenerator:
             return f"Enhanced player with {hr_data.get('recent_form', 'unknown form')}"
         return "Enhanced player context"
 
+_shared_generators: Dict[str, StaticInfoGenerator] = {}
+
+
+def get_static_info_generator(output_dir: str = None, **options) -> StaticInfoGenerator:
+    """
+    Process-wide generator per output dir, so standings, boxscores and the player cache are reused.
+    options (max_workers, requests_per_second, host_rates, ...) apply when the generator is first created.
+    """
+    key = os.path.abspath(output_dir) if output_dir else ''
+    if key not in _shared_generators:
+        _shared_generators[key] = StaticInfoGenerator(output_dir, **options)
+    return _shared_generators[key]
+
+
+async def generate_game_contexts(game_id: str, output_dir: str = None, write_files: bool = True,
+                                 generator: Optional[StaticInfoGenerator] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    In-process async API: build full and minimal static context without subprocesses.
+    Blocking HTTP/enrichment runs in a worker thread so the caller's event loop stays free.
+    Returns {'full': ..., 'minimal': ...}; files are still written for other readers when write_files is set.
+    """
+    generator = generator or get_static_info_generator(output_dir)
+    full_context = await asyncio.to_thread(generator.build_static_context, game_id)
+    minimal_context = LightStaticInfoGenerator.filter_to_two_teams(full_context)
+    if write_files:
+        await asyncio.to_thread(generator.save_contexts, game_id, full_context, minimal_context)
+    return {'full': full_context, 'minimal': minimal_context}
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python3 static_info_generator.py GAME_ID")
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not args:
+        print("Usage: python3 static_info_generator.py GAME_ID [GAME_ID ...] [--minimal]")
         print("Example: python3 static_info_generator.py 2023020001")
+        print("  --minimal  write game_<id>_minimal_context.json directly (standings shared across the games)")
         sys.exit(1)
-    game_id = sys.argv[1]
     generator = StaticInfoGenerator()
-    generator.generate_static_context(game_id) 
\ No newline at end of file
+    for game_id in args:
+        if '--minimal' in sys.argv:
+            generator.generate_minimal_context(game_id)
+        else:
+            generator.generate_static_context(game_id)
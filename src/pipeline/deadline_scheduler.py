@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Deadline Scheduler - Keeps LivePipelineV3 close to the live game
+
+Sits between the snapshot source and the Data stage. Lag is the wall-clock age
+of the oldest snapshot still waiting for commentary. While lag is within
+budget every snapshot becomes its own window. Once it exceeds the budget the
+waiting snapshots are drained together: windows without high-intensity events
+are skipped (board update only), the rest are coalesced into one prompt.
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.agents.data_agent.config import MOMENTUM_SCORES, HIGH_INTENSITY_THRESHOLD
+
+# Same cut the data agent uses for momentum: goal, fight, penalty, shot-on-goal
+HIGH_INTENSITY_TYPES = frozenset(t for t, score in MOMENTUM_SCORES.items() if score >= HIGH_INTENSITY_THRESHOLD)
+
+
+def is_high_intensity(snapshot: Dict[str, Any]) -> bool:
+    return any(a.get("typeDescKey") in HIGH_INTENSITY_TYPES for a in snapshot.get("activities", []))
+
+
+def merge_snapshots(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """One snapshot covering several windows: latest game time/state, activities of all (deduplicated)"""
+    merged = dict(snapshots[-1])
+    activities, seen = [], set()
+    for snapshot in snapshots:
+        for activity in snapshot.get("activities", []):
+            event_id = activity.get("eventId")
+            if event_id is not None and event_id in seen:
+                continue
+            seen.add(event_id)
+            activities.append(activity)
+    merged["activities"] = activities
+    merged["coalesced_windows"] = len(snapshots)
+    return merged
+
+
+class DeadlineScheduler:
+    """Async iterator of processing windows built from a snapshot source"""
+
+    def __init__(self, source, lag_budget_seconds: float = 30.0, max_coalesce: int = 4):
+        self.source = source
+        self.lag_budget_seconds = lag_budget_seconds
+        self.max_coalesce = max_coalesce
+        self._pending: Deque[Tuple[str, float]] = deque()  # (snapshot path, arrival time)
+        self._changed = asyncio.Event()
+        self._source_done = False
+        self.metrics = {
+            "current_lag_seconds": 0.0,
+            "max_lag_seconds": 0.0,
+            "windows_received": 0,
+            "windows_processed": 0,
+            "windows_coalesced": 0,
+            "windows_skipped": 0
+        }
+
+    async def _pump(self):
+        try:
+            async for path in self.source:
+                self._pending.append((path, time.time()))
+                self.metrics["windows_received"] += 1
+                self._changed.set()
+        finally:
+            self._source_done = True
+            self._changed.set()
+
+    def current_lag(self) -> float:
+        return time.time() - self._pending[0][1] if self._pending else 0.0
+
+    def _record_lag(self, lag: float):
+        self.metrics["current_lag_seconds"] = round(lag, 2)
+        self.metrics["max_lag_seconds"] = round(max(self.metrics["max_lag_seconds"], lag), 2)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = dict(self.metrics)
+        metrics["pending_windows"] = len(self._pending)
+        metrics["lag_budget_seconds"] = self.lag_budget_seconds
+        return metrics
+
+    @staticmethod
+    def _load(path: str) -> Dict[str, Any]:
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def _next_window(self) -> Dict[str, Any]:
+        lag = self.current_lag()
+        self._record_lag(lag)
+
+        if lag <= self.lag_budget_seconds or len(self._pending) == 1:
+            path, arrived_at = self._pending.popleft()
+            snapshot = self._load(path)
+            self.metrics["windows_processed"] += 1
+            return {"file": path, "arrived_at": arrived_at, "lag_seconds": lag,
+                    "snapshots": [snapshot], "timestamp_data": snapshot, "skipped": 0}
+
+        # Behind budget: drain a batch, keep only what is worth talking about
+        batch = [self._pending.popleft() for _ in range(min(self.max_coalesce, len(self._pending)))]
+        snapshots = [self._load(path) for path, _ in batch]
+        keep = [i for i, snapshot in enumerate(snapshots) if is_high_intensity(snapshot)]
+        if not keep:
+            keep = [len(batch) - 1]  # Quiet stretch: only the most recent window gets commentary
+        skipped = len(batch) - len(keep)
+
+        self.metrics["windows_processed"] += 1
+        self.metrics["windows_coalesced"] += len(keep) - 1
+        self.metrics["windows_skipped"] += skipped
+        print(f"⏩ Lag {lag:.1f}s > {self.lag_budget_seconds:g}s budget: "
+              f"{len(keep)} window(s) coalesced, {skipped} quiet window(s) skipped")
+
+        return {
+            "file": batch[keep[-1]][0],  # Output is named after the latest window it covers
+            "arrived_at": batch[0][1],
+            "lag_seconds": lag,
+            "snapshots": snapshots,  # Every window still goes to the board, in order
+            "timestamp_data": merge_snapshots([snapshots[i] for i in keep]),
+            "skipped": skipped
+        }
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        pump = asyncio.create_task(self._pump())
+        try:
+            while True:
+                if not self._pending:
+                    if self._source_done:
+                        break
+                    self._changed.clear()
+                    await self._changed.wait()
+                    continue
+                yield self._next_window()
+            await pump
+        finally:
+            if not pump.done():
+                pump.cancel()
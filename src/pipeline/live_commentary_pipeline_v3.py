@@ -7,17 +7,27 @@ Ensures commentary flows naturally with generated audio files for each timestamp
 
 Features:
 - Complete three-agent processing (Data → Commentary → Audio)
-- Sequential real-time processing (process → save → process)
+- Pipelined stages: Data, Commentary and Audio run as separate tasks joined by
+  bounded queues, so the data agent works on snapshot N+1 while TTS renders N
+  (--sequential restores process → save → process)
 - Guaranteed chronological output order
 - Audio files generation with organized naming
 - Enhanced session management with audio support
 - Production-ready for live streaming with audio
+- Event-driven snapshot handoff: the collector runs in-process and pushes each
+  snapshot onto an asyncio.Queue, ending with an explicit end-of-game marker.
+  With --watch the collector runs as a subprocess and a watchdog observer on
+  data/live/GAME_ID is used instead.
+- Latency deadline: when commentary falls more than --lag_budget=SECONDS behind
+  the collector, waiting snapshots are coalesced into one prompt and quiet ones
+  are skipped (see deadline_scheduler.py)
 
-Usage: python src/pipeline/live_commentary_pipeline_v3.py GAME_ID [DURATION_MINUTES]
+Usage: python src/pipeline/live_commentary_pipeline_v3.py GAME_ID [DURATION_MINUTES] [--watch] [--sequential] [--lag_budget=SECONDS]
 """
 
 import sys
 import os
+import copy
 import json
 import time
 import asyncio
@@ -34,8 +44,19 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 # Import components
 from src.board import create_live_game_board
 from src.agents.sequential_agent_v3.agent import create_nhl_sequential_agent_v3
+from src.data.static.static_info_generator import generate_game_contexts
+from src.data.static.light_static_info_generator import LightStaticInfoGenerator
+from src.data.live.live_data_collector import LiveDataCollector
+from src.pipeline.snapshot_source import QueueSnapshotSource, WatchdogSnapshotSource, END_OF_GAME_FILENAME
+from src.pipeline.deadline_scheduler import DeadlineScheduler
+from src.agents.audio_agent.tts_engine import get_tts_metrics
+from src.agents.audio_agent.tts_cache import get_tts_cache
+from src.agents.sequential_agent_v3.prompts import get_workflow_prompt_v3
 from src.pipeline.utils_v3 import (
     process_timestamp_with_session_v3, 
+    build_timestamp_result_v3,
+    extract_commentary_dialogue_v3,
+    get_snapshot_timestamp,
     create_commentary_context_v3, 
     format_v3_processing_stats,
     save_audio_files_manifest
@@ -45,13 +66,22 @@ from src.pipeline.utils_v3 import (
 class LivePipelineV3:
     """NHL Live Commentary Pipeline V3 for complete real-time processing with audio"""
     
-    def __init__(self, game_id: str, duration_minutes: int):
+    def __init__(self, game_id: str, duration_minutes: int, handoff: str = "queue",
+                 pipelined: bool = True, stage_queue_size: int = 2, lag_budget_seconds: float = 30.0):
+        if handoff not in ("queue", "watch"):
+            raise ValueError(f"handoff must be 'queue' or 'watch', got {handoff!r}")
         self.game_id = game_id
         self.duration_minutes = duration_minutes
+        self.handoff = handoff
+        self.pipelined = pipelined
+        self.stage_queue_size = stage_queue_size  # Snapshots allowed to wait between two stages
+        self.live_data_dir = f"data/live/{game_id}"
+        self.snapshot_source = None
+        self.lag_budget_seconds = lag_budget_seconds
+        self.scheduler = None
         self.game_board = None
+        self.event_range = None  # In-process collector's enhanced_range (queue handoff only)
         self.sequential_agent = None
-        self.current_session = None
-        self.current_runner = None
         self.static_context = None
         self.files_processed = 0
         self.all_audio_files = []  # Track all generated audio files
@@ -60,7 +90,8 @@ class LivePipelineV3:
             "total_processed": 0,
             "processing_times": [],
             "start_time": None,
-            "audio_files_generated": 0
+            "audio_files_generated": 0,
+            "lag_seconds": []  # Snapshot arrival → result saved
         }
         
     async def initialize(self):
@@ -76,43 +107,56 @@ class LivePipelineV3:
         print("✅ Pipeline V3 initialized successfully")
         
     async def _generate_static_context(self):
-        """Generate static context using light generator for efficiency"""
+        """Generate static context in-process (no subprocesses); reuse files from earlier runs"""
         minimal_path = f"data/static/game_{self.game_id}_minimal_context.json"
+        full_path = f"data/static/game_{self.game_id}_static_context.json"
         
-        if not os.path.exists(minimal_path):
-            # Generate full context first if needed
-            full_path = f"data/static/game_{self.game_id}_static_context.json"
-            if not os.path.exists(full_path):
-                await self._run_command([
-                    "python", "src/data/static/static_info_generator.py", self.game_id
-                ], "Static context generation failed")
-            
-            # Generate minimal context
-            await self._run_command([
-                "python", "src/data/static/light_static_info_generator.py", self.game_id
-            ], "Light static context generation failed")
-        
-        # Load the minimal static context
-        with open(minimal_path, 'r') as f:
-            self.static_context = json.load(f)
+        if os.path.exists(minimal_path):
+            with open(minimal_path, 'r') as f:
+                self.static_context = json.load(f)
+        elif os.path.exists(full_path):
+            # Full context from an earlier run: filter it here instead of re-fetching
+            with open(full_path, 'r') as f:
+                self.static_context = LightStaticInfoGenerator.filter_to_two_teams(json.load(f))
+            with open(minimal_path, 'w') as f:
+                json.dump(self.static_context, f, indent=2)
+        else:
+            try:
+                contexts = await generate_game_contexts(self.game_id, output_dir="data/static")
+            except Exception as e:
+                raise RuntimeError(f"Static context generation failed: {e}")
+            self.static_context = contexts['minimal']
     
-    async def _run_command(self, cmd: list, error_msg: str):
-        """Run a subprocess command with error handling"""
-        result = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await result.communicate()
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"{error_msg}: {stderr.decode()}")
-        
     async def _create_sequential_agent(self):
         """Create Sequential Agent V3 and initialize session"""
-        self.sequential_agent = create_nhl_sequential_agent_v3(self.game_id)
+        # Sub-agent runners/sessions live in the agent; refresh every 8 files (more frequent for audio processing)
+        self.sequential_agent = create_nhl_sequential_agent_v3(self.game_id, session_refresh_calls=8)
         await self.sequential_agent.initialize()
         
+    def _run_in_process_collector(self):
+        """Blocking collector run (worker thread); every saved snapshot is pushed onto the queue"""
+        source = self.snapshot_source
+        try:
+            collector = LiveDataCollector(
+                self.game_id,
+                output_dir=self.live_data_dir,
+                fetch_interval_seconds=15,
+                on_snapshot=lambda path, data: source.publish_threadsafe(path),
+                on_end_of_game=source.finish_threadsafe
+            )
+        except Exception as e:
+            print(f"❌ Could not start data collector: {e}")
+            source.finish_threadsafe()
+            return
+        self.event_range = collector.enhanced_range
+        collector.start_simulation_collection(self.duration_minutes, 0.5)
+
     async def start_and_monitor_data_collection(self):
-        """Start data collection subprocess in background"""
+        """Start data collection in background (in-process thread, or subprocess in watch mode)"""
+        if self.handoff == "queue":
+            await asyncio.to_thread(self._run_in_process_collector)
+            return
+
         cmd = [
             "python", "src/data/live/live_data_collector.py",
             "simulate", self.game_id,
@@ -129,66 +173,125 @@ class LivePipelineV3:
         except asyncio.CancelledError:
             process.terminate()
             await process.wait()
+            raise
+        # A collector that crashed never writes end_of_game.json; stop once its output is drained
+        self.snapshot_source.finish()
         
                 
     async def process_files_sequentially_as_they_arrive(self):
-        """Process files in chronological order as they arrive (V3 with audio)"""
+        """Process snapshots in chronological order as the source delivers them (V3 with audio)"""
         self.processing_stats["start_time"] = time.time()
-        processed_files = set()
         
-        print("🎬 Starting sequential processing with audio generation...")
+        if self.pipelined:
+            await self._process_files_pipelined()
+            return
+        
+        print(f"🎬 Starting sequential processing with audio generation ({self.handoff} handoff)...")
         
-        while True:
+        # The collector writes snapshots in game-time order, so arrival order is chronological
+        async for window in self.scheduler:
             try:
-                await asyncio.sleep(1.0)
-                
-                live_data_dir = f"data/live/{self.game_id}"
-                if not os.path.exists(live_data_dir):
-                    continue
-                    
-                # Get new files and sort chronologically
-                available_files = list(Path(live_data_dir).glob(f"{self.game_id}_*.json"))
-                new_files = [f for f in available_files if str(f) not in processed_files]
-                new_files_sorted = self._sort_files_chronologically(new_files)
-                
-                # Process next file in chronological order
-                if new_files_sorted:
-                    next_file = new_files_sorted[0]
-                    print(f"🎯 Processing: {next_file.name}")
-                    result = await self._process_single_file(str(next_file))
-                    processed_files.add(str(next_file))
-                    await self._save_result(str(next_file), result)
-                    continue
-                
-                # Check for completion
-                if len(new_files) == 0:
-                    await asyncio.sleep(30)
-                    final_check_files = list(Path(live_data_dir).glob(f"{self.game_id}_*.json"))
-                    final_new = [f for f in final_check_files if str(f) not in processed_files]
-                    
-                    if len(final_new) == 0:
-                        break
-                        
+                print(f"🎯 Processing: {os.path.basename(window['file'])}")
+                result = await self._process_single_file(window)
+                await self._save_result(window["file"], result)
+                self._record_lag(window)
+                self._remember_dialogue(result)
             except Exception as e:
                 print(f"Sequential processing error: {e}")
-                await asyncio.sleep(1)
     
-    def _sort_files_chronologically(self, files):
-        """Sort files by their timestamp (period, minutes, seconds)"""
-        def parse_timestamp(file_path):
-            try:
-                basename = file_path.name.replace('.json', '')
-                parts = basename.split('_')
-                if len(parts) >= 4:
-                    period = int(parts[1])
-                    minutes = int(parts[2]) 
-                    seconds = int(parts[3])
-                    return (period, minutes, seconds)
-            except (ValueError, IndexError):
-                pass
-            return (999, 999, 999)
+    async def _process_files_pipelined(self):
+        """
+        Data → Commentary → Audio as three tasks joined by bounded queues.
+        Each stage handles one snapshot at a time in arrival order, so output stays
+        chronological; a full queue makes the upstream stage wait.
+        """
+        print(f"🎬 Starting pipelined processing with audio generation ({self.handoff} handoff)...")
         
-        return sorted(files, key=parse_timestamp)
+        commentary_queue = asyncio.Queue(maxsize=self.stage_queue_size)
+        audio_queue = asyncio.Queue(maxsize=self.stage_queue_size)
+        await asyncio.gather(
+            self._data_stage(commentary_queue),
+            self._commentary_stage(commentary_queue, audio_queue),
+            self._audio_stage(audio_queue)
+        )
+    
+    async def _data_stage(self, out_queue: asyncio.Queue):
+        """Board update + Data Agent, in snapshot order"""
+        async for window in self.scheduler:
+            print(f"🎯 Processing: {os.path.basename(window['file'])}")
+            item = {"file": window["file"], "window": window, "start_time": time.time()}
+            try:
+                # The board only moves forward here; later stages get a frozen copy of its state
+                for snapshot in window["snapshots"]:
+                    self._update_board(snapshot)
+                timestamp_data = window["timestamp_data"]
+                item["timestamp_data"] = timestamp_data
+                item["board_context"] = copy.deepcopy(self.game_board.get_state())
+                
+                prompt = get_workflow_prompt_v3(self.game_id, timestamp_data, item["board_context"])
+                item["data_response"] = await self.sequential_agent.run_data_stage(prompt)
+            except Exception as e:
+                item["error"] = str(e)
+            
+            self.files_processed += 1
+            await out_queue.put(item)
+        await out_queue.put(None)
+    
+    async def _commentary_stage(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue):
+        """Commentary Agent, in snapshot order; dialogue context is updated before the next snapshot starts"""
+        while True:
+            item = await in_queue.get()
+            if item is None:
+                break
+            if "error" not in item:
+                try:
+                    commentary_context = create_commentary_context_v3(self.recent_dialogues)
+                    prompt = get_workflow_prompt_v3(self.game_id, item["timestamp_data"],
+                                                    item["board_context"], commentary_context)
+                    # TTS for each line starts as soon as it streams in; the audio stage collects it
+                    commentary_response, item["audio_tasks"] = await self.sequential_agent.run_commentary_stage_streaming(
+                        prompt, item["data_response"], get_snapshot_timestamp(item["file"])
+                    )
+                    item["commentary_response"] = commentary_response
+                    self._remember_dialogue({"commentary_dialogue": extract_commentary_dialogue_v3(
+                        {"commentary_agent": commentary_response})})
+                except Exception as e:
+                    item["error"] = str(e)
+            await out_queue.put(item)
+        await out_queue.put(None)
+    
+    async def _audio_stage(self, in_queue: asyncio.Queue):
+        """TTS for each snapshot, then save; the timestamp travels with the item, not the agent"""
+        while True:
+            item = await in_queue.get()
+            if item is None:
+                break
+            snapshot_file = item["file"]
+            try:
+                if "error" in item:
+                    raise RuntimeError(item["error"])
+                complete_result = await self.sequential_agent.run_audio_stage(
+                    item["data_response"],
+                    item["commentary_response"],
+                    game_timestamp=get_snapshot_timestamp(snapshot_file),
+                    audio_tasks=item.get("audio_tasks")
+                )
+                result = build_timestamp_result_v3(self.game_id, snapshot_file, complete_result)
+            except Exception as e:
+                result = {
+                    "status": "error",
+                    "error": str(e),
+                    "pipeline_stage": "error"
+                }
+            finally:
+                # Streamed TTS of a failed snapshot must not keep running or hold reserved file names
+                await self.sequential_agent.cancel_audio_tasks(item.get("audio_tasks"))
+            result["processing_time"] = time.time() - item["start_time"]
+            try:
+                await self._save_result(snapshot_file, result)
+                self._record_lag(item["window"])
+            except Exception as e:
+                print(f"Pipelined processing error: {e}")
     
     async def _save_result(self, filename: str, result: dict):
         """Save processing result to output directory (V3 with audio tracking)"""
@@ -246,31 +349,47 @@ class LivePipelineV3:
             for audio_file in audio_files:
                 print(f"   📁 {audio_file}")
         
-        # Track dialogue for context
+        # Update stats
+        if result.get("processing_time"):
+            self.processing_stats["processing_times"].append(result["processing_time"])
+            self.processing_stats["total_processed"] += 1
+    
+    def _record_lag(self, window: dict):
+        lag = time.time() - window["arrived_at"]
+        self.processing_stats["lag_seconds"].append(lag)
+        if lag > self.lag_budget_seconds:
+            print(f"🐢 Commentary lag {lag:.1f}s (budget {self.lag_budget_seconds:g}s)")
+    
+    def _remember_dialogue(self, result: dict):
+        """Track dialogue for context continuity"""
         dialogue = result.get("commentary_dialogue", [])
         if dialogue:
             self.recent_dialogues.append(dialogue)
             # Keep only last 5 timestamp dialogues
             if len(self.recent_dialogues) > 5:
                 self.recent_dialogues.pop(0)
-        
-        # Update stats
-        if result.get("processing_time"):
-            self.processing_stats["processing_times"].append(result["processing_time"])
-            self.processing_stats["total_processed"] += 1
     
-    async def _process_single_file(self, timestamp_file: str) -> dict:
-        """Process a single timestamp file with V3 agent (complete pipeline)"""
+    def _update_board(self, snapshot: dict):
+        """
+        Move the board up to a snapshot's game time. With the in-process collector the
+        new plays are read, enhanced, from its event log index (so plays that fell between
+        two activity windows still reach the board); snapshot files (watch mode) are
+        applied from their enhanced activity window.
+        """
+        if self.event_range is not None and snapshot.get("game_time"):
+            self.game_board.update_from_event_log(self.event_range, snapshot["game_time"])
+        else:
+            self.game_board.update_from_timestamp(snapshot)
+    
+    async def _process_single_file(self, window: dict) -> dict:
+        """Process one scheduler window (a snapshot, or several coalesced) with V3 agent (complete pipeline)"""
         start_time = time.time()
+        timestamp_file = window["file"]
         
         try:
-            await self._ensure_session()
-            
-            # Load timestamp data and update board
-            with open(timestamp_file, 'r') as f:
-                timestamp_data = json.load(f)
-            
-            self.game_board.update_from_timestamp(timestamp_data)
+            # Update board with every window in order, including skipped ones
+            for snapshot in window["snapshots"]:
+                self._update_board(snapshot)
             board_context = self.game_board.get_state()
             
             # Create commentary context for continuity
@@ -281,10 +400,11 @@ class LivePipelineV3:
                 self.sequential_agent,  # Pass the wrapper, not the inner agent
                 self.game_id,
                 timestamp_file,
-                self.current_session,
-                self.current_runner,
+                None,  # Sessions are pooled inside the agent
+                None,
                 board_context,
-                commentary_context
+                commentary_context,
+                timestamp_data=window["timestamp_data"]
             )
             
             result["processing_time"] = time.time() - start_time
@@ -301,30 +421,6 @@ class LivePipelineV3:
                 "pipeline_stage": "error"
             }
     
-    async def _ensure_session(self):
-        """Ensure session exists and refresh if needed (V3 with extended timeout)"""
-        # Initialize session if needed
-        if self.current_session is None or self.current_runner is None:
-            from google.adk.runners import InMemoryRunner
-            self.current_runner = InMemoryRunner(agent=self.sequential_agent.agent)
-            self.current_session = await self.current_runner.session_service.create_session(
-                app_name=self.current_runner.app_name,
-                user_id=f"live_v3_{self.game_id}_{self.files_processed}"
-            )
-        
-        # Refresh session every 8 files (more frequent for audio processing)
-        elif self.files_processed > 0 and self.files_processed % 8 == 0:
-            try:
-                await self.current_runner.session_service.delete_session(self.current_session.id)
-            except Exception:
-                pass  # Ignore deletion errors
-            
-            self.current_session = await self.current_runner.session_service.create_session(
-                app_name=self.current_runner.app_name,
-                user_id=f"refreshed_v3_{self.game_id}_{self.files_processed}"
-            )
-            print(f"🔄 Session refreshed (file #{self.files_processed})")
-    
     def print_final_stats(self):
         """Print final processing statistics (V3 enhanced with audio metrics)"""
         stats = format_v3_processing_stats(self.processing_stats, len(self.all_audio_files))
@@ -339,10 +435,26 @@ class LivePipelineV3:
         print(f"  Min time: {stats['min_time']}s")
         print(f"  Max time: {stats['max_time']}s")
         print(f"  Under 10s: {stats['under_10s_count']}/{stats['total_processed']} ({stats['under_10s_percentage']}%)")
-        print(f"  Session refreshes: {stats['session_refreshes']}")
+        print(f"  Session refreshes: {getattr(self.sequential_agent, 'session_refreshes', stats['session_refreshes'])}")
+        if self.processing_stats["lag_seconds"]:
+            lags = self.processing_stats["lag_seconds"]
+            print(f"\n⏱️ Latency (snapshot arrival → saved, budget {self.lag_budget_seconds:g}s):")
+            print(f"  Last lag: {lags[-1]:.1f}s, max lag: {max(lags):.1f}s")
+        if self.scheduler:
+            metrics = self.scheduler.get_metrics()
+            print(f"  Windows: {metrics['windows_received']} received, {metrics['windows_processed']} processed, "
+                  f"{metrics['windows_coalesced']} coalesced, {metrics['windows_skipped']} skipped")
         print(f"\n🎵 Audio Generation Statistics:")
         print(f"  Total audio files: {stats['total_audio_files']}")
         print(f"  Avg files per timestamp: {stats['avg_audio_per_timestamp']}")
+        tts_metrics = get_tts_metrics()
+        if tts_metrics:
+            print(f"  TTS calls: {tts_metrics['completed']} ok, {tts_metrics['failed']} failed, "
+                  f"avg latency {tts_metrics['avg_latency_seconds']}s (max {tts_metrics['max_latency_seconds']:.2f}s), "
+                  f"avg queue wait {tts_metrics['avg_queue_wait_seconds']}s")
+        cache_stats = get_tts_cache().stats()
+        print(f"  TTS cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+              f"{cache_stats['entries']} entries ({cache_stats['total_bytes'] / 1e6:.1f} MB)")
         
         # Save audio manifest
         if self.all_audio_files:
@@ -355,6 +467,16 @@ class LivePipelineV3:
         try:
             await self.initialize()
             
+            if self.handoff == "queue":
+                self.snapshot_source = QueueSnapshotSource()
+                self.snapshot_source.bind_loop(asyncio.get_running_loop())
+            else:
+                stale_marker = os.path.join(self.live_data_dir, END_OF_GAME_FILENAME)
+                if os.path.exists(stale_marker):
+                    os.remove(stale_marker)
+                self.snapshot_source = WatchdogSnapshotSource(self.live_data_dir, self.game_id)
+            self.scheduler = DeadlineScheduler(self.snapshot_source, self.lag_budget_seconds)
+            
             # Create tasks: Data generation in background + Sequential processing
             data_task = asyncio.create_task(self.start_and_monitor_data_collection())
             process_task = asyncio.create_task(self.process_files_sequentially_as_they_arrive())
@@ -378,24 +500,32 @@ class LivePipelineV3:
 async def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Usage: python src/pipeline/live_commentary_pipeline_v3.py GAME_ID [DURATION_MINUTES]")
+        print("Usage: python src/pipeline/live_commentary_pipeline_v3.py GAME_ID [DURATION_MINUTES] [--watch] [--sequential] [--lag_budget=SECONDS]")
         print("Example: python src/pipeline/live_commentary_pipeline_v3.py 2024030412 2")
         print("\n🎵 Pipeline V3 Features:")
         print("  - Complete Data + Commentary + Audio processing")
         print("  - Organized audio file generation")
         print("  - Enhanced session management")
         print("  - Audio files manifest creation")
+        print("  - --watch: run the collector as a subprocess and watch its output directory")
+        print("  - --sequential: finish each snapshot before starting the next (no stage overlap)")
+        print("  - --lag_budget=SECONDS: coalesce/skip snapshots once commentary lags this far behind (default 30)")
         sys.exit(1)
     
-    game_id = sys.argv[1]
-    duration_minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    game_id = args[0]
+    duration_minutes = float(args[1]) if len(args) > 1 else 2
+    handoff = "watch" if "--watch" in sys.argv else "queue"
+    pipelined = "--sequential" not in sys.argv
+    lag_budget = next((float(arg.split('=', 1)[1]) for arg in sys.argv if arg.startswith('--lag_budget=')), 30.0)
     
     print(f"🚀 Starting NHL Live Commentary Pipeline V3")
     print(f"   Game: {game_id}")
     print(f"   Duration: {duration_minutes} minutes")
     print(f"   Audio: YES (Complete pipeline)")
     
-    pipeline = LivePipelineV3(game_id, duration_minutes)
+    pipeline = LivePipelineV3(game_id, duration_minutes, handoff=handoff, pipelined=pipelined,
+                              lag_budget_seconds=lag_budget)
     await pipeline.run()
 
 
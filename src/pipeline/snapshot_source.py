@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Snapshot Sources - How LivePipelineV3 learns about new live data snapshots
+
+- QueueSnapshotSource: in-process handoff. The collector pushes each snapshot
+  path onto an asyncio.Queue as soon as it is written and finishes with an
+  explicit END_OF_GAME marker; no sleeping, no directory scans.
+- WatchdogSnapshotSource: cross-process fallback. A filesystem watcher on the
+  live data directory reports new snapshot files; the collector's
+  end_of_game.json marker file (or the collector process exiting) ends the
+  stream. Appends to heartbeat.jsonl count as liveness during quiet stretches.
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import AsyncIterator, Optional, Set, Tuple
+
+END_OF_GAME = object()  # Queue marker: no more snapshots for this game
+END_OF_GAME_FILENAME = "end_of_game.json"
+HEARTBEAT_FILENAME = "heartbeat.jsonl"  # Collector appends here when a poll found nothing new
+
+_HEARTBEAT = object()  # Queue marker: collector alive, nothing new
+_PRODUCER_EXITED = object()  # Queue marker: collector process gone, drain its directory and stop
+
+
+def snapshot_sort_key(path) -> Tuple[int, int, int]:
+    """(period, minutes, seconds) from a {game_id}_P_MM_SS.json file name"""
+    try:
+        parts = os.path.basename(str(path)).replace('.json', '').split('_')
+        if len(parts) >= 4:
+            return (int(parts[1]), int(parts[2]), int(parts[3]))
+    except (ValueError, IndexError):
+        pass
+    return (999, 999, 999)
+
+
+class QueueSnapshotSource:
+    """Snapshot paths pushed by an in-process collector"""
+
+    def __init__(self, maxsize: int = 0):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """Remember the consumer's loop so producer threads can publish into it"""
+        self._loop = loop
+
+    def publish_threadsafe(self, path: str):
+        """Called from the collector's thread after each snapshot file is written"""
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, path)
+
+    def finish_threadsafe(self):
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, END_OF_GAME)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        while True:
+            item = await self.queue.get()
+            if item is END_OF_GAME:
+                return
+            yield item
+
+
+class WatchdogSnapshotSource:
+    """
+    Snapshot files created by another process, reported by a watchdog observer.
+    idle_timeout_seconds is opt-in: when set, the stream also ends after that long
+    without a snapshot or heartbeat (intermissions keep heartbeats coming).
+    """
+
+    def __init__(self, live_data_dir: str, game_id: str, idle_timeout_seconds: Optional[float] = None):
+        self.live_data_dir = live_data_dir
+        self.game_id = game_id
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._seen: Set[str] = set()
+
+    def _matches(self, path: str) -> bool:
+        name = os.path.basename(path)
+        return name.startswith(f"{self.game_id}_") and name.endswith(".json")
+
+    def _on_path(self, loop: asyncio.AbstractEventLoop, path: str):
+        name = os.path.basename(path)
+        if name == END_OF_GAME_FILENAME:
+            loop.call_soon_threadsafe(self.queue.put_nowait, END_OF_GAME)
+        elif name == HEARTBEAT_FILENAME:
+            loop.call_soon_threadsafe(self.queue.put_nowait, _HEARTBEAT)
+        elif self._matches(path):
+            loop.call_soon_threadsafe(self.queue.put_nowait, path)
+
+    def _start_observer(self, loop: asyncio.AbstractEventLoop):
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        source = self
+
+        class _SnapshotHandler(FileSystemEventHandler):
+            # The collector writes to a temp file and renames it, so finished files show up as moves
+            def on_moved(self, event):
+                if not event.is_directory:
+                    source._on_path(loop, event.dest_path)
+
+            def on_created(self, event):
+                if not event.is_directory:
+                    source._on_path(loop, event.src_path)
+
+            def on_modified(self, event):
+                # Only heartbeat appends matter; snapshots are reported once they are complete
+                if not event.is_directory and os.path.basename(event.src_path) == HEARTBEAT_FILENAME:
+                    source._on_path(loop, event.src_path)
+
+        observer = Observer()
+        observer.schedule(_SnapshotHandler(), self.live_data_dir, recursive=False)
+        observer.start()
+        return observer
+
+    def _existing_snapshots(self):
+        return sorted(Path(self.live_data_dir).glob(f"{self.game_id}_*.json"), key=snapshot_sort_key)
+
+    def finish(self):
+        """The collector process exited: deliver anything it wrote that was not reported yet, then end"""
+        self.queue.put_nowait(_PRODUCER_EXITED)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        os.makedirs(self.live_data_dir, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        observer = self._start_observer(loop)
+        try:
+            # Files written before the observer started
+            for path in self._existing_snapshots():
+                self.queue.put_nowait(str(path))
+            if os.path.exists(os.path.join(self.live_data_dir, END_OF_GAME_FILENAME)):
+                self.queue.put_nowait(END_OF_GAME)
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=self.idle_timeout_seconds)
+                except asyncio.TimeoutError:
+                    print(f"⏹️ No snapshots or heartbeats for {self.idle_timeout_seconds:g}s - assuming the collector is gone")
+                    return
+                if item is END_OF_GAME:
+                    return
+                if item is _HEARTBEAT:
+                    continue
+                if item is _PRODUCER_EXITED:
+                    for path in map(str, self._existing_snapshots()):
+                        if path not in self._seen:
+                            self._seen.add(path)
+                            yield path
+                    return
+                if item in self._seen:
+                    continue
+                self._seen.add(item)
+                yield item
+        finally:
+            observer.stop()
+            observer.join(timeout=5)
@@ -11,21 +11,38 @@ from google.genai.types import Part, UserContent
 from typing import Dict, Any, List
 
 
-async def process_timestamp_with_session_v3(agent, game_id: str, timestamp_file: str, session, runner, board_context: dict, commentary_context: dict = None) -> dict:
+def get_snapshot_timestamp(timestamp_file: str) -> str:
+    """Audio naming timestamp from a snapshot file name, e.g. 2024030412_1_01_15.json -> 1_01_15"""
+    basename = os.path.basename(timestamp_file).replace('.json', '')
+    parts = basename.split('_')
+    if len(parts) >= 4:
+        return f"{parts[1]}_{parts[2]}_{parts[3]}"
+    return "1_00_00"  # fallback
+
+
+def build_timestamp_result_v3(game_id: str, timestamp_file: str, complete_result: dict) -> dict:
+    """Wrap a complete Data + Commentary + Audio result the way the pipeline saves it"""
+    timestamp_name = os.path.basename(timestamp_file).replace('.json', '').replace(f'{game_id}_', '')
+    return {
+        "status": "success",
+        "timestamp": timestamp_name,
+        "response": complete_result,
+        "commentary_dialogue": extract_commentary_dialogue_v3(complete_result),
+        "audio_files": extract_audio_files_info_v3(complete_result),
+        "pipeline_stage": "complete"  # V3 includes all three stages
+    }
+
+
+async def process_timestamp_with_session_v3(agent, game_id: str, timestamp_file: str, session, runner, board_context: dict, commentary_context: dict = None, timestamp_data: dict = None) -> dict:
     """Process timestamp with ADK session for Sequential Agent V3 (includes audio processing)"""
     try:
-        # Load timestamp data
-        with open(timestamp_file, 'r') as f:
-            timestamp_data = json.load(f)
+        # Load timestamp data unless the caller already has it (e.g. coalesced windows)
+        if timestamp_data is None:
+            with open(timestamp_file, 'r') as f:
+                timestamp_data = json.load(f)
         
         # Extract timestamp from filename for audio naming
-        basename = os.path.basename(timestamp_file).replace('.json', '')
-        # Extract timestamp part from filename like "2024030412_1_01_15"
-        parts = basename.split('_')
-        if len(parts) >= 4:
-            timestamp = f"{parts[1]}_{parts[2]}_{parts[3]}"  # "1_01_15"
-        else:
-            timestamp = "1_00_00"  # fallback
+        timestamp = get_snapshot_timestamp(timestamp_file)
         
         # Set timestamp and context in the sequential agent
         if hasattr(agent, 'set_current_timestamp'):
@@ -45,22 +62,7 @@ async def process_timestamp_with_session_v3(agent, game_id: str, timestamp_file:
         # agent is our NHLSequentialAgentV3 wrapper, not the inner SequentialAgent
         complete_result = await agent.process_message(prompt)
         
-        # Extract commentary dialogue for context continuity
-        commentary_dialogue = extract_commentary_dialogue_v3(complete_result)
-        
-        # Extract audio files information
-        audio_files = extract_audio_files_info_v3(complete_result)
-        
-        timestamp_name = os.path.basename(timestamp_file).replace('.json', '').replace(f'{game_id}_', '')
-        
-        return {
-            "status": "success",
-            "timestamp": timestamp_name,
-            "response": complete_result,
-            "commentary_dialogue": commentary_dialogue,
-            "audio_files": audio_files,
-            "pipeline_stage": "complete"  # V3 includes all three stages
-        }
+        return build_timestamp_result_v3(game_id, timestamp_file, complete_result)
         
     except Exception as e:
         timestamp_name = os.path.basename(timestamp_file).replace('.json', '').replace(f'{game_id}_', '')
@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from src.data.live.collector_service import LiveCollectorService
+from src.data.live.live_data_collector import END_OF_GAME_FILENAME
+
+
+def _service(tmp_path, statuses):
+    service = LiveCollectorService(['2024030411', '2024030412'], output_root=str(tmp_path),
+                                   base_interval_seconds=0.01, min_interval_seconds=0.01)
+    for game_id, status in zip(service.game_ids, statuses):
+        result = {'status': status, 'changed': False, 'new_plays': 0, 'game_state': None, 'pbp_data': None}
+        service.collectors[game_id].poll_once = lambda incremental, result=result: result
+    return service
+
+
+def _marker(tmp_path, game_id):
+    with open(tmp_path / game_id / END_OF_GAME_FILENAME) as f:
+        return json.load(f)
+
+
+def test_cancelled_service_marks_unfinished_games_aborted(tmp_path):
+    service = _service(tmp_path, ['final', 'heartbeat'])
+
+    async def run_then_stop():
+        task = asyncio.create_task(service.run())
+        await asyncio.sleep(0.2)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run_then_stop())
+
+    assert _marker(tmp_path, '2024030411')['reason'] == 'final'
+    assert _marker(tmp_path, '2024030412')['reason'] == 'aborted'
@@ -0,0 +1,58 @@
+from src.board.live_game_board import LiveGameBoard
+from src.data.live.live_data_collector import LiveDataCollector
+from src.data.static.roster_index import RosterIndex
+
+HOME_ID, AWAY_ID = 1, 2
+
+
+def _play(event_id, sort_order, time_in_period, type_desc_key, **details):
+    return {
+        'eventId': event_id, 'sortOrder': sort_order, 'periodDescriptor': {'number': 1},
+        'timeInPeriod': time_in_period, 'timeRemaining': '15:00', 'typeDescKey': type_desc_key,
+        'situationCode': '1551', 'details': details
+    }
+
+
+def _collector(tmp_path, plays):
+    collector = LiveDataCollector('2024030412', output_dir=str(tmp_path), llm_model=object())
+    collector.roster_index = RosterIndex({
+        8478402: {'name': 'C. McDavid', 'team': 'home'},
+        8477934: {'name': 'L. Draisaitl', 'team': 'home'},
+        8475786: {'name': 'Z. Hyman', 'team': 'home'},
+        8477953: {'name': 'M. Tkachuk', 'team': 'away'}
+    })
+    collector.event_log.ingest({'homeTeam': {'id': HOME_ID}, 'awayTeam': {'id': AWAY_ID}, 'plays': plays})
+    return collector
+
+
+def test_indexed_goal_reaches_board_with_names(tmp_path):
+    plays = [
+        _play(10, 10, '02:00', 'penalty', eventOwnerTeamId=AWAY_ID, committedByPlayerId=8477953, duration=2),
+        _play(11, 11, '03:00', 'goal', eventOwnerTeamId=HOME_ID, scoringPlayerId=8478402,
+              assist1PlayerId=8477934, assist2PlayerId=8475786)
+    ]
+    collector = _collector(tmp_path, plays)
+    board = LiveGameBoard('2024030412')
+
+    # The goal lies before the first snapshot's window; the index still delivers it
+    board.update_from_event_log(collector.enhanced_range, '1:01:00')
+    report = board.update_from_event_log(collector.enhanced_range, '1:05:00')
+    state = board.get_state()
+
+    assert report['events_processed'] == 2
+    assert state['goals'][0]['scorer'] == 'C. McDavid (home)'
+    assert state['goals'][0]['assists'] == ['L. Draisaitl (home)', 'Z. Hyman (home)']
+    assert state['penalties'][0]['player'] == 'M. Tkachuk (away)'
+    assert state['game_situation'] != 'even_strength'
+
+
+def test_snapshot_and_index_paths_agree(tmp_path):
+    plays = [_play(11, 11, '03:00', 'goal', eventOwnerTeamId=HOME_ID, scoringPlayerId=8478402)]
+    collector = _collector(tmp_path, plays)
+
+    from_index = LiveGameBoard('2024030412')
+    from_index.update_from_event_log(collector.enhanced_range, '1:05:00')
+    from_snapshot = LiveGameBoard('2024030412')
+    from_snapshot.update_from_timestamp({'game_time': '1:05:00', 'activities': collector._enhance_activities(plays, '1:05:00')})
+
+    assert from_index.get_state()['goals'] == from_snapshot.get_state()['goals']
@@ -0,0 +1,37 @@
+import json
+
+from src.agents.sequential_agent_v3.response_collector import JsonArrayItemStream, extract_json_object
+
+SEQUENCE = [
+    {"speaker": "Alex Chen", "text": "He shoots [from the point]... and {scores}!"},
+    {"speaker": "Mike Rodriguez", "text": "A \"laser\", no doubt about it, 2-1."},
+    {"speaker": "Alex Chen", "text": "Wow"}
+]
+ANSWER = '```json\n' + json.dumps({"timestamp": "1_05_00", "commentary_sequence": SEQUENCE, "total": 3}, indent=2) + '\n```'
+
+
+def _feed_in_chunks(text, size):
+    stream = JsonArrayItemStream("commentary_sequence")
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(stream.feed(text[start:start + size]))
+    return stream, items
+
+
+def test_items_are_emitted_once_for_any_chunking():
+    for size in (1, 2, 7, 64, len(ANSWER)):
+        stream, items = _feed_in_chunks(ANSWER, size)
+        assert items == list(enumerate(SEQUENCE)), size
+        assert stream.done
+
+
+def test_item_is_emitted_as_soon_as_it_is_complete():
+    first_end = ANSWER.index('\n    }') + len('\n    }')  # Closing brace of the first item
+    stream = JsonArrayItemStream("commentary_sequence")
+    assert stream.feed(ANSWER[:first_end - 1]) == []
+    assert stream.feed(ANSWER[first_end - 1:first_end]) == [(0, SEQUENCE[0])]
+
+
+def test_extract_json_object_reads_only_the_outermost_object():
+    assert extract_json_object(ANSWER)["commentary_sequence"] == SEQUENCE
+    assert extract_json_object('Here you go: {"commentary_sequence": [{"text": "cut off') is None
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import os
+import time
+
+from src.pipeline.snapshot_source import WatchdogSnapshotSource, END_OF_GAME_FILENAME, HEARTBEAT_FILENAME
+
+GAME_ID = "2024030412"
+
+
+def _write_snapshot(directory, name):
+    # Same write-then-rename the collector uses
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"game_time": name}, f)
+    os.replace(tmp_path, os.path.join(directory, name))
+
+
+async def _collect(source):
+    return [os.path.basename(path) async for path in source]
+
+
+def test_heartbeats_keep_source_alive_past_idle_timeout(tmp_path):
+    directory = str(tmp_path)
+    source = WatchdogSnapshotSource(directory, GAME_ID, idle_timeout_seconds=0.5)
+
+    async def collector():
+        await asyncio.sleep(0.2)
+        _write_snapshot(directory, f"{GAME_ID}_1_00_00.json")
+        # Quiet stretch three times longer than the idle timeout, heartbeats only
+        for _ in range(10):
+            await asyncio.sleep(0.15)
+            with open(os.path.join(directory, HEARTBEAT_FILENAME), "a") as f:
+                f.write('{"type": "heartbeat"}\n')
+        _write_snapshot(directory, f"{GAME_ID}_1_00_15.json")
+        await asyncio.sleep(0.2)
+        _write_snapshot(directory, END_OF_GAME_FILENAME)
+
+    async def run():
+        started = time.monotonic()
+        received, _ = await asyncio.gather(_collect(source), collector())
+        return received, time.monotonic() - started
+
+    received, elapsed = asyncio.run(run())
+    assert received == [f"{GAME_ID}_1_00_00.json", f"{GAME_ID}_1_00_15.json"]
+    assert elapsed > 1.5
+
+
+def test_stream_ends_only_on_marker_by_default(tmp_path):
+    directory = str(tmp_path)
+    source = WatchdogSnapshotSource(directory, GAME_ID)
+    assert source.idle_timeout_seconds is None
+
+    async def collector():
+        _write_snapshot(directory, f"{GAME_ID}_1_00_00.json")
+        await asyncio.sleep(1.0)  # No heartbeats either
+        _write_snapshot(directory, f"{GAME_ID}_1_00_15.json")
+        _write_snapshot(directory, END_OF_GAME_FILENAME)
+
+    async def run():
+        await asyncio.sleep(0)
+        received, _ = await asyncio.gather(_collect(source), collector())
+        return received
+
+    assert asyncio.run(run()) == [f"{GAME_ID}_1_00_00.json", f"{GAME_ID}_1_00_15.json"]
+
+
+def test_producer_exit_drains_unreported_snapshots(tmp_path):
+    directory = str(tmp_path)
+    source = WatchdogSnapshotSource(directory, GAME_ID)
+
+    async def run():
+        task = asyncio.ensure_future(_collect(source))
+        await asyncio.sleep(0.2)
+        # Written and immediately followed by the process exit, without an end_of_game marker
+        _write_snapshot(directory, f"{GAME_ID}_1_00_00.json")
+        source.finish()
+        return await asyncio.wait_for(task, timeout=5)
+
+    assert asyncio.run(run()) == [f"{GAME_ID}_1_00_00.json"]
@@ -0,0 +1,27 @@
+import time
+
+from src.data.static.static_info_generator import StaticInfoGenerator, DEFAULT_HOST_RATES
+
+
+def _players(count):
+    return [{'playerId': 8470000 + i, 'name': {'default': f'Player {i}'}, 'position': 'C'} for i in range(count)]
+
+
+def test_mock_enhancement_is_not_throttled(tmp_path):
+    # A limiter this strict would take minutes if the offline enhancement path took tokens
+    generator = StaticInfoGenerator(str(tmp_path), requests_per_second=0.1, burst=1,
+                                    persistent_cache=False, host_rates={'hockey-reference.com': 0.1})
+    started = time.monotonic()
+    enhanced = generator._enhance_players_parallel(_players(40))
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert len(enhanced) == 40
+    assert all(player['hockey_reference']['mock_data'] for player in enhanced)
+    assert generator.rate_limiter._buckets == {}
+
+
+def test_host_rates_default_and_override(tmp_path):
+    generator = StaticInfoGenerator(str(tmp_path), persistent_cache=False, host_rates={'api-web.nhle.com': 5.0})
+    assert generator.rate_limiter.bucket_for('https://api-web.nhle.com/v1/standings/now').rate == 5.0
+    assert generator.rate_limiter.bucket_for(generator.hr_base_url).rate == DEFAULT_HOST_RATES['hockey-reference.com']
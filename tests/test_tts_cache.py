@@ -0,0 +1,50 @@
+import os
+
+from src.agents.audio_agent.tts_cache import TTSAudioCache, tts_cache_key
+
+
+def test_put_get_and_miss(tmp_path):
+    cache = TTSAudioCache(str(tmp_path))
+    key = tts_cache_key("What a save!", "Puck", "excited", "tts-model")
+
+    assert cache.get(key) is None
+    assert cache.put(key, b"\x01\x02" * 100)
+    assert cache.get(key) == b"\x01\x02" * 100
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_key_normalizes_whitespace():
+    assert tts_cache_key("What  a\nsave!", "Puck", "s", "m") == tts_cache_key("What a save!", "Puck", "s", "m")
+    assert tts_cache_key("What a save!", "Kore", "s", "m") != tts_cache_key("What a save!", "Puck", "s", "m")
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = TTSAudioCache(str(tmp_path), max_bytes=250)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    cache.get("a")  # "b" is now the oldest
+    cache.put("c", b"c" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"a" * 100
+    assert cache.get("c") == b"c" * 100
+    assert cache.stats()["evictions"] == 1
+    assert not os.path.exists(tmp_path / "b.pcm")
+
+
+def test_index_survives_restart(tmp_path):
+    TTSAudioCache(str(tmp_path)).put("a", b"a" * 10)
+    reopened = TTSAudioCache(str(tmp_path))
+    assert reopened.stats()["entries"] == 1
+    assert reopened.get("a") == b"a" * 10
+
+
+def test_disk_errors_are_not_raised(tmp_path):
+    # A file where the directory should be: makedirs and every write fail
+    blocked = tmp_path / "not_a_dir"
+    blocked.write_bytes(b"")
+    cache = TTSAudioCache(str(blocked))
+
+    assert cache.put("a", b"a" * 10) is False
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
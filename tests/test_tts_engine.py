@@ -0,0 +1,68 @@
+import asyncio
+import time
+from types import SimpleNamespace as NS
+
+from src.agents.audio_agent.tts_engine import GeminiTTSEngine
+from src.data.static.rate_limiter import HostRateLimiter, TokenBucket
+
+
+class _SlowClient:
+    """Stands in for genai.Client: every TTS call takes `delay` seconds in the worker thread"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.models = self
+
+    def generate_content(self, model, contents, config):
+        time.sleep(self.delay)
+        return NS(candidates=[NS(content=NS(parts=[NS(inline_data=NS(data=b"\0\0" * 10))]))])
+
+
+def _engine(client, **kwargs):
+    engine = GeminiTTSEngine("test-key", max_workers=1, **kwargs)
+    engine._client = client
+    return engine
+
+
+def test_reserve_does_not_block():
+    bucket = TokenBucket(rate=2.0, capacity=1.0)
+    started = time.monotonic()
+    waits = [bucket.reserve() for _ in range(3)]
+    assert time.monotonic() - started < 0.05
+    assert waits[0] == 0.0
+    assert 0.4 < waits[1] < 0.6 and 0.9 < waits[2] < 1.1
+
+
+def test_io_does_not_queue_behind_synthesis():
+    engine = _engine(_SlowClient(delay=0.5))
+
+    async def run():
+        synth = [asyncio.create_task(engine.synthesize("line", "Puck")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        assert await engine.run_blocking(lambda: "cached") == "cached"
+        io_seconds = time.monotonic() - started
+        await asyncio.gather(*synth)
+        return io_seconds
+
+    try:
+        assert asyncio.run(run()) < 0.2
+    finally:
+        engine.close()
+
+
+def test_rate_limit_is_waited_out_on_the_event_loop():
+    client = _SlowClient(delay=0.0)
+    engine = _engine(client, rate_limiter=HostRateLimiter(host_rates={"gemini": 10.0}, default_capacity=1.0))
+
+    async def run():
+        await asyncio.gather(*(engine.synthesize("line", "Puck") for _ in range(3)))
+
+    try:
+        asyncio.run(run())
+        metrics = engine.get_metrics()
+        assert metrics["completed"] == 3
+        assert metrics["total_rate_limit_wait_seconds"] > 0.2  # 0.1s + 0.2s of reservations
+        assert metrics["total_queue_wait_seconds"] < 0.1  # The worker thread never slept for tokens
+    finally:
+        engine.close()